@@ -0,0 +1,191 @@
+"""
+Client-side hot path benchmark against the in-process stub backend.
+
+For every API method and concurrency level, measures throughput,
+latency percentiles, client CPU time per call and peak traced memory.
+
+    python benchmarks/bench_api.py
+    python benchmarks/bench_api.py --concurrency 1,8,32 --calls 500 --latency-ms 5
+    python benchmarks/bench_api.py --methods physics.* --json results.json
+    python benchmarks/bench_api.py --baseline results.json --tolerance 0.25
+
+With `--baseline`, exits with status 1 if p50 latency or CPU per call of
+any case regressed by more than `--tolerance` relative to the baseline.
+"""
+import argparse
+import fnmatch
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub import StubServer  # noqa: E402
+
+from praxis import Client  # noqa: E402
+
+GRID = [[0] * 20 for _ in range(20)]
+PATH = [[float(i), float(i % 3)] for i in range(20)]
+BOX_A = {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1}
+BOX_B = {"x": 0.5, "y": 0.5, "z": 0.5, "w": 1, "h": 1, "d": 1}
+POSE = {"x": 0.0, "y": 0.0, "theta": 0.0}
+IMAGE = bytes(range(256)) * 256  # 64 KiB
+
+CASES = {
+    "physics.force": lambda c: c.physics.force(mass=2, acceleration=3),
+    "physics.mass": lambda c: c.physics.mass(volume=2, density=1000),
+    "physics.stability": lambda c: c.physics.stability(base_width=0.4, center_of_mass_height=0.5),
+    "physics.collision": lambda c: c.physics.collision(box_a=BOX_A, box_b=BOX_B),
+    "physics.leverage": lambda c: c.physics.leverage(1.5, 45, 10.0, 150),
+    "navigation.plan": lambda c: c.navigation.plan(GRID, (0, 0), (19, 19)),
+    "navigation.smooth_path": lambda c: c.navigation.smooth_path(PATH),
+    "vision.analyze": lambda c: c.vision.analyze(image=IMAGE),
+    "vision.segment": lambda c: c.vision.segment(image=IMAGE),
+    "manipulation.pick": lambda c: c.manipulation.pick(
+        object_position=[0.5, 0.0, 0.1],
+        gripper_position=[0.5, 0.0, 0.4],
+        object_size=[0.05, 0.05, 0.1],
+        gripper_opening=0.08,
+    ),
+    "manipulation.grasp_feasibility": lambda c: c.manipulation.grasp_feasibility(0.05, 0.08),
+    "multi_agent.check_conflicts": lambda c: c.multi_agent.check_conflicts(
+        [{"x": 0, "y": 0, "t": 0}, {"x": 1, "y": 0, "t": 1}],
+        [{"x": 1, "y": 1, "t": 0}, {"x": 1, "y": 2, "t": 1}],
+    ),
+    "multi_agent.formation_pose": lambda c: c.multi_agent.formation_pose(POSE, 1),
+    "analytics.get_stats": lambda c: c.analytics.get_stats(),
+    "analytics.get_logs": lambda c: c.analytics.get_logs(),
+}
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+def run_case(client, fn, calls: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    cpu = [0.0]
+    lock = threading.Lock()
+    per_worker = [calls // concurrency + (i < calls % concurrency) for i in range(concurrency)]
+
+    def worker(n: int) -> None:
+        local_latencies = []
+        cpu_start = time.thread_time()
+        for _ in range(n):
+            start = time.perf_counter()
+            fn(client)
+            local_latencies.append(time.perf_counter() - start)
+        cpu_used = time.thread_time() - cpu_start
+        with lock:
+            latencies.extend(local_latencies)
+            cpu[0] += cpu_used
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, per_worker))
+    wall = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "throughput": calls / wall,
+        "p50_ms": _percentile(ordered, 0.50) * 1e3,
+        "p95_ms": _percentile(ordered, 0.95) * 1e3,
+        "p99_ms": _percentile(ordered, 0.99) * 1e3,
+        "mean_ms": statistics.fmean(ordered) * 1e3,
+        "cpu_us_per_call": cpu[0] / calls * 1e6,
+    }
+
+
+def measure_memory(client, fn, calls: int) -> int:
+    """
+    Peak traced allocation over `calls` sequential calls, in bytes.
+    Includes the stub's own allocations, which are the same for every
+    SDK version being compared.
+    """
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            fn(client)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--methods", default="*", help="comma-separated glob patterns")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated levels")
+    parser.add_argument("--calls", type=int, default=200, help="calls per case")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stub latency")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="stub response padding")
+    parser.add_argument("--memory-calls", type=int, default=20)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    patterns = args.methods.split(",")
+    methods = [m for m in CASES if any(fnmatch.fnmatch(m, p) for p in patterns)]
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    results = {}
+    with StubServer(latency=args.latency_ms / 1e3, payload_bytes=args.payload_bytes) as stub:
+        print(
+            f"{'method':<32} {'conc':>4} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'p99 ms':>8} {'cpu us':>8} {'peak KiB':>9}"
+        )
+        for method in methods:
+            fn = CASES[method]
+            for level in levels:
+                with Client(api_key="bench", base_url=stub.url, pool_maxsize=max(10, level)) as client:
+                    for _ in range(5):
+                        fn(client)  # warm up connections and lazy imports
+                    result = run_case(client, fn, args.calls, level)
+                    result["peak_bytes"] = measure_memory(client, fn, args.memory_calls)
+
+                results[f"{method}@{level}"] = result
+                print(
+                    f"{method:<32} {level:>4} {result['throughput']:>9.0f} "
+                    f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+                    f"{result['cpu_us_per_call']:>8.0f} {result['peak_bytes'] / 1024:>9.0f}"
+                )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        return compare(results, args.baseline, args.tolerance)
+    return 0
+
+
+def compare(results: dict, baseline_path: str, tolerance: float) -> int:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for case, result in results.items():
+        before = baseline.get(case)
+        if before is None:
+            continue
+        for metric in ("p50_ms", "cpu_us_per_call"):
+            if result[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{case} {metric}: {before[metric]:.2f} -> {result[metric]:.2f}"
+                )
+
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Import and client construction time of the SDK.
+
+Each scenario runs in a fresh interpreter so nothing is cached in
+`sys.modules`. Prints the median wall time over `--runs` runs.
+
+    python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import praxis": "import praxis",
+    "Client()": "from praxis import Client; Client(api_key='k')",
+    "Client().physics": "from praxis import Client; Client(api_key='k').physics",
+}
+
+_TIMED = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _TIMED.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        samples.append(float(out.stdout))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        print(f"{name:<20} {measure(code, args.runs) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+In-process PRAXIS stub backend for benchmarks.
+
+Speaks the response envelope for the physics, navigation, vision,
+manipulation, multi_agent and analytics endpoints, with a configurable
+per-request latency and response padding.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _plan(body):
+    rows = len(body["grid"])
+    cols = len(body["grid"][0])
+    path = [[r, 0] for r in range(rows)] + [[rows - 1, c] for c in range(1, cols)]
+    return {"result": {"reachable": True, "steps": len(path) - 1, "path": path}}
+
+
+def _objects(count):
+    return [
+        {
+            "id": i,
+            "label": "box",
+            "confidence": 0.9,
+            "bbox": {"x": 0.1 * i, "y": 0.1, "width": 0.2, "height": 0.3},
+        }
+        for i in range(count)
+    ]
+
+
+RESPONSES = {
+    "/api/v1/physics/force": lambda b: {"force": b["mass"] * b["acceleration"]},
+    "/api/v1/physics/mass": lambda b: {"mass": b["volume"] * b["density"]},
+    "/api/v1/physics/stability": lambda b: {"stability": "stable", "warnings": []},
+    "/api/v1/physics/collision": lambda b: {
+        "colliding": True,
+        "penetration": {"x": 0.5, "y": 0.5, "z": 0.5},
+        "min_translation_vector": {"axis": "x", "depth": 0.5},
+        "warnings": [],
+    },
+    "/api/v1/physics/leverage": lambda b: {
+        "torque_exerted": 10.6,
+        "exceeds_limit": False,
+        "mechanical_advantage": 1.5,
+    },
+    "/api/v1/simulate/navigation": _plan,
+    "/api/v1/simulate/navigation/smooth": lambda b: [[p[0], p[1]] for p in b["path"]],
+    "/api/v1/vision/analyze": lambda b: {"model": "yolov8", "count": 5, "objects": _objects(5)},
+    "/api/v1/vision/segment": lambda b: {"model": "yolov8n-seg", "count": 5, "objects": _objects(5)},
+    "/api/v1/skills/pick": lambda b: {"feasible": True, "grasp_quality": 0.82, "warnings": []},
+    "/api/v1/robotics/grasp/feasibility": lambda b: {"feasible": True, "score": 0.9},
+    "/api/v1/multi-agent/conflict-check": lambda b: {"conflict": False, "min_distance": 1.2},
+    "/api/v1/multi-agent/formation": lambda b: {"pose": {"x": -1.0, "y": 1.0, "theta": 0.0}},
+    "/api/v1/analytics/stats": lambda b: {"total_requests": 1200, "total_cost": 1.2},
+    "/api/v1/analytics/logs": lambda b: {"logs": [{"endpoint": "/api/v1/physics/force"}] * 50},
+}
+
+
+class StubServer:
+    """
+    Threaded local HTTP server answering every known endpoint.
+
+    `latency` seconds are slept before answering; `payload_bytes` pads
+    every response with a string of that length.
+    """
+
+    def __init__(self, latency: float = 0.0, payload_bytes: int = 0):
+        self.latency = latency
+        self.payload_bytes = payload_bytes
+        self._counter = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without this,
+            # Nagle plus delayed ACKs adds ~40 ms to every response.
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub._dispatch(self, None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                stub._dispatch(self, self.rfile.read(length))
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 128
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
+
+    def _dispatch(self, handler, raw):
+        path = handler.path.split("?")[0]
+        body = {}
+        if raw and handler.headers.get("Content-Type", "").startswith("application/json"):
+            body = json.loads(raw)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        fn = RESPONSES.get(path)
+        if fn is None:
+            status, payload = 404, {"error": "not_found", "message": path}
+        else:
+            data = fn(body)
+            if self.payload_bytes and isinstance(data, dict):
+                data["padding"] = "x" * self.payload_bytes
+            status, payload = 200, self._envelope(data)
+
+        out = json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(out)))
+        handler.end_headers()
+        handler.wfile.write(out)
+
+    def _envelope(self, data):
+        with self._lock:
+            self._counter += 1
+            request_id = f"stub-{self._counter}"
+
+        return {
+            "success": True,
+            "data": data,
+            "error": None,
+            "message": None,
+            "cost": 0.001,
+            "request_id": request_id,
+        }
@@ -32,43 +32,33 @@ def run_deterministic_agent():
 
     waypoints = [(0, 0), (4, 5), (7, 7)]
     position = waypoints[0]
-    total_cost = 0.0
 
     print("Starting Reference Agent Loop (v1-alpha)...")
 
-    for i in range(1, len(waypoints)):
-        goal = waypoints[i]
-        print(f"\nNavigating: {position} -> {goal}")
-        
-        while position != goal:
-            # Deterministic API Call
-            res = client.navigation.plan(grid=grid, start=position, goal=goal)
-            
-            # Explicit Error Handling
-            if not res.success:
-                print(f"CRITICAL FAILURE: Reasoning engine returned error. Request ID: {res.request_id}")
-                return
+    # One call plans the whole route: the step counts between all
+    # waypoints are computed once per grid and the legs are joined.
+    res = client.navigation.plan_route(grid, waypoints)
+    route = res.data["result"]
+
+    # "Cannot Decide" / No Path Logic
+    if not route["reachable"]:
+        print(f"STOP: No route through {waypoints}. Agent halted.")
+        return
 
-            result = res.data.get("result", res.data)
-            path = result.get("path", [])
-            total_cost += res.cost
-            
-            # "Cannot Decide" / No Path Logic
-            if not path:
-                print(f"STOP: No path found to {goal}. Agent halted.")
-                return
+    path = [tuple(cell) for cell in route["path"]]
+    offset = 0
+    for goal, steps in zip(waypoints[1:], route["legs"], strict=True):
+        print(f"\nNavigating: {position} -> {goal}")
 
-            if len(path) < 2:
-                # We are at the goal
-                break
-            
+        for next_step in path[offset + 1:offset + steps + 1]:
             # Move one step deterministically
-            next_step = tuple(path[1])
-            print(f"  Move: {position} -> {next_step} [Req: {res.request_id}]")
+            print(f"  Move: {position} -> {next_step}")
             position = next_step
 
-        print(f"Goal Reached: {goal}")
+        offset += steps
+        print(f"Goal Reached: {goal} ({steps} steps)")
 
+    total_cost = res.cost
     print(f"\nReasoning Complete.")
     print(f"Total Compute Cost: ${total_cost:.4f}")
     print("Agent shut down safely.")
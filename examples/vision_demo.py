@@ -1,6 +1,7 @@
 
-import base64
 import os
+from pathlib import Path
+
 from praxis import Client
 
 # Configuration
@@ -17,8 +18,8 @@ def main():
         print(f"Warning: {image_path} not found. Using placeholder.")
         image_data = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
     else:
-        with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
+        # Raw files are streamed as-is; no base64 encoding needed.
+        image_data = Path(image_path)
 
     print("\n--- Phase 3: Object Detection (Analyze) ---")
     response = client.vision.analyze(image=image_data)
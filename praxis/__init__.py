@@ -1,19 +1,67 @@
-from praxis.client import Client
-from praxis.session import Session
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from praxis.version import __version__
-from praxis.api.physics import PhysicsAPI
-from praxis.api.navigation import NavigationAPI
-from praxis.api.simulation import SimulationAPI
-from praxis.api.vision import VisionAPI
-from praxis.api.manipulation import ManipulationAPI
-from praxis.api.sorting import SortingAPI
-from praxis.api.analytics import AnalyticsAPI
-from praxis.api.assembly import AssemblyAPI
-from praxis.models.spatial import SegmentedObject, SegmentationResult
-from praxis.core import spatial_utils
+
+# Public names are resolved on first access (PEP 562), so `import praxis`
+# stays cheap and only the parts of the SDK actually used get imported.
+_LAZY = {
+    "Client": "praxis.client",
+    "AsyncClient": "praxis.async_client",
+    "Session": "praxis.session",
+    "PhysicsAPI": "praxis.api.physics",
+    "NavigationAPI": "praxis.api.navigation",
+    "SimulationAPI": "praxis.api.simulation",
+    "VisionAPI": "praxis.api.vision",
+    "ManipulationAPI": "praxis.api.manipulation",
+    "SortingAPI": "praxis.api.sorting",
+    "AnalyticsAPI": "praxis.api.analytics",
+    "AssemblyAPI": "praxis.api.assembly",
+    "SegmentedObject": "praxis.models.spatial",
+    "SegmentationResult": "praxis.models.spatial",
+    "OccupancyGrid": "praxis.models.grid",
+}
+
+_LAZY_MODULES = {
+    "spatial_utils": "praxis.core.spatial_utils",
+}
+
+if TYPE_CHECKING:
+    from praxis.client import Client
+    from praxis.async_client import AsyncClient
+    from praxis.session import Session
+    from praxis.api.physics import PhysicsAPI
+    from praxis.api.navigation import NavigationAPI
+    from praxis.api.simulation import SimulationAPI
+    from praxis.api.vision import VisionAPI
+    from praxis.api.manipulation import ManipulationAPI
+    from praxis.api.sorting import SortingAPI
+    from praxis.api.analytics import AnalyticsAPI
+    from praxis.api.assembly import AssemblyAPI
+    from praxis.models.spatial import SegmentedObject, SegmentationResult
+    from praxis.models.grid import OccupancyGrid
+    from praxis.core import spatial_utils
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    else:
+        raise AttributeError(f"module 'praxis' has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Client",
+    "AsyncClient",
     "Session",
     "PhysicsAPI",
     "NavigationAPI",
@@ -25,7 +73,7 @@ __all__ = [
     "AssemblyAPI",
     "SegmentedObject",
     "SegmentationResult",
+    "OccupancyGrid",
     "spatial_utils",
     "__version__"
 ]
-
@@ -1,5 +1,25 @@
-from praxis.api.physics import PhysicsAPI
-from praxis.api.navigation import NavigationAPI
-from praxis.api.simulation import SimulationAPI
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY = {
+    "PhysicsAPI": "praxis.api.physics",
+    "NavigationAPI": "praxis.api.navigation",
+    "SimulationAPI": "praxis.api.simulation",
+}
+
+if TYPE_CHECKING:
+    from praxis.api.physics import PhysicsAPI
+    from praxis.api.navigation import NavigationAPI
+    from praxis.api.simulation import SimulationAPI
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module 'praxis.api' has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["PhysicsAPI", "NavigationAPI", "SimulationAPI"]
@@ -1,4 +1,5 @@
 from praxis.core.http import HttpClient
+from praxis.core.upload import ImageSource
 from praxis.models.response import Response 
 
 class ManipulationAPI:
@@ -9,8 +10,13 @@ class ManipulationAPI:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def detect(self, image: str, model: str = "auto") -> Response[dict]:
-        """Analyze objects in a base64 encoded image using vision core."""
+    def detect(self, image: str | ImageSource, model: str = "auto") -> Response[dict]:
+        """Analyze objects in a base64 encoded image (or raw image bytes) using vision core."""
+        if not isinstance(image, str):
+            return self._http.upload(
+                "/api/v1/vision/analyze", fields={"model": model}, image=image
+            )
+
         payload = {"image": image, "model": model}
         return self._http.post("/api/v1/vision/analyze", json=payload)
 
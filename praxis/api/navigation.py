@@ -1,18 +1,34 @@
+from typing import TYPE_CHECKING, Any
+
+from praxis.core.config import resolve_execution
 from praxis.core.http import HttpClient
+from praxis.models.grid import as_grid
 from praxis.models.response import Response
 
+if TYPE_CHECKING:
+    from praxis.compute.hpa import HierarchicalPlanner
+    from praxis.compute.replan import IncrementalPlanner
+    from praxis.compute.route import RoutePlanner
+    from praxis.models.grid import OccupancyGrid
+
 
 class NavigationAPI:
     """
     Navigation / pathfinding operations using A* algorithm.
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, execution: str | None = None):
         self._http = http
+        self._execution = resolve_execution(http, execution)
+        self._routes: "RoutePlanner | None" = None
+
+    @property
+    def execution(self) -> str:
+        return self._execution
 
     def plan(
         self,
-        grid: list[list[int]],
+        grid: "list[list[int]] | OccupancyGrid",
         start: tuple[int, int] | list[int],
         goal: tuple[int, int] | list[int],
     ) -> Response[dict]:
@@ -23,44 +39,91 @@ class NavigationAPI:
         Guarantee: Deterministic
 
         Args:
-            grid: 2D grid where 0 = passable, 1 = obstacle
+            grid: 2D grid where 0 = passable, 1 = obstacle, as nested
+                lists, a 2-D NumPy array or an `OccupancyGrid`
             start: Starting position (row, col)
             goal: Goal position (row, col)
             
         Returns:
             Response with path, steps, reachable status
         """
-        payload = {
-            "grid": grid,
-            "start": list(start),
-            "goal": list(goal),
-        }
+        response: Response[dict[str, Any]] = plan_grid(self._http, grid, start, goal)
+        return response
 
-        return self._http.post(
-            "/api/v1/simulate/navigation",
-            json=payload,
-        )
+    def plan_route(
+        self,
+        grid: "list[list[int]] | OccupancyGrid",
+        waypoints: list[tuple[int, int]] | list[list[int]],
+        order: str = "given",
+    ) -> Response[dict[str, Any]]:
+        """
+        Plan one route from the first waypoint through all the others.
+
+        Computed locally: one search per waypoint gives the step counts
+        between all waypoints (cached per grid), then only the legs of
+        the visiting order are traced.
+
+        Status: Stable (v1-alpha)
+        Guarantee: Deterministic
+
+        Args:
+            grid: 2D grid where 0 = passable, 1 = obstacle, as nested
+                lists, a 2-D NumPy array or an `OccupancyGrid`
+            waypoints: Positions (row, col) to visit, starting point first
+            order: "given" visits them in order; "optimize" keeps the
+                first waypoint first and picks the order with the fewest
+                total steps (exact up to 11 waypoints, heuristic beyond)
+
+        Returns:
+            Response with the concatenated path, total steps, reachable
+            status, visiting `order` (indices into `waypoints`) and the
+            steps of each leg
+        """
+        from praxis.compute import local_response
+        from praxis.compute.route import RoutePlanner
+
+        if self._routes is None:
+            self._routes = RoutePlanner()
+        return local_response({"result": self._routes.plan(grid, waypoints, order=order)})
 
     def smooth_path(
         self,
         path: list[tuple[float, float]] | list[list[float]],
         density: int = 5,
+        tolerance: float | None = None,
     ) -> Response[list[tuple[float, float]]]:
         """
         Smooth a discrete path using Catmull-Rom spline interpolation.
 
+        With `execution="local"` or `"auto"`, or with a `tolerance`, the
+        spline is computed in-process (see `praxis.compute.spline`);
+        results agree with the server's to within 1e-9.
+
         Args:
-            path: List of (x, y) waypoints.
+            path: List of (x, y) waypoints, or an (N, 2) NumPy array.
             density: Number of points to interpolate between each pair of waypoints.
+            tolerance: Adaptive density (local only): flat segments get
+                fewer points, keeping the output within `tolerance` of
+                the curve. At most `density` points per segment.
 
         Returns:
-            Response containing the list of smoothed waypoints.
+            Response containing the list of smoothed waypoints (an array
+            for array input computed locally).
 
         Status: Stable (v1-alpha)
         Guarantee: Deterministic
         """
+        if self._execution != "remote" or tolerance is not None:
+            from praxis.compute import local_response, spline
+
+            try:
+                return local_response(spline.catmull_rom(path, density, tolerance))
+            except ValueError:
+                if self._execution != "auto" or tolerance is not None:
+                    raise
+
         payload = {
-            "path": [list(p) for p in path],
+            "path": path.tolist() if hasattr(path, "tolist") else [list(p) for p in path],
             "density": density,
         }
 
@@ -68,3 +131,125 @@ class NavigationAPI:
             "/api/v1/simulate/navigation/smooth",
             json=payload,
         )
+
+    def smooth_paths(
+        self,
+        paths: list[list[tuple[float, float]]],
+        density: int = 5,
+        tolerance: float | None = None,
+    ) -> Response[list[Any]]:
+        """
+        Smooth many paths at once. See `smooth_path`.
+
+        Args:
+            paths: Paths as lists of (x, y) waypoints or (N, 2) arrays,
+                or a (B, N, 2) NumPy array.
+            density: Number of points to interpolate between each pair of waypoints.
+            tolerance: Adaptive density, as in `smooth_path`.
+
+        Returns:
+            Response with one smoothed path per input path (a (B, M, 2)
+            array for a (B, N, 2) array without `tolerance`).
+
+        Computed in-process (vectorized when NumPy is installed) in
+        every execution mode.
+        """
+        from praxis.compute import local_response, spline
+
+        return local_response(spline.catmull_rom_batch(paths, density, tolerance))
+
+    def planner(
+        self,
+        grid: list[list[int]],
+        goal: tuple[int, int] | list[int],
+        remote: bool | None = None,
+        max_expansions: int | None = 100_000,
+    ) -> "IncrementalPlanner":
+        """
+        Create a stateful planner to `goal` for agent loops.
+
+        The planner reuses its current path while the grid is unchanged
+        and repairs it locally (D* Lite) after `update()`/`set_grid()`,
+        instead of a full `plan` request on every step.
+
+        Args:
+            grid: 2D grid where 0 = passable, 1 = obstacle
+            goal: Goal position (row, col)
+            remote: Use `plan` for the first path and as a fallback.
+                Defaults to False for `execution="local"` clients.
+            max_expansions: Local repairs larger than this fall back to
+                a remote plan (ignored when `remote` is False).
+
+        Returns:
+            An `IncrementalPlanner`.
+        """
+        from praxis.compute.replan import IncrementalPlanner
+
+        if remote is None:
+            remote = self._execution != "local"
+        return IncrementalPlanner(
+            self, grid, goal, remote=remote, max_expansions=max_expansions
+        )
+
+    def hierarchical_planner(
+        self,
+        grid: "list[list[int]] | OccupancyGrid",
+        cluster_size: int = 32,
+        remote_refine: bool = False,
+    ) -> "HierarchicalPlanner":
+        """
+        Create a local HPA* planner for very large grids.
+
+        The grid is abstracted into `cluster_size` x `cluster_size`
+        clusters on demand; a plan searches the graph of cluster
+        entrances first and only refines the legs of the resulting
+        corridor. Paths are near-optimal, not always shortest.
+
+        Args:
+            grid: 2D grid where 0 = passable, 1 = obstacle, as nested
+                lists, a 2-D NumPy array or an `OccupancyGrid`
+            cluster_size: Side of the square clusters, in cells
+            remote_refine: Refine each intra-cluster leg with `plan` on
+                that cluster's sub-grid instead of locally
+
+        Returns:
+            A `HierarchicalPlanner`.
+        """
+        from praxis.compute.hpa import HierarchicalPlanner
+
+        return HierarchicalPlanner(
+            grid, cluster_size=cluster_size, navigation=self, remote_refine=remote_refine
+        )
+
+
+def plan_grid(http: Any, grid: Any, start: Any, goal: Any) -> Any:
+    """
+    Navigation plan request, answered from the client's `PathCache`
+    when a cached path covers it.
+    """
+    path = "/api/v1/simulate/navigation"
+    fields = {"start": list(start), "goal": list(goal)}
+
+    cache = getattr(http, "path_cache", None)
+    if cache is None:
+        return post_grid(http, path, grid, fields)
+
+    grid = as_grid(grid)
+    cached = cache.get(grid, start, goal)
+    if cached is not None:
+        return cached
+    return cache.put(grid, start, goal, post_grid(http, path, grid, fields))
+
+
+def post_grid(http: Any, path: str, grid: Any, fields: dict[str, Any]) -> Any:
+    """
+    POST a grid request, through the client's `GridTransport` if any.
+    Without one, grids other than nested lists are expanded to lists.
+    """
+    transport = getattr(http, "grid_transport", None)
+    if transport is not None:
+        return transport.post(http, path, grid, fields)
+
+    if not isinstance(grid, list):
+        grid = as_grid(grid).to_rows()
+    return http.post(path, json={"grid": grid, **fields})
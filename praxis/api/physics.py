@@ -1,3 +1,6 @@
+from typing import Any
+
+from praxis.core.config import resolve_execution
 from praxis.core.http import HttpClient
 from praxis.models.response import Response
 
@@ -6,10 +9,37 @@ class PhysicsAPI:
     """
     Physics-related operations.
     All methods are deterministic: same input always produces same output.
+
+    With `execution="local"`, `force`, `collision` and `resistance` are
+    computed in-process instead of over the network; `"auto"` does the
+    same but sends invalid input to the server for an authoritative
+    error. The other endpoints always run remotely. Defaults to the
+    client's `execution` setting.
     """
 
-    def __init__(self, http: HttpClient):
+    def __init__(self, http: HttpClient, execution: str | None = None) -> None:
         self._http = http
+        self._execution = resolve_execution(http, execution)
+
+    @property
+    def execution(self) -> str:
+        return self._execution
+
+    def _run(self, path: str, payload: dict[str, Any]) -> Response[dict[str, Any]]:
+        if self._execution != "remote":
+            from praxis.compute import local_response, physics
+
+            fn = physics.ENDPOINTS.get(path)
+            if fn is not None:
+                try:
+                    data = fn(**payload)
+                except (TypeError, ValueError) as exc:
+                    if self._execution == "local":
+                        raise ValueError(f"{path}: {exc}") from exc
+                else:
+                    return local_response(data)
+
+        return self._http.post(path, json=payload)
 
     def force(self, mass: float, acceleration: float) -> Response[dict]:
         """
@@ -23,20 +53,17 @@ class PhysicsAPI:
             "acceleration": acceleration,
         }
 
-        return self._http.post(
-            "/api/v1/physics/force",
-            json=payload,
-        )
+        return self._run("/api/v1/physics/force", payload)
 
     def mass(self, volume: float, density: float) -> Response[dict]:
         """Compute mass using m = p * V."""
         payload = {"volume": volume, "density": density}
-        return self._http.post("/api/v1/physics/mass", json=payload)
+        return self._run("/api/v1/physics/mass", payload)
 
     def stability(self, base_width: float, center_of_mass_height: float) -> Response[dict]:
         """Compute simple stability score."""
         payload = {"base_width": base_width, "center_of_mass_height": center_of_mass_height}
-        return self._http.post("/api/v1/physics/stability", json=payload)
+        return self._run("/api/v1/physics/stability", payload)
 
     def collision(
         self,
@@ -66,10 +93,7 @@ class PhysicsAPI:
             "box_b": box_b,
         }
 
-        return self._http.post(
-            "/api/v1/physics/collision",
-            json=payload,
-        )
+        return self._run("/api/v1/physics/collision", payload)
 
     def resistance(
         self,
@@ -101,10 +125,7 @@ class PhysicsAPI:
             "fluid_density": fluid_density,
         }
 
-        return self._http.post(
-            "/api/v1/physics/resistance",
-            json=payload,
-        )
+        return self._run("/api/v1/physics/resistance", payload)
 
     def leverage(
         self,
@@ -135,20 +156,60 @@ class PhysicsAPI:
             "pivot_torque_limit": pivot_torque_limit,
         }
 
-        return self._http.post(
-            "/api/v1/physics/leverage",
-            json=payload,
-        )
+        return self._run("/api/v1/physics/leverage", payload)
 
     def collision_sphere(self, sphere_a: dict, sphere_b: dict) -> Response[dict]:
         """Check collision between two spheres."""
         payload = {"sphere_a": sphere_a, "sphere_b": sphere_b}
-        return self._http.post("/api/v1/physics/collision/sphere", json=payload)
+        return self._run("/api/v1/physics/collision/sphere", payload)
 
     def collision_obb(self, box_a: dict, box_b: dict) -> Response[dict]:
         """Check collision between two oriented bounding boxes (OBB)."""
         payload = {"box_a": box_a, "box_b": box_b}
-        return self._http.post("/api/v1/physics/collision/obb", json=payload)
+        return self._run("/api/v1/physics/collision/obb", payload)
+
+    def collision_batch(self, boxes_a: Any, boxes_b: Any = None) -> Response[dict[str, Any]]:
+        """
+        Check many axis-aligned boxes at once.
+
+        Args:
+            boxes_a: Boxes as dicts (same format as `collision`), rows of
+                [x, y, z, w, h, d], or an (N, 6) NumPy array.
+            boxes_b: Optional second set. Without it, every pair within
+                `boxes_a` is checked; with it, every pair across both.
+
+        Returns:
+            Response with `collisions` (one entry per colliding pair:
+            indices `a` and `b`, `penetration`, `min_translation_vector`),
+            `count` and the number of pairs `checked`.
+
+        Computed in-process (vectorized when NumPy is installed) in
+        every execution mode.
+        """
+        from praxis.compute import collision, local_response
+
+        return local_response(collision.aabb_collisions(boxes_a, boxes_b))
+
+    def collision_sphere_batch(self, spheres_a: Any, spheres_b: Any = None) -> Response[dict[str, Any]]:
+        """
+        Check many spheres ({x, y, z, radius} or rows) at once. Entries
+        carry `distance`, `penetration_depth` and `contact_normal`.
+        See `collision_batch`.
+        """
+        from praxis.compute import collision, local_response
+
+        return local_response(collision.sphere_collisions(spheres_a, spheres_b))
+
+    def collision_obb_batch(self, boxes_a: Any, boxes_b: Any = None) -> Response[dict[str, Any]]:
+        """
+        Check many oriented boxes (dicts with optional `rotation`, or rows
+        of [x, y, z, w, h, d, rx, ry, rz]) at once. Entries carry the
+        `min_translation_vector` as a unit vector and depth.
+        See `collision_batch`.
+        """
+        from praxis.compute import collision, local_response
+
+        return local_response(collision.obb_collisions(boxes_a, boxes_b))
 
     def grip_requirement(self, load_mass: float, acceleration: float = 0.0, mu: float = 0.4, safety: float = 1.5) -> Response[dict]:
         """Calculate minimum grip force required to prevent slip."""
@@ -158,9 +219,9 @@ class PhysicsAPI:
             "friction_mu": mu,
             "safety_factor": safety
         }
-        return self._http.post("/api/v1/physics/grip-requirement", json=payload)
+        return self._run("/api/v1/physics/grip-requirement", payload)
 
     def stability_composite(self, shapes: list[dict]) -> Response[dict]:
         """Evaluate stability of a composite object assembly."""
         payload = {"shapes": shapes}
-        return self._http.post("/api/v1/physics/stability/composite", json=payload)
+        return self._run("/api/v1/physics/stability/composite", payload)
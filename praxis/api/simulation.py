@@ -1,6 +1,12 @@
+from typing import TYPE_CHECKING, Any
+
+from praxis.api.navigation import plan_grid
 from praxis.core.http import HttpClient
 from praxis.models.response import Response
 
+if TYPE_CHECKING:
+    from praxis.models.grid import OccupancyGrid
+
 
 class SimulationAPI:
     """
@@ -12,7 +18,7 @@ class SimulationAPI:
 
     def navigate(
         self,
-        grid: list[list[int]],
+        grid: "list[list[int]] | OccupancyGrid",
         start: tuple[int, int] | list[int],
         goal: tuple[int, int] | list[int],
     ) -> Response[dict]:
@@ -20,20 +26,13 @@ class SimulationAPI:
         Simulate navigation from start to goal.
         
         Args:
-            grid: 2D grid where 0 = passable, 1 = obstacle
+            grid: 2D grid where 0 = passable, 1 = obstacle, as nested
+                lists, a 2-D NumPy array or an `OccupancyGrid`
             start: Starting position (row, col)
             goal: Goal position (row, col)
             
         Returns:
             Response with reachability, steps, and path
         """
-        payload = {
-            "grid": grid,
-            "start": list(start),
-            "goal": list(goal),
-        }
-
-        return self._http.post(
-            "/api/v1/simulate/navigation",
-            json=payload,
-        )
+        response: Response[dict[str, Any]] = plan_grid(self._http, grid, start, goal)
+        return response
@@ -1,4 +1,5 @@
 from praxis.core.http import HttpClient
+from praxis.core.upload import ImageSource
 from praxis.models.response import Response
 
 
@@ -12,7 +13,7 @@ class VisionAPI:
 
     def analyze(
         self,
-        image: str,
+        image: str | ImageSource,
         model: str = "auto",
         min_confidence: float = 0.5,
         max_objects: int = 20,
@@ -21,7 +22,9 @@ class VisionAPI:
         Analyze an image for object detection.
         
         Args:
-            image: Base64-encoded image data
+            image: Base64-encoded image data, or raw image bytes
+                (bytes, memoryview, os.PathLike or binary file object)
+                uploaded as multipart/form-data without base64 encoding
             model: Detection model - "yolo", "simple", or "auto"
             min_confidence: Minimum confidence threshold (0.0-1.0)
             max_objects: Maximum number of objects to return
@@ -30,12 +33,15 @@ class VisionAPI:
             Response with detected objects, confidence scores, and bounding boxes
         """
         payload = {
-            "image": image,
             "model": model,
             "min_confidence": min_confidence,
             "max_objects": max_objects,
         }
 
+        if not isinstance(image, str):
+            return self._http.upload("/api/v1/vision/analyze", fields=payload, image=image)
+
+        payload["image"] = image
         return self._http.post(
             "/api/v1/vision/analyze",
             json=payload,
@@ -43,7 +49,7 @@ class VisionAPI:
 
     def segment(
         self,
-        image: str,
+        image: str | ImageSource,
         model_tier: str = "nano",
         min_confidence: float = 0.5,
     ) -> Response[dict]:
@@ -51,7 +57,8 @@ class VisionAPI:
         Perform image segmentation to identify precise object shapes and spatial roles.
 
         Args:
-            image: Base64-encoded image data
+            image: Base64-encoded image data, or raw image bytes
+                (bytes, memoryview, os.PathLike or binary file object)
             model_tier: YOLO model tier ("nano" or "small")
             min_confidence: Minimum confidence threshold (0.0-1.0)
 
@@ -59,11 +66,14 @@ class VisionAPI:
             Response with polygons, roles (e.g. navigable_surface), and spatial info.
         """
         payload = {
-            "image": image,
             "model_tier": model_tier,
             "min_confidence": min_confidence,
         }
 
+        if not isinstance(image, str):
+            return self._http.upload("/api/v1/vision/segment", fields=payload, image=image)
+
+        payload["image"] = image
         return self._http.post(
             "/api/v1/vision/segment",
             json=payload,
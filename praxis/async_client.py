@@ -0,0 +1,209 @@
+import functools
+import inspect
+import os
+from collections.abc import Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal
+
+from praxis.core.async_http import AsyncHttpClient
+from praxis.core.cache import ResultCache
+from praxis.core.coalesce import SingleFlight
+from praxis.core.compression import Compression
+from praxis.core.config import Config
+from praxis.core.hooks import Hooks
+from praxis.core.lazy import LazyAPI
+from praxis.core.ratelimit import RateLimiter
+from praxis.core.resilience import CircuitBreaker, HedgePolicy
+from praxis.core.retries import RetryPolicy
+
+if TYPE_CHECKING:
+    from praxis.core.disk_cache import DiskCache
+    from praxis.core.grids import GridTransport
+    from praxis.core.path_cache import PathCache
+
+
+class AsyncAPI:
+    """
+    Exposes every public method of a domain API as a coroutine function.
+
+    Domain APIs only build payloads and hand them to their transport,
+    so bound to an `AsyncHttpClient` they already return awaitables.
+    Methods computed locally (e.g. `assembly.plan_sequence`) return
+    plain values, which are passed through unchanged.
+    """
+
+    def __init__(self, api: Any):
+        self._api = api
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        # Cache the wrapper so later lookups skip __getattr__.
+        setattr(self, name, method)
+        return method
+
+    def __repr__(self) -> str:
+        return f"<AsyncAPI {type(self._api).__name__}>"
+
+
+class AsyncClient:
+    """
+    asyncio SDK entry point.
+
+    Mirrors `Client`: every domain API method is awaitable and all of
+    them share one non-blocking connection pool.
+    """
+
+    # Public domain APIs
+    physics = LazyAPI("praxis.api.physics:PhysicsAPI", wrap=AsyncAPI)
+    navigation = LazyAPI("praxis.api.navigation:NavigationAPI", wrap=AsyncAPI)
+    simulation = LazyAPI("praxis.api.simulation:SimulationAPI", wrap=AsyncAPI)
+    vision = LazyAPI("praxis.api.vision:VisionAPI", wrap=AsyncAPI)
+
+    # Skills
+    manipulation = LazyAPI("praxis.api.manipulation:ManipulationAPI", wrap=AsyncAPI)
+    sorting = LazyAPI("praxis.api.sorting:SortingAPI", wrap=AsyncAPI)
+    analytics = LazyAPI("praxis.api.analytics:AnalyticsAPI", wrap=AsyncAPI)
+    assembly = LazyAPI("praxis.api.assembly:AssemblyAPI", wrap=AsyncAPI)
+    multi_agent = LazyAPI("praxis.api.multi_agent:MultiAgentAPI", wrap=AsyncAPI)
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: float = 10.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: float | None = 60.0,
+        keep_alive: bool = True,
+        codec: str | object = "auto",
+        cache: ResultCache | bool | None = None,
+        disk_cache: "DiskCache | str | os.PathLike[str] | None" = None,
+        coalesce: SingleFlight | bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | bool = False,
+        hedging: HedgePolicy | bool = False,
+        compression: Compression | bool = False,
+        hooks: Hooks | Iterable[Any] | None = None,
+        rate_limit: RateLimiter | float | None = None,
+        execution: str = "remote",
+        grid_transport: "GridTransport | bool" = False,
+        path_cache: "PathCache | bool" = False,
+    ):
+        self.config = Config(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            idle_timeout=idle_timeout,
+            keep_alive=keep_alive,
+            codec=codec,
+            execution=execution,
+        )
+
+        if cache is True:
+            cache = ResultCache()
+        elif not isinstance(cache, ResultCache):
+            cache = None
+
+        if disk_cache is not None:
+            from praxis.core.disk_cache import DiskCache
+
+            if not isinstance(disk_cache, DiskCache):
+                disk_cache = DiskCache(disk_cache)
+
+        if coalesce is True:
+            coalesce = SingleFlight()
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if hedging is True:
+            hedging = HedgePolicy()
+        if compression is True:
+            compression = Compression()
+        if grid_transport is True:
+            from praxis.core.grids import GridTransport
+
+            grid_transport = GridTransport()
+        if path_cache is True:
+            from praxis.core.path_cache import PathCache
+
+            path_cache = PathCache()
+        if not isinstance(hooks, Hooks):
+            hooks = Hooks(hooks or ())
+        if isinstance(rate_limit, (int, float)):
+            rate_limit = RateLimiter(rate=rate_limit)
+
+        self._http = AsyncHttpClient(
+            self.config,
+            cache=cache,
+            disk_cache=disk_cache,
+            coalescer=coalesce or None,
+            retry_policy=retry,
+            breaker=circuit_breaker or None,
+            hedge=hedging or None,
+            compression=compression or None,
+            hooks=hooks,
+            rate_limiter=rate_limit,
+            grid_transport=grid_transport or None,
+            path_cache=path_cache or None,
+        )
+
+    @property
+    def cache(self) -> ResultCache | None:
+        return self._http.cache
+
+    @property
+    def disk_cache(self) -> "DiskCache | None":
+        return self._http.disk_cache
+
+    @property
+    def coalescer(self) -> SingleFlight | None:
+        return self._http.coalescer
+
+    @property
+    def compression(self) -> Compression | None:
+        return self._http.compression
+
+    @property
+    def grid_transport(self) -> "GridTransport | None":
+        return self._http.grid_transport
+
+    @property
+    def path_cache(self) -> "PathCache | None":
+        return self._http.path_cache
+
+    @property
+    def hooks(self) -> Hooks:
+        return self._http.hooks
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._http.rate_limiter
+
+    async def aclose(self) -> None:
+        """
+        Release pooled connections.
+        """
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        await self.aclose()
+        return False  # propagate exceptions
@@ -1,55 +1,222 @@
+import os
+from collections.abc import Iterable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal
+
+from praxis.core.cache import ResultCache
+from praxis.core.coalesce import SingleFlight
+from praxis.core.compression import Compression
 from praxis.core.config import Config
+from praxis.core.hooks import Hooks
+from praxis.core.ratelimit import RateLimiter
+from praxis.core.resilience import CircuitBreaker, HedgePolicy
+from praxis.core.retries import RetryPolicy
 from praxis.core.http import HttpClient
-
-from praxis.api.physics import PhysicsAPI
-from praxis.api.navigation import NavigationAPI
-from praxis.api.simulation import SimulationAPI
-from praxis.api.vision import VisionAPI
+from praxis.core.lazy import LazyAPI
 from praxis.session import Session
-from praxis.api.manipulation import ManipulationAPI
-from praxis.api.sorting import SortingAPI
-from praxis.api.analytics import AnalyticsAPI
-from praxis.api.assembly import AssemblyAPI
-from praxis.api.multi_agent import MultiAgentAPI
+
+if TYPE_CHECKING:
+    from praxis.core.disk_cache import DiskCache
+    from praxis.core.grids import GridTransport
+    from praxis.core.path_cache import PathCache
 
 
 class Client:
     """
     Main SDK entry point.
+
+    Domain APIs are built (and their modules imported) on first access.
     """
 
+    # Public domain APIs
+    physics = LazyAPI("praxis.api.physics:PhysicsAPI")
+    navigation = LazyAPI("praxis.api.navigation:NavigationAPI")
+    simulation = LazyAPI("praxis.api.simulation:SimulationAPI")
+    vision = LazyAPI("praxis.api.vision:VisionAPI")
+
+    # Phase 2: Skills
+    manipulation = LazyAPI("praxis.api.manipulation:ManipulationAPI")
+    sorting = LazyAPI("praxis.api.sorting:SortingAPI")
+    analytics = LazyAPI("praxis.api.analytics:AnalyticsAPI")
+    assembly = LazyAPI("praxis.api.assembly:AssemblyAPI")
+    multi_agent = LazyAPI("praxis.api.multi_agent:MultiAgentAPI")
+
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
         timeout: float = 10.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: float | None = 60.0,
+        keep_alive: bool = True,
+        codec: str | object = "auto",
+        cache: ResultCache | bool | None = None,
+        disk_cache: "DiskCache | str | os.PathLike[str] | None" = None,
+        coalesce: SingleFlight | bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | bool = False,
+        hedging: HedgePolicy | bool = False,
+        compression: Compression | bool = False,
+        hooks: Hooks | Iterable[Any] | None = None,
+        rate_limit: RateLimiter | float | None = None,
+        execution: str = "remote",
+        grid_transport: "GridTransport | bool" = False,
+        path_cache: "PathCache | bool" = False,
     ):
         self.config = Config(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            idle_timeout=idle_timeout,
+            keep_alive=keep_alive,
+            codec=codec,
+            execution=execution,
         )
         
         # Phase 1: Access Boundary Check
 
-        self._http = HttpClient(self.config)
+        if cache is True:
+            cache = ResultCache()
+        elif not isinstance(cache, ResultCache):
+            cache = None
 
-        # Public domain APIs
-        self.physics = PhysicsAPI(self._http)
-        self.navigation = NavigationAPI(self._http)
-        self.simulation = SimulationAPI(self._http)
-        self.vision = VisionAPI(self._http)
-        
-        # Phase 2: Skills
-        self.manipulation = ManipulationAPI(self._http)
-        self.sorting = SortingAPI(self._http)
-        self.analytics = AnalyticsAPI(self._http)
-        self.assembly = AssemblyAPI(self._http)
-        self.multi_agent = MultiAgentAPI(self._http)
+        if disk_cache is not None:
+            from praxis.core.disk_cache import DiskCache
+
+            if not isinstance(disk_cache, DiskCache):
+                disk_cache = DiskCache(disk_cache)
+
+        if coalesce is True:
+            coalesce = SingleFlight()
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if hedging is True:
+            hedging = HedgePolicy()
+        if compression is True:
+            compression = Compression()
+        if grid_transport is True:
+            from praxis.core.grids import GridTransport
+
+            grid_transport = GridTransport()
+        if path_cache is True:
+            from praxis.core.path_cache import PathCache
+
+            path_cache = PathCache()
+        if not isinstance(hooks, Hooks):
+            hooks = Hooks(hooks or ())
+        if isinstance(rate_limit, (int, float)):
+            rate_limit = RateLimiter(rate=rate_limit)
+
+        self._http = HttpClient(
+            self.config,
+            cache=cache,
+            disk_cache=disk_cache,
+            coalescer=coalesce or None,
+            retry_policy=retry,
+            breaker=circuit_breaker or None,
+            hedge=hedging or None,
+            compression=compression or None,
+            hooks=hooks,
+            rate_limiter=rate_limit,
+            grid_transport=grid_transport or None,
+            path_cache=path_cache or None,
+        )
+
+    @property
+    def cache(self) -> ResultCache | None:
+        """
+        Result cache for deterministic endpoints, if enabled.
+        """
+        return self._http.cache
+
+    @property
+    def disk_cache(self) -> "DiskCache | None":
+        """
+        Persistent cross-process result cache, if enabled.
+        """
+        return self._http.disk_cache
+
+    @property
+    def coalescer(self) -> SingleFlight | None:
+        """
+        Single-flight request coalescer, if enabled.
+        """
+        return self._http.coalescer
+
+    @property
+    def compression(self) -> Compression | None:
+        """
+        Request body compression, if enabled.
+        """
+        return self._http.compression
+
+    @property
+    def grid_transport(self) -> "GridTransport | None":
+        """
+        Compact grid encoding for navigation requests, if enabled.
+        """
+        return self._http.grid_transport
+
+    @property
+    def path_cache(self) -> "PathCache | None":
+        """
+        Navigation path store answering plans from cached paths, if enabled.
+        """
+        return self._http.path_cache
+
+    @property
+    def hooks(self) -> Hooks:
+        """
+        Listeners notified around every network request.
+        """
+        return self._http.hooks
 
-    def session(self) -> Session:
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """
+        Client-side rate limiter, if enabled.
+        """
+        return self._http.rate_limiter
+
+    def session(
+        self,
+        batch: bool = False,
+        max_concurrency: int | None = None,
+        trace: bool = True,
+        trace_capacity: int = 1024,
+    ) -> Session:
         """
         Create an agent/session context.
+
+        With `batch=True`, calls made through the session are queued
+        and executed concurrently on `flush()` or when the session exits.
+        Calls are recorded in `session.trace` unless `trace=False`.
         """
-        return Session(self)
-  
\ No newline at end of file
+        return Session(
+            self,
+            batch=batch,
+            max_concurrency=max_concurrency,
+            trace=trace,
+            trace_capacity=trace_capacity,
+        )
+
+    def close(self) -> None:
+        """
+        Release pooled connections.
+        """
+        self._http.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        self.close()
+        return False  # propagate exceptions
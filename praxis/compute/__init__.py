@@ -0,0 +1,25 @@
+"""
+In-process implementations of deterministic endpoints.
+
+Used by the domain APIs when the client runs with `execution="local"`
+or `"auto"`. Results are wrapped in the same `Response` shape as
+server results, with a `local-` request id and zero cost.
+"""
+import uuid
+from typing import Any
+
+from praxis.models.envelope import Envelope
+from praxis.models.response import Response
+
+
+def local_response(data: Any) -> Response[Any]:
+    return Response(
+        Envelope(
+            success=True,
+            data=data,
+            error=None,
+            message=None,
+            cost=0.0,
+            request_id=f"local-{uuid.uuid4().hex}",
+        )
+    )
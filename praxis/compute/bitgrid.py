@@ -0,0 +1,79 @@
+"""
+Occupancy grids as integer bitsets.
+
+Breadth-first searches on a `BitGrid` advance a whole frontier per step
+with a handful of shifts and masks instead of visiting cells one by one.
+"""
+import functools
+
+Cell = tuple[int, int]
+
+# Cell byte 0 (free) -> "1", 1 (blocked) -> "0"
+_FREE_BITS = bytes([0x31, 0x30]) + bytes(254)
+
+
+class BitGrid:
+    """
+    A rectangle of cells (one byte per cell, 0 = free) whose cell
+    (r, c) is bit `(r - origin_row) * width + (c - origin_col)`.
+    """
+
+    __slots__ = ("origin", "width", "cells", "free", "not_first", "not_last")
+
+    def __init__(self, cells: bytes, width: int, origin: Cell = (0, 0)):
+        self.origin = origin
+        self.width = width
+        self.cells = cells
+        # Bit i of int(s[::-1], 2) is character i of s.
+        self.free = int(cells.translate(_FREE_BITS)[::-1], 2) if cells else 0
+        self.not_first, self.not_last = _column_masks(width, len(cells) // width)
+
+    def bit(self, cell: Cell) -> int:
+        return (cell[0] - self.origin[0]) * self.width + cell[1] - self.origin[1]
+
+    def cell(self, bit: int) -> Cell:
+        r, c = divmod(bit, self.width)
+        return self.origin[0] + r, self.origin[1] + c
+
+    def grow(self, frontier: int, visited: int) -> int:
+        """
+        Free, unvisited neighbors of the cells in `frontier`.
+        """
+        w = self.width
+        return (
+            (frontier & self.not_last) << 1
+            | (frontier & self.not_first) >> 1
+            | frontier << w
+            | frontier >> w
+        ) & self.free & ~visited
+
+    def step_back(self, bit: int, within: int) -> int:
+        """
+        A neighbor of `bit` that is in `within`, trying up, down, left
+        and right in turn; -1 if there is none. Walking back through the
+        sets of cells within distance d - 1, d - 2, ... of a search's
+        source traces a shortest path to it.
+        """
+        w = self.width
+        c = bit % w
+        for k in (
+            bit - w,
+            bit + w,
+            bit - 1 if c > 0 else -1,
+            bit + 1 if c + 1 < w else -1,
+        ):
+            if k >= 0 and within >> k & 1:
+                return k
+        return -1
+
+
+@functools.lru_cache(maxsize=64)
+def _column_masks(width: int, height: int) -> tuple[int, int]:
+    """
+    Bitsets of the cells not in the first / last column.
+    """
+    if not width or not height:
+        return 0, 0
+    not_first = ("0" + "1" * (width - 1)) * height
+    not_last = ("1" * (width - 1) + "0") * height
+    return int(not_first[::-1], 2), int(not_last[::-1], 2)
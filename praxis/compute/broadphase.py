@@ -0,0 +1,187 @@
+"""
+Persistent broadphase for collision pruning.
+"""
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+from praxis.compute import collision, physics
+
+_AXES = "xyz"
+
+
+class SweepAndPrune:
+    """
+    Scene of boxes kept sorted along one sweep axis.
+
+    `candidate_pairs()` returns the pairs whose bounds overlap on all
+    three axes; `collisions()` runs the exact AABB or OBB check on those
+    pairs only, so the cost of a tick grows with the number of nearby
+    pairs instead of N².
+
+    Boxes are dicts in the `collision` / `collision_obb` format (with an
+    optional `rotation`) or rows of [x, y, z, w, h, d(, rx, ry, rz)].
+    Bounds cover each box both rotated and unrotated, so the same pairs
+    serve the OBB check and the rotation-free AABB check.
+    Stored bounds are inflated by `margin`: an `update` that keeps a box
+    inside its inflated bounds does not touch the sort order, which makes
+    small per-tick motions nearly free. The sweep axis is the one along
+    which the scene is most spread out, unless `axis` is given.
+    Not thread-safe.
+    """
+
+    def __init__(self, margin: float = 0.0, axis: str | None = None) -> None:
+        if margin < 0:
+            raise ValueError("margin must be >= 0")
+        if axis is not None and axis not in _AXES:
+            raise ValueError(f"axis must be one of x, y, z or None, got {axis!r}")
+
+        self.margin = margin
+        self._fixed_axis = _AXES.index(axis) if axis is not None else None
+        self._axis = self._fixed_axis or 0
+        self._rows: dict[Hashable, list[float]] = {}
+        self._bounds: dict[Hashable, tuple[list[float], list[float]]] = {}
+        self._order: list[Hashable] = []
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rows)
+
+    @property
+    def axis(self) -> str:
+        """
+        Current sweep axis.
+        """
+        return _AXES[self._axis]
+
+    def insert(self, key: Hashable, box: Any) -> None:
+        if key in self._rows:
+            raise ValueError(f"{key!r} is already in the broadphase")
+
+        row = _row(box, key)
+        self._rows[key] = row
+        self._bounds[key] = self._inflated(row)
+        self._order.append(key)
+        self._dirty = True
+
+    def update(self, key: Hashable, box: Any) -> bool:
+        """
+        Move or resize `key`. Returns True if its stored bounds changed
+        (i.e. it left its margin).
+        """
+        if key not in self._rows:
+            raise KeyError(key)
+
+        row = _row(box, key)
+        self._rows[key] = row
+
+        low, high = _bounds(row)
+        stored_low, stored_high = self._bounds[key]
+        if all(stored_low[k] <= low[k] and high[k] <= stored_high[k] for k in range(3)):
+            return False
+
+        self._bounds[key] = self._inflated(row)
+        self._dirty = True
+        return True
+
+    def remove(self, key: Hashable) -> None:
+        del self._rows[key]
+        del self._bounds[key]
+        self._order.remove(key)
+
+    def candidate_pairs(self) -> list[tuple[Hashable, Hashable]]:
+        """
+        Pairs of keys whose (inflated) bounds overlap.
+        """
+        self._sort()
+        axis = self._axis
+        others = [k for k in range(3) if k != axis]
+        bounds = self._bounds
+
+        pairs = []
+        active: list[Hashable] = []
+        for key in self._order:
+            low, high = bounds[key]
+            start = low[axis]
+            active = [other for other in active if bounds[other][1][axis] >= start]
+            for other in active:
+                other_low, other_high = bounds[other]
+                if all(other_low[k] <= high[k] and low[k] <= other_high[k] for k in others):
+                    pairs.append((other, key))
+            active.append(key)
+        return pairs
+
+    def collisions(self, kind: str = "obb") -> list[dict[str, Any]]:
+        """
+        Exact collision checks on the candidate pairs.
+
+        Entries have the format of `physics.collision_batch` (`kind="aabb"`,
+        rotation ignored) or `physics.collision_obb_batch` (`kind="obb"`),
+        with `a` and `b` set to the keys of the colliding boxes.
+        """
+        pairs = self.candidate_pairs()
+        keys = list(self._rows)
+        index = {key: i for i, key in enumerate(keys)}
+        rows = [self._rows[key] for key in keys]
+
+        found = collision.pair_collisions(
+            rows,
+            [index[a] for a, _ in pairs],
+            [index[b] for _, b in pairs],
+            kind=kind,
+        )
+        for entry in found:
+            entry["a"] = keys[entry["a"]]
+            entry["b"] = keys[entry["b"]]
+        return found
+
+    def _inflated(self, row: list[float]) -> tuple[list[float], list[float]]:
+        low, high = _bounds(row)
+        return [v - self.margin for v in low], [v + self.margin for v in high]
+
+    def _sort(self) -> None:
+        if not self._dirty:
+            return
+
+        if self._fixed_axis is None and self._order:
+            self._axis = max(range(3), key=self._spread)
+        axis = self._axis
+        # Nearly sorted after small motions, which timsort handles in ~O(n).
+        self._order.sort(key=lambda key: self._bounds[key][0][axis])
+        self._dirty = False
+
+    def _spread(self, axis: int) -> float:
+        lows = [low[axis] for low, _ in self._bounds.values()]
+        return max(lows) - min(lows)
+
+
+def _row(box: Any, key: Hashable) -> list[float]:
+    if not isinstance(box, dict):
+        box = list(box)
+    return collision._rows(
+        [box], f"box {key!r}", "xyzwhd", 6, extra=3, fields=physics.OBB_FIELDS
+    )[0]
+
+
+def _bounds(row: list[float]) -> tuple[list[float], list[float]]:
+    """
+    World-space bounds of the box, large enough for its rotated extents
+    (OBB check) and its unrotated half sizes (AABB check).
+    """
+    halves = [s / 2.0 for s in row[3:6]]
+    extents = halves
+    if any(row[6:9]):
+        axes = physics.obb_axes(collision.obb_dict(row))
+        extents = [
+            max(halves[d], sum(h * abs(u[d]) for h, u in zip(halves, axes, strict=True)))
+            for d in range(3)
+        ]
+    return (
+        [row[k] - extents[k] for k in range(3)],
+        [row[k] + extents[k] for k in range(3)],
+    )
@@ -0,0 +1,384 @@
+"""
+Many-vs-many collision checks.
+
+Boxes and spheres may be given as lists of dicts in the format of the
+single-pair endpoints, as lists of rows, or as NumPy arrays:
+
+    boxes:   [x, y, z, w, h, d]                  (N, 6)
+    OBBs:    [x, y, z, w, h, d, rx, ry, rz]      (N, 6) or (N, 9), degrees
+    spheres: [x, y, z, radius]                   (N, 4)
+
+With one set, every pair within it is checked; with two, every pair
+across them. Checks are vectorized with NumPy when it is installed and
+fall back to pure Python otherwise.
+"""
+import math
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from praxis.compute import physics
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numpy
+    np = None  # type: ignore[assignment]
+
+# Upper bound on the elements of one (rows x columns x 3) block, so a
+# 10,000-object scene never materializes a full N x N x 3 array.
+_BLOCK_ELEMENTS = 1 << 20
+
+
+def _rows(
+    items: Any,
+    name: str,
+    keys: Sequence[str],
+    width: int,
+    extra: int = 0,
+    fields: Sequence[str] | None = None,
+) -> list[list[float]]:
+    """
+    Normalize `items` to a list of rows of `width` floats, optionally
+    followed by `extra` zero-defaulted columns (OBB rotation). Dicts with
+    keys outside `fields` are rejected.
+    """
+    if np is not None and isinstance(items, np.ndarray):
+        if items.ndim != 2 or items.shape[1] not in (width, width + extra):
+            raise ValueError(f"{name} must have shape (N, {width}), got {items.shape}")
+        rows = items.astype(float).tolist()
+        return [row + [0.0] * (width + extra - len(row)) for row in rows]
+
+    rows = []
+    for index, item in enumerate(items):
+        where = f"{name}[{index}]"
+        if isinstance(item, dict):
+            if fields is not None:
+                physics.check_fields(item, where, fields)
+            row = physics._vector(item, where, "".join(keys[:3])) + [
+                _number(item, k, where) for k in keys[3:]
+            ]
+            if extra:
+                rotation = item.get("rotation") or {}
+                physics.check_fields(rotation, f"{where}.rotation", "xyz")
+                row += [_number(rotation, k, f"{where}.rotation", 0.0) for k in "xyz"]
+        elif isinstance(item, Sequence) and len(item) in (width, width + extra):
+            try:
+                row = [float(v) for v in item]
+            except (TypeError, ValueError):
+                raise ValueError(f"{where} must contain numbers") from None
+        else:
+            raise ValueError(f"{where} must be a dict or a sequence of {width} numbers")
+        rows.append(row + [0.0] * (width + extra - len(row)))
+    return rows
+
+
+def _number(item: dict[str, Any], key: str, where: str, default: float | None = None) -> float:
+    value = item.get(key, default)
+    if value is None:
+        raise ValueError(f"{where} is missing key {key!r}")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}.{key} must be a number") from None
+
+
+def _result(collisions: list[dict[str, Any]], n: int, m: int | None) -> dict[str, Any]:
+    checked = n * (n - 1) // 2 if m is None else n * m
+    return {"collisions": collisions, "count": len(collisions), "checked": checked}
+
+
+# AABB
+
+
+def aabb_collisions(boxes_a: Any, boxes_b: Any = None) -> dict[str, Any]:
+    a = _rows(boxes_a, "boxes_a", "xyzwhd", 6)
+    b = _rows(boxes_b, "boxes_b", "xyzwhd", 6) if boxes_b is not None else None
+
+    if np is None:
+        collisions = []
+        for i, j in _all_pairs(len(a), len(b) if b is not None else None):
+            overlap = _aabb_overlap(a[i], b[j] if b is not None else a[j])
+            if all(o > 0 for o in overlap):
+                collisions.append(_aabb_record(i, j, overlap))
+        return _result(collisions, len(a), len(b) if b is not None else None)
+
+    ca, ha = _split_boxes(a)
+    cb, hb = _split_boxes(b) if b is not None else (ca, ha)
+    ii, jj, overlap = _overlapping(ca, ha, cb, hb, same=b is None)
+    collisions = [
+        _aabb_record(i, j, o)
+        for i, j, o in zip(ii.tolist(), jj.tolist(), overlap.tolist(), strict=True)
+    ]
+    return _result(collisions, len(a), len(b) if b is not None else None)
+
+
+def _aabb_overlap(a: list[float], b: list[float]) -> list[float]:
+    return [(a[3 + k] + b[3 + k]) / 2.0 - abs(a[k] - b[k]) for k in range(3)]
+
+
+def _aabb_record(i: int, j: int, overlap: list[float]) -> dict[str, Any]:
+    axis = min(range(3), key=overlap.__getitem__)
+    return {
+        "a": i,
+        "b": j,
+        "penetration": dict(zip("xyz", overlap, strict=True)),
+        "min_translation_vector": {"axis": "xyz"[axis], "depth": overlap[axis]},
+    }
+
+
+def _split_boxes(rows: list[list[float]]) -> tuple[Any, Any]:
+    array = np.asarray(rows, dtype=float).reshape(-1, len(rows[0]) if rows else 6)
+    return array[:, :3], array[:, 3:6] / 2.0
+
+
+def _overlapping(ca: Any, ha: Any, cb: Any, hb: Any, same: bool) -> tuple[Any, Any, Any]:
+    """
+    Index pairs (i, j) whose boxes overlap on all three axes, with the
+    per-axis overlap. With `same`, only pairs i < j are returned.
+    """
+    n, m = len(ca), len(cb)
+    found_i, found_j, found_overlap = [], [], []
+    block = max(1, _BLOCK_ELEMENTS // max(1, 3 * m))
+    columns = np.arange(m)
+
+    for start in range(0, n, block):
+        stop = min(n, start + block)
+        overlap = (
+            ha[start:stop, None, :] + hb[None, :, :]
+            - np.abs(ca[start:stop, None, :] - cb[None, :, :])
+        )
+        hit = (overlap > 0).all(axis=2)
+        if same:
+            hit &= np.arange(start, stop)[:, None] < columns[None, :]
+        rows, cols = np.nonzero(hit)
+        found_i.append(rows + start)
+        found_j.append(cols)
+        found_overlap.append(overlap[rows, cols])
+
+    if not found_i:
+        return np.empty(0, int), np.empty(0, int), np.empty((0, 3))
+    return np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_overlap)
+
+
+def _all_pairs(n: int, m: int | None) -> Iterator[tuple[int, int]]:
+    if m is None:
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+    else:
+        for i in range(n):
+            for j in range(m):
+                yield i, j
+
+
+# Spheres
+
+
+def sphere_collisions(spheres_a: Any, spheres_b: Any = None) -> dict[str, Any]:
+    fields = physics.SPHERE_FIELDS
+    a = _rows(spheres_a, "spheres_a", fields, 4, fields=fields)
+    b = _rows(spheres_b, "spheres_b", fields, 4, fields=fields) if spheres_b is not None else None
+    m = len(b) if b is not None else None
+
+    if np is None:
+        collisions = []
+        for i, j in _all_pairs(len(a), m):
+            other = b[j] if b is not None else a[j]
+            delta = [other[k] - a[i][k] for k in range(3)]
+            distance = math.sqrt(sum(d * d for d in delta))
+            if a[i][3] + other[3] - distance > 0:
+                collisions.append(_sphere_record(i, j, delta, distance, a[i][3] + other[3]))
+        return _result(collisions, len(a), m)
+
+    sa = np.asarray(a, dtype=float).reshape(-1, 4)
+    sb = np.asarray(b, dtype=float).reshape(-1, 4) if b is not None else sa
+    collisions = []
+    block = max(1, _BLOCK_ELEMENTS // max(1, 3 * len(sb)))
+    columns = np.arange(len(sb))
+
+    for start in range(0, len(sa), block):
+        stop = min(len(sa), start + block)
+        delta = sb[None, :, :3] - sa[start:stop, None, :3]
+        dist2 = (delta ** 2).sum(axis=2)
+        reach = sa[start:stop, None, 3] + sb[None, :, 3]
+        hit = dist2 < reach ** 2
+        if b is None:
+            hit &= np.arange(start, stop)[:, None] < columns[None, :]
+        rows, cols = np.nonzero(hit)
+        distance = np.sqrt(dist2[rows, cols])
+        for i, j, d, dist, r in zip(
+            (rows + start).tolist(), cols.tolist(), delta[rows, cols].tolist(),
+            distance.tolist(), reach[rows, cols].tolist(), strict=True,
+        ):
+            collisions.append(_sphere_record(i, j, d, dist, r))
+
+    return _result(collisions, len(a), m)
+
+
+def _sphere_record(
+    i: int, j: int, delta: list[float], distance: float, reach: float
+) -> dict[str, Any]:
+    normal = [d / distance for d in delta] if distance > 0 else [1.0, 0.0, 0.0]
+    return {
+        "a": i,
+        "b": j,
+        "distance": distance,
+        "penetration_depth": reach - distance,
+        "contact_normal": dict(zip("xyz", normal, strict=True)),
+    }
+
+
+# OBB
+
+
+def obb_collisions(boxes_a: Any, boxes_b: Any = None) -> dict[str, Any]:
+    """
+    Oriented boxes, checked with the separating axis theorem. Pairs
+    whose world-space bounding boxes do not overlap are rejected first.
+    """
+    fields = physics.OBB_FIELDS
+    a = _rows(boxes_a, "boxes_a", "xyzwhd", 6, extra=3, fields=fields)
+    b = _rows(boxes_b, "boxes_b", "xyzwhd", 6, extra=3, fields=fields) if boxes_b is not None else None
+    m = len(b) if b is not None else None
+
+    if np is None:
+        collisions = []
+        for i, j in _all_pairs(len(a), m):
+            other = b[j] if b is not None else a[j]
+            hit = physics.collision_obb(obb_dict(a[i]), obb_dict(other))
+            if hit["colliding"]:
+                mtv = hit["min_translation_vector"]
+                collisions.append(_obb_record(i, j, mtv["axis"], mtv["depth"]))
+        return _result(collisions, len(a), m)
+
+    oa = _ObbArrays(a)
+    ob = _ObbArrays(b) if b is not None else oa
+    ii, jj, _ = _overlapping(oa.centers, oa.extents, ob.centers, ob.extents, same=b is None)
+    collisions = [
+        _obb_record(i, j, dict(zip("xyz", axis, strict=True)), depth)
+        for i, j, axis, depth in sat(oa, ii, ob, jj)
+    ]
+    return _result(collisions, len(a), m)
+
+
+def _obb_record(i: int, j: int, axis: dict[str, float], depth: float) -> dict[str, Any]:
+    return {"a": i, "b": j, "min_translation_vector": {"axis": axis, "depth": depth}}
+
+
+def obb_dict(row: list[float]) -> dict[str, Any]:
+    box: dict[str, Any] = dict(zip("xyzwhd", row[:6], strict=True))
+    box["rotation"] = dict(zip("xyz", row[6:9], strict=True))
+    return box
+
+
+class _ObbArrays:
+    """
+    Centers, half sizes, local axes and world-space half extents of a
+    set of OBB rows.
+    """
+
+    def __init__(self, rows: list[list[float]]) -> None:
+        array = np.asarray(rows, dtype=float).reshape(-1, 9)
+        self.centers = array[:, :3]
+        self.halves = array[:, 3:6] / 2.0
+
+        rx, ry, rz = np.radians(array[:, 6:9]).T
+        cx, sx = np.cos(rx), np.sin(rx)
+        cy, sy = np.cos(ry), np.sin(ry)
+        cz, sz = np.cos(rz), np.sin(rz)
+        # axes[n, k] is the k-th local axis of box n (see physics.obb_axes)
+        self.axes = np.stack([
+            np.stack([cz * cy, sz * cy, -sy], axis=1),
+            np.stack([cz * sy * sx - sz * cx, sz * sy * sx + cz * cx, cy * sx], axis=1),
+            np.stack([cz * sy * cx + sz * sx, sz * sy * cx - cz * sx, cy * cx], axis=1),
+        ], axis=1)
+        self.extents = np.einsum("nk,nkd->nd", self.halves, np.abs(self.axes))
+
+
+def sat(
+    oa: "_ObbArrays", ii: Any, ob: "_ObbArrays", jj: Any
+) -> Iterator[tuple[int, int, list[float], float]]:
+    """
+    Separating axis test for the box pairs (oa[ii[k]], ob[jj[k]]).
+    Yields (i, j, mtv_axis, depth) for every colliding pair.
+    """
+    if len(ii) == 0:
+        return
+
+    A, B = oa.axes[ii], ob.axes[jj]
+    L = np.concatenate(
+        [A, B, np.cross(A[:, :, None, :], B[:, None, :, :]).reshape(-1, 9, 3)],
+        axis=1,
+    )
+    length = np.linalg.norm(L, axis=2)
+    valid = length > 1e-9  # parallel edges: covered by the face axes
+    L = L / np.where(valid, length, 1.0)[..., None]
+
+    delta = ob.centers[jj] - oa.centers[ii]
+    distance = np.einsum("kad,kd->ka", L, delta)
+    reach = (
+        (np.abs(np.einsum("kad,kbd->kab", L, A)) * oa.halves[ii][:, None, :]).sum(axis=2)
+        + (np.abs(np.einsum("kad,kbd->kab", L, B)) * ob.halves[jj][:, None, :]).sum(axis=2)
+    )
+    depth = np.where(valid, reach - np.abs(distance), np.inf)
+    hit = (depth > 0).all(axis=1)
+
+    best = depth.argmin(axis=1)
+    rows = np.arange(len(ii))
+    sign = np.where(distance[rows, best] >= 0, 1.0, -1.0)
+    axis = L[rows, best] * sign[:, None]
+
+    for k in np.nonzero(hit)[0].tolist():
+        yield int(ii[k]), int(jj[k]), axis[k].tolist(), float(depth[k, best[k]])
+
+
+# Narrowphase for externally chosen pairs
+
+
+def pair_collisions(
+    rows: list[list[float]],
+    ii: Sequence[int],
+    jj: Sequence[int],
+    kind: str = "obb",
+) -> list[dict[str, Any]]:
+    """
+    Exact checks for the candidate pairs (rows[ii[k]], rows[jj[k]]) of
+    OBB rows, e.g. the output of a broadphase. `kind="aabb"` ignores
+    rotation and reports per-axis penetration.
+    """
+    if kind not in ("aabb", "obb"):
+        raise ValueError(f"kind must be 'aabb' or 'obb', got {kind!r}")
+
+    if np is None:
+        collisions = []
+        for i, j in zip(ii, jj, strict=True):
+            if kind == "aabb":
+                overlap = _aabb_overlap(rows[i], rows[j])
+                if all(o > 0 for o in overlap):
+                    collisions.append(_aabb_record(i, j, overlap))
+                continue
+            hit = physics.collision_obb(obb_dict(rows[i]), obb_dict(rows[j]))
+            if hit["colliding"]:
+                mtv = hit["min_translation_vector"]
+                collisions.append(_obb_record(i, j, mtv["axis"], mtv["depth"]))
+        return collisions
+
+    if len(ii) == 0:
+        return []
+    ia, ja = np.asarray(ii, dtype=int), np.asarray(jj, dtype=int)
+
+    if kind == "aabb":
+        centers, halves = _split_boxes(rows)
+        overlap = halves[ia] + halves[ja] - np.abs(centers[ia] - centers[ja])
+        hit = (overlap > 0).all(axis=1)
+        return [
+            _aabb_record(i, j, o)
+            for i, j, o in zip(
+                ia[hit].tolist(), ja[hit].tolist(), overlap[hit].tolist(), strict=True,
+            )
+        ]
+
+    boxes = _ObbArrays(rows)
+    return [
+        _obb_record(i, j, dict(zip("xyz", axis, strict=True)), depth)
+        for i, j, axis, depth in sat(boxes, ia, boxes, ja)
+    ]
@@ -0,0 +1,185 @@
+"""
+D* Lite on 4-connected occupancy grids.
+
+Searches backwards from the goal so that the start may move and cells
+may change between queries; each query only re-expands the cells whose
+distance to the goal was affected.
+"""
+import heapq
+import math
+from collections.abc import Iterable, Iterator
+
+Cell = tuple[int, int]
+
+INF = math.inf
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised when a search expands more cells than allowed.
+    """
+
+
+class DStarLite:
+    """
+    Incremental shortest paths to a fixed `goal` on a grid of rows
+    where 0 is free and anything else is blocked. Moves cost 1.
+
+    `grid` is copied. Change cells with `set_cells`, move the robot
+    with `path(start)`.
+    """
+
+    def __init__(self, grid: Iterable[Iterable[int]], goal: Cell):
+        self.grid = [bytearray(1 if v else 0 for v in row) for row in grid]
+        self.rows = len(self.grid)
+        self.cols = len(self.grid[0]) if self.rows else 0
+        self.goal: Cell = (goal[0], goal[1])
+        self.expansions = 0
+
+        self._g: dict[Cell, float] = {}
+        self._rhs: dict[Cell, float] = {self.goal: 0.0}
+        self._queue: list[tuple[float, float, Cell]] = []
+        self._queued: dict[Cell, tuple[float, float]] = {}
+        self._km = 0.0
+        self._last: Cell | None = None
+        self._start: Cell | None = None
+        self._push(self.goal, (self._h(self.goal, self.goal), 0.0))
+
+    # Grid access
+
+    def blocked(self, cell: Cell) -> bool:
+        r, c = cell
+        return not (0 <= r < self.rows and 0 <= c < self.cols) or bool(self.grid[r][c])
+
+    def _neighbors(self, cell: Cell) -> Iterator[Cell]:
+        r, c = cell
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                yield nr, nc
+
+    def _cost(self, a: Cell, b: Cell) -> float:
+        return INF if self.grid[a[0]][a[1]] or self.grid[b[0]][b[1]] else 1.0
+
+    @staticmethod
+    def _h(a: Cell, b: Cell) -> float:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    # Priority queue with lazy deletion
+
+    def _key(self, cell: Cell) -> tuple[float, float]:
+        best = min(self._g.get(cell, INF), self._rhs.get(cell, INF))
+        start = self._start if self._start is not None else self.goal
+        return best + self._h(start, cell) + self._km, best
+
+    def _push(self, cell: Cell, key: tuple[float, float]) -> None:
+        self._queued[cell] = key
+        heapq.heappush(self._queue, (key[0], key[1], cell))
+
+    def _top(self) -> tuple[tuple[float, float], Cell | None]:
+        while self._queue:
+            k1, k2, cell = self._queue[0]
+            if self._queued.get(cell) == (k1, k2):
+                return (k1, k2), cell
+            heapq.heappop(self._queue)
+        return (INF, INF), None
+
+    def _update(self, cell: Cell) -> None:
+        if cell != self.goal:
+            if self.blocked(cell):
+                self._rhs[cell] = INF
+            else:
+                self._rhs[cell] = min(
+                    (self._cost(cell, n) + self._g.get(n, INF) for n in self._neighbors(cell)),
+                    default=INF,
+                )
+        self._queued.pop(cell, None)
+        if self._g.get(cell, INF) != self._rhs.get(cell, INF):
+            self._push(cell, self._key(cell))
+
+    def _compute(self, start: Cell, budget: int | None) -> None:
+        expanded = 0
+        while True:
+            key, cell = self._top()
+            start_key = self._key(start)
+            if cell is None:
+                break
+            if key >= start_key and self._rhs.get(start, INF) == self._g.get(start, INF):
+                break
+
+            expanded += 1
+            if budget is not None and expanded > budget:
+                self.expansions += expanded
+                raise BudgetExceeded(f"search expanded more than {budget} cells")
+
+            new_key = self._key(cell)
+            g = self._g.get(cell, INF)
+            rhs = self._rhs.get(cell, INF)
+            if key < new_key:
+                self._push(cell, new_key)
+            elif g > rhs:
+                self._g[cell] = rhs
+                self._queued.pop(cell, None)
+                for n in self._neighbors(cell):
+                    self._update(n)
+            else:
+                self._g[cell] = INF
+                self._update(cell)
+                for n in self._neighbors(cell):
+                    self._update(n)
+
+        self.expansions += expanded
+
+    # Public API
+
+    def set_cells(self, changes: dict[Cell, int]) -> list[Cell]:
+        """
+        Apply cell changes ({(row, col): value}); returns the cells that
+        actually changed. Takes effect on the next `path` call.
+        """
+        changed = []
+        for (r, c), value in changes.items():
+            if not (0 <= r < self.rows and 0 <= c < self.cols):
+                raise ValueError(f"cell {(r, c)} is outside the grid")
+            value = 1 if value else 0
+            if self.grid[r][c] != value:
+                self.grid[r][c] = value
+                changed.append((r, c))
+
+        if changed and self._last is not None:
+            for cell in changed:
+                self._update(cell)
+                for n in self._neighbors(cell):
+                    self._update(n)
+        return changed
+
+    def path(self, start: Cell, budget: int | None = None) -> list[Cell]:
+        """
+        Shortest path from `start` to the goal (both included), or []
+        if the goal is unreachable. Raises `BudgetExceeded` if the
+        repair needs more than `budget` expansions; the search state
+        stays valid and a later call resumes it.
+        """
+        start = (start[0], start[1])
+        if self.blocked(start) or self.blocked(self.goal):
+            return []
+
+        if self._last is not None:
+            self._km += self._h(self._last, start)
+        self._last = self._start = start
+        self._compute(start, budget)
+
+        if self._g.get(start, INF) == INF:
+            return []
+
+        path = [start]
+        cell = start
+        while cell != self.goal:
+            # Ties go to the first neighbor (up, down, left, right).
+            cell = min(
+                self._neighbors(cell),
+                key=lambda n: self._cost(cell, n) + self._g.get(n, INF),
+            )
+            path.append(cell)
+            if len(path) > self.rows * self.cols:  # pragma: no cover - defensive
+                raise RuntimeError("path extraction did not converge")
+        return path
@@ -0,0 +1,399 @@
+"""
+Hierarchical pathfinding (HPA*) on 4-connected occupancy grids.
+
+The grid is split into square clusters. Free cells facing each other
+across a cluster border form entrances; a path is searched first on the
+abstract graph of entrances (A*, with intra-cluster distances as edge
+costs) and only the legs of that corridor are refined to cells. All
+abstraction is built lazily, so a query only pays for the clusters its
+search touches.
+"""
+import heapq
+import inspect
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+from typing import Any
+
+from praxis.compute.bitgrid import BitGrid, Cell
+from praxis.models.grid import OccupancyGrid, as_grid
+
+# Border segments at least this long get an entrance at each end
+# instead of one in the middle.
+_WIDE_ENTRANCE = 6
+
+
+class _Search:
+    """
+    Breadth-first search inside one cluster from a source cell.
+    """
+
+    __slots__ = ("window", "reached")
+
+    def __init__(self, window: BitGrid, source: Cell) -> None:
+        self.window = window
+        frontier = visited = 1 << window.bit(source)
+        # reached[d]: cells within distance d
+        self.reached = [visited]
+        while True:
+            frontier = window.grow(frontier, visited)
+            if not frontier:
+                break
+            visited |= frontier
+            self.reached.append(visited)
+
+    def distance(self, cell: Cell) -> int:
+        """
+        Steps from the source to `cell`, -1 if unreachable.
+        """
+        bit = 1 << self.window.bit(cell)
+        reached = self.reached
+        if not reached[-1] & bit:
+            return -1
+        lo, hi = 0, len(reached) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if reached[mid] & bit:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def path_to(self, cell: Cell) -> list[Cell]:
+        """
+        Path from `cell` back to the source (both included).
+        """
+        window = self.window
+        i = window.bit(cell)
+        path = [cell]
+        for d in range(self.distance(cell) - 1, -1, -1):
+            i = window.step_back(i, self.reached[d])
+            path.append(window.cell(i))
+        return path
+
+
+class HierarchicalPlanner:
+    """
+    HPA* planner for grids too large for a flat search or a single
+    `plan` request.
+
+    Paths are valid and found whenever the goal is reachable, but are
+    near-optimal rather than shortest: legs pass through one or two
+    entrance cells per border segment, which typically adds a few
+    percent to the length.
+
+    With `navigation` and `remote_refine=True`, each intra-cluster leg is
+    refined by the remote `plan` endpoint on that cluster's sub-grid
+    (at most `cluster_size`² cells) instead of locally; the full grid is
+    never sent. Not thread-safe.
+    """
+
+    def __init__(
+        self,
+        grid: Any,
+        cluster_size: int = 32,
+        navigation: Any = None,
+        remote_refine: bool = False,
+    ) -> None:
+        if cluster_size < 2:
+            raise ValueError("cluster_size must be >= 2")
+        if remote_refine and navigation is None:
+            raise ValueError("remote_refine requires a navigation API")
+
+        self._grid = as_grid(grid).copy()
+        if not self._grid.rows or not self._grid.cols:
+            raise ValueError("grid must have at least one row and one column")
+
+        self.cluster_size = cluster_size
+        self.remote_refine = remote_refine
+        self._navigation = navigation
+
+        self._borders: dict[tuple[Cell, str], list[tuple[Cell, Cell]]] = {}
+        # cluster -> {entrance cell: cells across the border}
+        self._entrances: dict[Cell, dict[Cell, list[Cell]]] = {}
+        # cluster -> {entrance cell: BFS from it}
+        self._searches: dict[Cell, dict[Cell, _Search]] = {}
+        self._windows: dict[Cell, BitGrid] = {}
+        self._stats = {"clusters": 0, "expansions": 0, "local_legs": 0, "remote_legs": 0}
+        self._cost = 0.0
+
+    @property
+    def grid(self) -> OccupancyGrid:
+        return self._grid
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        `clusters` abstracted so far, abstract-search `expansions`, and
+        legs refined locally / remotely.
+        """
+        return dict(self._stats)
+
+    @property
+    def cost(self) -> float:
+        """
+        Total cost of the remote refinements made so far.
+        """
+        return self._cost
+
+    def set_cells(self, changes: dict[Cell, int] | Iterable[tuple[Cell, int]]) -> None:
+        """
+        Apply cell changes, given as {(row, col): value} or pairs. Only the
+        abstraction of the touched clusters and their neighbors is dropped.
+        """
+        stale = set()
+        pairs = changes.items() if isinstance(changes, dict) else changes
+        for (r, c), value in pairs:
+            if self._grid[r, c] != (1 if value else 0):
+                self._grid[r, c] = value
+                stale.add(self._cluster((r, c)))
+
+        for i, j in stale:
+            self._windows.pop((i, j), None)
+            for key in ((i, j), (i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+                self._entrances.pop(key, None)
+                self._searches.pop(key, None)
+            for border in (((i, j), "E"), ((i, j), "S"), ((i, j - 1), "E"), ((i - 1, j), "S")):
+                self._borders.pop(border, None)
+
+    def plan(self, start: Cell | list[int], goal: Cell | list[int]) -> list[Cell]:
+        """
+        Path from `start` to `goal` as a list of (row, col) cells, both
+        ends included; [] if the goal is unreachable.
+        """
+        path: list[Cell] = []
+        for leg in self.legs(start, goal):
+            path.extend(leg if not path else leg[1:])
+        return path
+
+    def legs(self, start: Cell | list[int], goal: Cell | list[int]) -> Iterator[list[Cell]]:
+        """
+        The path as consecutive legs, each refined only when reached: an
+        agent can start moving along the first leg before the rest of
+        the corridor is expanded to cells. Each leg starts at the end of
+        the previous one.
+        """
+        source, target = (start[0], start[1]), (goal[0], goal[1])
+        corridor, start_search, goal_search = self._abstract(source, target)
+        if start_search is None or goal_search is None:
+            return
+        if len(corridor) == 1:
+            yield corridor
+        for a, b in pairwise(corridor):
+            if self._cluster(a) != self._cluster(b):
+                yield [a, b]
+            elif a == source:
+                yield self._refine(a, b, start_search, reverse=True)
+            elif b == target:
+                yield self._refine(a, b, goal_search, reverse=False)
+            else:
+                yield self._refine(a, b, self._searches[self._cluster(a)][a], reverse=True)
+
+    # Abstract search
+
+    def _abstract(
+        self, start: Cell, goal: Cell
+    ) -> tuple[list[Cell], _Search | None, _Search | None]:
+        for cell in (start, goal):
+            if not (0 <= cell[0] < self._grid.rows and 0 <= cell[1] < self._grid.cols):
+                raise ValueError(f"cell {cell} is outside the grid")
+        if self._grid[start] or self._grid[goal]:
+            return [], None, None
+
+        start_search = self._bfs(start)
+        goal_search = self._bfs(goal)
+        if start == goal:
+            return [start], start_search, goal_search
+
+        goal_cluster = self._cluster(goal)
+        goal_edges = {
+            e: d for e in self._cluster_entrances(goal_cluster)
+            if (d := goal_search.distance(e)) >= 0
+        }
+
+        def neighbors(node: Cell) -> Iterator[tuple[Cell, int]]:
+            cluster = self._cluster(node)
+            if node == start:
+                for e in self._cluster_entrances(cluster):
+                    d = start_search.distance(e)
+                    if d > 0:
+                        yield e, d
+                if cluster == goal_cluster and start_search.distance(goal) >= 0:
+                    yield goal, start_search.distance(goal)
+            else:
+                yield from self._intra(cluster, node)
+            for other in self._cluster_entrances(cluster).get(node, ()):
+                yield other, 1
+            if node in goal_edges:
+                yield goal, goal_edges[node]
+
+        g = {start: 0}
+        parent: dict[Cell, Cell | None] = {start: None}
+        # Ties go to the deeper node, which keeps the search from
+        # flooding open areas where many nodes share the same estimate.
+        heap = [(self._h(start, goal), 0, start)]
+        closed = set()
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            cost = -cost
+            if node in closed:
+                continue
+            if node == goal:
+                corridor = []
+                back: Cell | None = node
+                while back is not None:
+                    corridor.append(back)
+                    back = parent[back]
+                return corridor[::-1], start_search, goal_search
+
+            closed.add(node)
+            self._stats["expansions"] += 1
+            for other, step in neighbors(node):
+                new = cost + step
+                if other not in closed and new < g.get(other, new + 1):
+                    g[other] = new
+                    parent[other] = node
+                    heapq.heappush(heap, (new + self._h(other, goal), -new, other))
+        return [], start_search, goal_search
+
+    @staticmethod
+    def _h(a: Cell, b: Cell) -> int:
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def _intra(self, cluster: Cell, node: Cell) -> Iterator[tuple[Cell, int]]:
+        searches = self._searches.setdefault(cluster, {})
+        search = searches.get(node)
+        if search is None:
+            search = searches[node] = self._bfs(node)
+        for e in self._cluster_entrances(cluster):
+            d = search.distance(e)
+            if d > 0:
+                yield e, d
+
+    # Clusters
+
+    def _cluster(self, cell: Cell) -> Cell:
+        return cell[0] // self.cluster_size, cell[1] // self.cluster_size
+
+    def _bounds(self, cluster: Cell) -> tuple[int, int, int, int]:
+        size = self.cluster_size
+        r0, c0 = cluster[0] * size, cluster[1] * size
+        return r0, c0, min(r0 + size, self._grid.rows), min(c0 + size, self._grid.cols)
+
+    def _window(self, cluster: Cell) -> BitGrid:
+        window = self._windows.get(cluster)
+        if window is None:
+            r0, c0, r1, c1 = self._bounds(cluster)
+            cells = b"".join(self._grid.row(r, c0, c1) for r in range(r0, r1))
+            window = self._windows[cluster] = BitGrid(cells, c1 - c0, (r0, c0))
+        return window
+
+    def _cluster_entrances(self, cluster: Cell) -> dict[Cell, list[Cell]]:
+        entrances = self._entrances.get(cluster)
+        if entrances is not None:
+            return entrances
+
+        i, j = cluster
+        entrances = {}
+        for key, mine in (
+            (((i, j), "E"), 0),
+            (((i, j), "S"), 0),
+            (((i, j - 1), "E"), 1),
+            (((i - 1, j), "S"), 1),
+        ):
+            for pair in self._border(*key):
+                entrances.setdefault(pair[mine], []).append(pair[1 - mine])
+
+        self._entrances[cluster] = entrances
+        self._stats["clusters"] += 1
+        return entrances
+
+    def _border(self, cluster: Cell, side: str) -> list[tuple[Cell, Cell]]:
+        """
+        Transitions (cell in `cluster`, cell across) on its east or
+        south border.
+        """
+        key = (cluster, side)
+        found = self._borders.get(key)
+        if found is not None:
+            return found
+
+        found = []
+        if cluster[0] >= 0 and cluster[1] >= 0:
+            r0, c0, r1, c1 = self._bounds(cluster)
+            if side == "E" and c1 < self._grid.cols:
+                free = [
+                    not (self._grid[r, c1 - 1] or self._grid[r, c1])
+                    for r in range(r0, r1)
+                ]
+                for lo, hi in _segments(free):
+                    for k in _entrance_offsets(lo, hi):
+                        found.append(((r0 + k, c1 - 1), (r0 + k, c1)))
+            elif side == "S" and r1 < self._grid.rows:
+                inside = self._grid.row(r1 - 1, c0, c1)
+                below = self._grid.row(r1, c0, c1)
+                free = [not (a or b) for a, b in zip(inside, below, strict=True)]
+                for lo, hi in _segments(free):
+                    for k in _entrance_offsets(lo, hi):
+                        found.append(((r1 - 1, c0 + k), (r1, c0 + k)))
+
+        self._borders[key] = found
+        return found
+
+    def _bfs(self, source: Cell) -> _Search:
+        return _Search(self._window(self._cluster(source)), source)
+
+    # Refinement
+
+    def _refine(self, a: Cell, b: Cell, search: _Search, reverse: bool) -> list[Cell]:
+        """
+        Cells from `a` to `b`. Locally, the leg is read off `search`,
+        which starts at `a` (`reverse`) or at `b`.
+        """
+        if self.remote_refine:
+            leg = self._refine_remote(a, b)
+            if leg and leg[0] == a and leg[-1] == b:
+                self._stats["remote_legs"] += 1
+                return leg
+        self._stats["local_legs"] += 1
+        if reverse:
+            return search.path_to(b)[::-1]
+        return search.path_to(a)
+
+    def _refine_remote(self, a: Cell, b: Cell) -> list[Cell]:
+        window = self._window(self._cluster(a))
+        (r0, c0), width, cells = window.origin, window.width, window.cells
+        grid = [list(cells[i:i + width]) for i in range(0, len(cells), width)]
+        res = self._navigation.plan(
+            grid=grid, start=(a[0] - r0, a[1] - c0), goal=(b[0] - r0, b[1] - c0)
+        )
+        if inspect.isawaitable(res):
+            getattr(res, "close", lambda: None)()
+            raise TypeError(
+                "HierarchicalPlanner cannot await remote plans; "
+                "use a synchronous Client or remote_refine=False"
+            )
+
+        self._cost += res.cost or 0.0
+        result = res.data.get("result", res.data)
+        return [(r + r0, c + c0) for r, c in result.get("path") or []]
+
+
+def _segments(free: list[bool]) -> Iterator[tuple[int, int]]:
+    """
+    (first, last) offsets of the runs of True in `free`.
+    """
+    lo = None
+    for k, ok in enumerate(free):
+        if ok and lo is None:
+            lo = k
+        elif not ok and lo is not None:
+            yield lo, k - 1
+            lo = None
+    if lo is not None:
+        yield lo, len(free) - 1
+
+
+def _entrance_offsets(lo: int, hi: int) -> tuple[int, ...]:
+    if hi - lo + 1 >= _WIDE_ENTRANCE:
+        return lo, hi
+    return ((lo + hi) // 2,)
@@ -0,0 +1,221 @@
+"""
+Closed-form physics, computed in-process.
+
+Every function takes the same arguments as the JSON payload of its
+endpoint and returns `data` in the same shape. Only the endpoints in
+`ENDPOINTS`, whose results are checked against recorded server
+responses, are computed locally in place of a request. Invalid input,
+including unknown fields, raises ValueError.
+"""
+import math
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+COLLISION_WARNING = "Objects are overlapping — collision detected"
+
+AABB_FIELDS = ("x", "y", "z", "w", "h", "d")
+SPHERE_FIELDS = ("x", "y", "z", "radius")
+OBB_FIELDS = ("x", "y", "z", "w", "h", "d", "rotation")
+
+
+def force(mass: float, acceleration: float) -> dict[str, Any]:
+    return {"force": float(mass * acceleration)}
+
+
+def resistance(
+    velocity: float,
+    drag_coefficient: float,
+    cross_sectional_area: float,
+    fluid_density: float = 1.225,
+) -> dict[str, Any]:
+    drag = 0.5 * fluid_density * velocity ** 2 * drag_coefficient * cross_sectional_area
+    return {
+        "drag_force": drag,
+        "velocity": velocity,
+        "drag_coefficient": drag_coefficient,
+        "cross_sectional_area": cross_sectional_area,
+        "fluid_density": fluid_density,
+        "warnings": None,
+    }
+
+
+# Collision
+
+
+def check_fields(obj: Any, name: str, allowed: Iterable[str]) -> None:
+    """
+    Reject keys outside `allowed`, so that a payload in an unexpected
+    shape fails instead of being checked as something simpler.
+    """
+    if not isinstance(obj, dict):
+        raise ValueError(f"{name} must be a dict")
+    unknown = sorted(set(obj).difference(allowed))
+    if unknown:
+        raise ValueError(
+            f"{name} has unknown key(s) {', '.join(map(repr, unknown))}; "
+            f"expected {', '.join(allowed)}"
+        )
+
+
+def _vector(obj: dict[str, Any], name: str, keys: str) -> list[float]:
+    try:
+        return [float(obj[k]) for k in keys]
+    except KeyError as exc:
+        raise ValueError(f"{name} is missing key {exc.args[0]!r}") from None
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a dict of numbers with keys {', '.join(keys)}") from None
+
+
+def collision(box_a: dict[str, Any], box_b: dict[str, Any]) -> dict[str, Any]:
+    """
+    Axis-aligned boxes given by center (x, y, z) and size (w, h, d).
+    """
+    check_fields(box_a, "box_a", AABB_FIELDS)
+    check_fields(box_b, "box_b", AABB_FIELDS)
+    ca, sa = _vector(box_a, "box_a", "xyz"), _vector(box_a, "box_a", "whd")
+    cb, sb = _vector(box_b, "box_b", "xyz"), _vector(box_b, "box_b", "whd")
+
+    overlap = [
+        max(0.0, (sa[i] + sb[i]) / 2.0 - abs(ca[i] - cb[i]))
+        for i in range(3)
+    ]
+    colliding = all(o > 0 for o in overlap)
+    if not colliding:
+        overlap = [0.0, 0.0, 0.0]
+
+    axis = min(range(3), key=overlap.__getitem__) if colliding else None
+    return {
+        "colliding": colliding,
+        "penetration": dict(zip("xyz", overlap, strict=True)),
+        "min_translation_vector": {
+            "axis": "xyz"[axis] if axis is not None else None,
+            "depth": overlap[axis] if axis is not None else 0.0,
+        },
+        "warnings": [COLLISION_WARNING] if colliding else [],
+    }
+
+
+def collision_sphere(sphere_a: dict[str, Any], sphere_b: dict[str, Any]) -> dict[str, Any]:
+    """
+    Spheres given by center (x, y, z) and `radius`.
+    """
+    check_fields(sphere_a, "sphere_a", SPHERE_FIELDS)
+    check_fields(sphere_b, "sphere_b", SPHERE_FIELDS)
+    ca, cb = _vector(sphere_a, "sphere_a", "xyz"), _vector(sphere_b, "sphere_b", "xyz")
+    ra = _radius(sphere_a, "sphere_a")
+    rb = _radius(sphere_b, "sphere_b")
+
+    delta = [cb[i] - ca[i] for i in range(3)]
+    distance = math.sqrt(sum(d * d for d in delta))
+    penetration = ra + rb - distance
+    colliding = penetration > 0
+    normal = [d / distance for d in delta] if distance > 0 else [1.0, 0.0, 0.0]
+
+    return {
+        "colliding": colliding,
+        "distance": distance,
+        "penetration_depth": max(0.0, penetration),
+        "contact_normal": dict(zip("xyz", normal, strict=True)),
+        "warnings": [COLLISION_WARNING] if colliding else [],
+    }
+
+
+def _radius(sphere: dict[str, Any], name: str) -> float:
+    radius = sphere.get("radius")
+    if radius is None:
+        raise ValueError(f"{name} is missing key 'radius'")
+    if radius < 0:
+        raise ValueError(f"{name} radius must be >= 0")
+    return float(radius)
+
+
+def obb_axes(box: dict[str, Any], name: str = "box") -> list[list[float]]:
+    """
+    Local x, y, z axes of a box rotated by `rotation` = {x, y, z} Euler
+    angles in degrees (applied in x, y, z order). No rotation gives the
+    world axes.
+    """
+    rotation = box.get("rotation") or {}
+    check_fields(rotation, f"{name}.rotation", "xyz")
+    try:
+        rx, ry, rz = (math.radians(float(rotation.get(k, 0.0))) for k in "xyz")
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError(f"{name}.rotation must be a dict of angles with keys x, y, z") from None
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+
+    # Columns of R = Rz @ Ry @ Rx
+    return [
+        [cz * cy, sz * cy, -sy],
+        [cz * sy * sx - sz * cx, sz * sy * sx + cz * cx, cy * sx],
+        [cz * sy * cx + sz * sx, sz * sy * cx - cz * sx, cy * cx],
+    ]
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a: Sequence[float], b: Sequence[float]) -> list[float]:
+    return [
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ]
+
+
+def collision_obb(box_a: dict[str, Any], box_b: dict[str, Any]) -> dict[str, Any]:
+    """
+    Oriented boxes: center (x, y, z), size (w, h, d) and an optional
+    `rotation` (see `obb_axes`). Uses the separating axis theorem over
+    the 15 candidate axes.
+    """
+    check_fields(box_a, "box_a", OBB_FIELDS)
+    check_fields(box_b, "box_b", OBB_FIELDS)
+    ca, cb = _vector(box_a, "box_a", "xyz"), _vector(box_b, "box_b", "xyz")
+    ha = [s / 2.0 for s in _vector(box_a, "box_a", "whd")]
+    hb = [s / 2.0 for s in _vector(box_b, "box_b", "whd")]
+    axes_a, axes_b = obb_axes(box_a, "box_a"), obb_axes(box_b, "box_b")
+    delta = [cb[i] - ca[i] for i in range(3)]
+
+    candidates = axes_a + axes_b + [_cross(a, b) for a in axes_a for b in axes_b]
+    best_depth, best_axis = math.inf, [1.0, 0.0, 0.0]
+    for axis in candidates:
+        length = math.sqrt(_dot(axis, axis))
+        if length < 1e-9:  # parallel edges: covered by the face axes
+            continue
+        axis = [c / length for c in axis]
+        reach = (
+            sum(h * abs(_dot(u, axis)) for h, u in zip(ha, axes_a, strict=True))
+            + sum(h * abs(_dot(u, axis)) for h, u in zip(hb, axes_b, strict=True))
+        )
+        distance = _dot(delta, axis)
+        depth = reach - abs(distance)
+        if depth <= 0:
+            return {
+                "colliding": False,
+                "min_translation_vector": {"axis": None, "depth": 0.0},
+                "warnings": [],
+            }
+        if depth < best_depth:
+            # Point from box_a towards box_b
+            best_depth = depth
+            best_axis = axis if distance >= 0 else [-c for c in axis]
+
+    return {
+        "colliding": True,
+        "min_translation_vector": {"axis": dict(zip("xyz", best_axis, strict=True)), "depth": best_depth},
+        "warnings": [COLLISION_WARNING],
+    }
+
+
+# Endpoint path -> local implementation used by `execution="local"` and
+# `"auto"`. Only endpoints whose local results have been checked against
+# recorded server responses (tests/test_local_physics.py) are listed;
+# the sphere and OBB checks back the always-local batch functions.
+ENDPOINTS: dict[str, Any] = {
+    "/api/v1/physics/force": force,
+    "/api/v1/physics/collision": collision,
+    "/api/v1/physics/resistance": resistance,
+}
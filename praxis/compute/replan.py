@@ -0,0 +1,191 @@
+"""
+Stateful navigation planner for agent loops.
+"""
+import inspect
+from collections.abc import Iterable
+from typing import Any
+
+from praxis.compute.dstar import BudgetExceeded, Cell, DStarLite
+
+
+class IncrementalPlanner:
+    """
+    Keeps the current path to `goal` across the steps of an agent loop.
+
+    - While the grid is unchanged, positions on the current path are
+      answered by slicing it, without any computation or request.
+    - The first plan comes from the remote `navigation.plan` endpoint.
+    - After grid changes (`update` / `set_grid`), the path is repaired
+      locally with D* Lite, which only re-expands the cells whose
+      distance to the goal changed. Changes that only block cells off
+      the current path keep it as is.
+    - A repair that would expand more than `max_expansions` cells falls
+      back to a remote plan; grids too large to search locally at all
+      are planned remotely from then on.
+
+    With `remote=False` (the default for `execution="local"` clients)
+    every plan is computed locally. Only synchronous clients can plan
+    remotely. Not thread-safe.
+    """
+
+    def __init__(
+        self,
+        navigation: Any,
+        grid: Iterable[Iterable[int]],
+        goal: Cell | list[int],
+        remote: bool = True,
+        max_expansions: int | None = 100_000,
+    ):
+        self._navigation = navigation
+        self._grid = [bytearray(1 if v else 0 for v in row) for row in grid]
+        if not self._grid or not self._grid[0]:
+            raise ValueError("grid must have at least one row and one column")
+        self.goal: Cell = (goal[0], goal[1])
+        self.remote = remote
+        self.max_expansions = max_expansions
+
+        self._path: list[Cell] = []
+        self._index: dict[Cell, int] = {}
+        self._valid = False  # _path is a shortest path for the current grid
+        self._search: DStarLite | None = None
+        self._planned = False
+        self._too_large = False  # a full local search exceeded the budget
+        self._stats = {"reused": 0, "local": 0, "remote": 0, "fallbacks": 0}
+        self._cost = 0.0
+
+    @property
+    def grid(self) -> list[bytearray]:
+        return self._grid
+
+    @property
+    def path(self) -> list[Cell]:
+        """
+        The current path (from the last planned position to the goal).
+        """
+        return list(self._path)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        How plans were answered: `reused` (slice of the current path),
+        `local` (D* Lite), `remote`, and `fallbacks` (local repairs
+        abandoned for a remote plan).
+        """
+        return dict(self._stats)
+
+    @property
+    def cost(self) -> float:
+        """
+        Total cost of the remote plans made so far.
+        """
+        return self._cost
+
+    def plan(self, start: Cell | list[int]) -> list[Cell]:
+        """
+        Shortest path from `start` to the goal as a list of (row, col)
+        cells, both ends included; [] if the goal is unreachable.
+        """
+        start = (start[0], start[1])
+        if self._valid and start in self._index:
+            self._stats["reused"] += 1
+            return self._path[self._index[start]:]
+
+        if self.remote and (not self._planned or self._too_large):
+            return self._plan_remote(start)
+        return self._plan_local(start)
+
+    def next_step(self, position: Cell | list[int]) -> Cell | None:
+        """
+        The cell to move to from `position`: `position` itself at the
+        goal, None if the goal is unreachable.
+        """
+        path = self.plan(position)
+        if not path:
+            return None
+        return path[1] if len(path) > 1 else path[0]
+
+    def update(self, changes: dict[Cell, int] | Iterable[tuple[Cell, int]]) -> None:
+        """
+        Apply cell changes, given as {(row, col): value} or pairs.
+        """
+        cells: dict[Cell, int] = dict(changes)
+        changed = []
+        for (r, c), value in cells.items():
+            if not (0 <= r < len(self._grid) and 0 <= c < len(self._grid[0])):
+                raise ValueError(f"cell {(r, c)} is outside the grid")
+            value = 1 if value else 0
+            if self._grid[r][c] != value:
+                self._grid[r][c] = value
+                changed.append(((r, c), value))
+
+        if not changed:
+            return
+        if self._search is not None:
+            self._search.set_cells(dict(changed))
+
+        # Blocking cells off the path cannot shorten or break it.
+        if any(value == 0 or cell in self._index for cell, value in changed):
+            self._valid = False
+
+    def set_grid(self, grid: Iterable[Iterable[int]]) -> None:
+        """
+        Replace the grid (same shape); only the differing cells count as
+        changes.
+        """
+        rows = [list(row) for row in grid]
+        if len(rows) != len(self._grid) or any(len(r) != len(self._grid[0]) for r in rows):
+            raise ValueError("set_grid() requires a grid of the same shape")
+
+        self.update(
+            ((r, c), value)
+            for r, row in enumerate(rows)
+            for c, value in enumerate(row)
+            if (1 if value else 0) != self._grid[r][c]
+        )
+
+    # Planning
+
+    def _plan_local(self, start: Cell) -> list[Cell]:
+        search = self._search
+        fresh = search is None
+        if search is None:
+            search = self._search = DStarLite(self._grid, self.goal)
+
+        budget = self.max_expansions if self.remote else None
+        try:
+            path = search.path(start, budget=budget)
+        except BudgetExceeded:
+            self._stats["fallbacks"] += 1
+            if fresh:
+                # Too large to search locally: plan remotely from now on.
+                self._search = None
+                self._too_large = True
+            # Otherwise keep the search state; the next repair resumes it.
+            return self._plan_remote(start)
+
+        self._stats["local"] += 1
+        return self._set_path(path)
+
+    def _plan_remote(self, start: Cell) -> list[Cell]:
+        res = self._navigation.plan(
+            grid=[list(row) for row in self._grid], start=start, goal=self.goal
+        )
+        if inspect.isawaitable(res):
+            getattr(res, "close", lambda: None)()
+            raise TypeError(
+                "IncrementalPlanner cannot await remote plans; "
+                "use a synchronous Client or remote=False"
+            )
+
+        self._stats["remote"] += 1
+        self._cost += res.cost or 0.0
+        result = res.data.get("result", res.data)
+        path = [tuple(cell) for cell in result.get("path") or []]
+        return self._set_path(path)
+
+    def _set_path(self, path: list[Cell]) -> list[Cell]:
+        self._planned = True
+        self._path = path
+        self._index = {cell: i for i, cell in enumerate(path)}
+        self._valid = True
+        return list(path)
@@ -0,0 +1,402 @@
+"""
+Multi-waypoint routes on 4-connected occupancy grids.
+"""
+import itertools
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+from praxis.compute.bitgrid import BitGrid, Cell
+from praxis.models.grid import as_grid
+
+ORDERS = ("given", "optimize")
+
+INF = math.inf
+
+# Up to this many waypoints after the first, "optimize" is exact.
+_EXACT_LIMIT = 10
+
+# Cumulative BFS sets kept per this many layers while tracing a leg.
+_CHECKPOINT = 64
+
+# Bitset searches touch the whole grid once per layer, so past about
+# this many cells a cell-by-cell search is faster.
+_BITSET_CELLS = 1 << 19
+
+
+class _GridDistances:
+    __slots__ = ("cells", "rows", "cols", "bits", "dist", "legs")
+
+    def __init__(self, cells: bytes, rows: int, cols: int):
+        self.cells = cells
+        self.rows = rows
+        self.cols = cols
+        self.bits = BitGrid(cells, cols) if len(cells) <= _BITSET_CELLS else None
+        # source -> {target: steps} (INF when unreachable); symmetric.
+        self.dist: dict[Cell, dict[Cell, float]] = {}
+        # (source, target) -> traced shortest path
+        self.legs: dict[tuple[Cell, Cell], list[Cell]] = {}
+
+
+class RoutePlanner:
+    """
+    Routes through a list of waypoints on a grid.
+
+    Pairwise step counts come from one breadth-first search per waypoint
+    that stops once every other waypoint is reached, and are cached per
+    grid (keyed by its SHA-256). Moves are symmetric, so each search
+    fills a row and a column of the matrix, and waypoints already known
+    to all others are not searched again. Only the legs of the chosen
+    order are traced to cells, and traced legs are cached as well.
+    Thread-safe.
+    """
+
+    def __init__(self, max_grids: int = 4):
+        if max_grids < 1:
+            raise ValueError("max_grids must be >= 1")
+
+        self.max_grids = max_grids
+        self._lock = threading.Lock()
+        self._grids: OrderedDict[str, _GridDistances] = OrderedDict()
+        self._searches = 0
+
+    @property
+    def searches(self) -> int:
+        """
+        Breadth-first searches run so far (cache misses).
+        """
+        return self._searches
+
+    def distances(self, grid: Any, waypoints: Sequence[Sequence[int]]) -> list[list[float]]:
+        """
+        Matrix of shortest step counts between `waypoints`; `math.inf`
+        where no path exists.
+        """
+        entry = self._entry(grid)
+        points = _points(waypoints, entry)
+        return self._matrix(entry, points)
+
+    def plan(self, grid: Any, waypoints: Sequence[Sequence[int]], order: str = "given") -> dict[str, Any]:
+        """
+        Route from the first waypoint through all the others.
+
+        With `order="optimize"` the first waypoint stays first and the
+        others are visited in the order with the fewest total steps:
+        exact for up to 10 of them, nearest neighbor plus 2-opt beyond.
+        """
+        if order not in ORDERS:
+            raise ValueError(f"order must be one of {', '.join(ORDERS)}, got {order!r}")
+
+        entry = self._entry(grid)
+        points = _points(waypoints, entry)
+        matrix = self._matrix(entry, points)
+
+        if order == "optimize":
+            sequence = _best_order(matrix)
+        else:
+            sequence = list(range(len(points)))
+
+        legs = [matrix[a][b] for a, b in itertools.pairwise(sequence)]
+        if any(leg == INF for leg in legs):
+            return {"reachable": False, "steps": 0, "path": [], "order": sequence, "legs": []}
+
+        path = [points[sequence[0]]]
+        for (a, b), steps in zip(itertools.pairwise(sequence), legs, strict=True):
+            path.extend(self._leg(entry, points[a], points[b], int(steps))[1:])
+
+        return {
+            "reachable": True,
+            "steps": len(path) - 1,
+            "path": [list(cell) for cell in path],
+            "order": sequence,
+            "legs": [int(steps) for steps in legs],
+        }
+
+    # Distances
+
+    def _entry(self, grid: Any) -> _GridDistances:
+        grid = as_grid(grid)
+        key = grid.sha256()
+        with self._lock:
+            entry = self._grids.get(key)
+            if entry is not None:
+                self._grids.move_to_end(key)
+                return entry
+
+        entry = _GridDistances(grid.cells(), grid.rows, grid.cols)
+        with self._lock:
+            entry = self._grids.setdefault(key, entry)
+            while len(self._grids) > self.max_grids:
+                self._grids.popitem(last=False)
+        return entry
+
+    def _matrix(self, entry: _GridDistances, points: list[Cell]) -> list[list[float]]:
+        targets = set(points)
+        for source in dict.fromkeys(points):
+            with self._lock:
+                known = entry.dist.setdefault(source, {})
+                if source not in known:
+                    known[source] = INF if entry.cells[source[0] * entry.cols + source[1]] else 0
+                missing = targets.difference(known)
+            if missing:
+                found = _search(entry, source, missing)
+                with self._lock:
+                    self._searches += 1
+                    for target, steps in found.items():
+                        entry.dist.setdefault(source, {})[target] = steps
+                        entry.dist.setdefault(target, {})[source] = steps
+
+        with self._lock:
+            return [[entry.dist[a][b] for b in points] for a in points]
+
+    def _leg(self, entry: _GridDistances, source: Cell, target: Cell, steps: int) -> list[Cell]:
+        with self._lock:
+            leg = entry.legs.get((source, target))
+            if leg is None and (target, source) in entry.legs:
+                leg = entry.legs[(target, source)][::-1]
+        if leg is None:
+            leg = _trace(entry, source, target, steps)
+            with self._lock:
+                entry.legs[(source, target)] = leg
+        return leg
+
+
+def _points(waypoints: Sequence[Sequence[int]], entry: _GridDistances) -> list[Cell]:
+    if len(waypoints) < 1:
+        raise ValueError("at least one waypoint is required")
+
+    points = []
+    for point in waypoints:
+        r, c = point
+        if not (0 <= r < entry.rows and 0 <= c < entry.cols):
+            raise ValueError(f"waypoint {(r, c)} is outside the grid")
+        points.append((r, c))
+    return points
+
+
+def _search(entry: _GridDistances, source: Cell, targets: set[Cell]) -> dict[Cell, float]:
+    """
+    Steps from `source` to each of `targets`, stopping once all are reached.
+    """
+    found = dict.fromkeys(targets, INF)
+    cols = entry.cols
+    if entry.cells[source[0] * cols + source[1]]:
+        return found
+
+    pending = {r * cols + c: (r, c) for r, c in targets if not entry.cells[r * cols + c]}
+    if entry.bits is None:
+        _scan(entry, source, pending, found)
+        return found
+
+    bits = entry.bits
+    mask = sum(1 << i for i in pending)
+    frontier = visited = 1 << bits.bit(source)
+    steps = 0
+    while pending:
+        hit = frontier & mask
+        if hit:
+            for i in [i for i in pending if hit >> i & 1]:
+                found[pending.pop(i)] = steps
+            mask &= ~hit
+            if not pending:
+                break
+        frontier = bits.grow(frontier, visited)
+        if not frontier:
+            break
+        visited |= frontier
+        steps += 1
+    return found
+
+
+def _scan(
+    entry: _GridDistances,
+    source: Cell,
+    pending: dict[int, Cell],
+    found: dict[Cell, float],
+    moves: bytearray | None = None,
+) -> None:
+    """
+    Cell-by-cell breadth-first search from `source` until every index in
+    `pending` is reached, recording the steps in `found`. With `moves`,
+    also records for each reached cell the move that reached it (1 up,
+    2 down, 3 left, 4 right).
+    """
+    cells, cols = entry.cells, entry.cols
+    n = len(cells)
+    seen = bytearray(cells)
+    start = source[0] * cols + source[1]
+    seen[start] = 1
+
+    frontier = [start]
+    steps = 0
+    while frontier and pending:
+        for i in frontier:
+            if i in pending:
+                found[pending.pop(i)] = steps
+        if not pending:
+            break
+
+        reached: list[int] = []
+        add = reached.append
+        for i in frontier:
+            c = i % cols
+            j = i - cols
+            if j >= 0 and not seen[j]:
+                seen[j] = 1
+                add(j)
+                if moves is not None:
+                    moves[j] = 1
+            j = i + cols
+            if j < n and not seen[j]:
+                seen[j] = 1
+                add(j)
+                if moves is not None:
+                    moves[j] = 2
+            j = i - 1
+            if c and not seen[j]:
+                seen[j] = 1
+                add(j)
+                if moves is not None:
+                    moves[j] = 3
+            j = i + 1
+            if c + 1 < cols and not seen[j]:
+                seen[j] = 1
+                add(j)
+                if moves is not None:
+                    moves[j] = 4
+        frontier = reached
+        steps += 1
+
+
+def _trace(entry: _GridDistances, source: Cell, target: Cell, steps: int) -> list[Cell]:
+    """
+    A shortest path of `steps` moves from `source` to `target`.
+    """
+    if entry.bits is None:
+        cols = entry.cols
+        moves = bytearray(len(entry.cells))
+        _scan(entry, source, {target[0] * cols + target[1]: target}, {}, moves)
+
+        i = target[0] * cols + target[1]
+        path = [target]
+        for _ in range(steps):
+            i = (i + cols, i - cols, i + 1, i - 1)[moves[i] - 1]
+            path.append(divmod(i, cols))
+        return path[::-1]
+
+    return _trace_bits(entry.bits, source, target, steps)
+
+
+def _trace_bits(bits: BitGrid, source: Cell, target: Cell, steps: int) -> list[Cell]:
+    """
+    Walking back from the target needs the set of cells within each
+    distance of the source; only every 64th set is kept during the
+    forward search and the ones in between are rebuilt block by block,
+    which bounds memory on long legs.
+    """
+    frontier = visited = 1 << bits.bit(source)
+    checkpoints = [(visited, frontier)]
+    for layer in range(1, steps):
+        frontier = bits.grow(frontier, visited)
+        visited |= frontier
+        if layer % _CHECKPOINT == 0:
+            checkpoints.append((visited, frontier))
+
+    i = bits.bit(target)
+    path = [target]
+    layer = steps
+    for block in range(len(checkpoints) - 1, -1, -1):
+        base = block * _CHECKPOINT
+        if base >= layer:
+            continue
+        visited, frontier = checkpoints[block]
+        within = [visited]
+        for _ in range(base + 1, layer):
+            frontier = bits.grow(frontier, visited)
+            visited |= frontier
+            within.append(visited)
+        while layer > base:
+            i = bits.step_back(i, within[layer - 1 - base])
+            path.append(bits.cell(i))
+            layer -= 1
+    return path[::-1]
+
+
+# Visiting order
+
+def _best_order(matrix: list[list[float]]) -> list[int]:
+    n = len(matrix)
+    if n <= 2:
+        return list(range(n))
+    if n - 1 <= _EXACT_LIMIT:
+        return _held_karp(matrix)
+    return _two_opt(matrix, _nearest_neighbor(matrix))
+
+
+def _held_karp(matrix: list[list[float]]) -> list[int]:
+    """
+    Exact shortest open path from node 0 through all others.
+    """
+    n = len(matrix)
+    others = range(1, n)
+    # (visited set as bitmask over 1..n-1, last node) -> (cost, previous node)
+    best: dict[tuple[int, int], tuple[float, int]] = {
+        (1 << (k - 1), k): (matrix[0][k], 0) for k in others
+    }
+    for size in range(2, n):
+        for subset in itertools.combinations(others, size):
+            bits = 0
+            for k in subset:
+                bits |= 1 << (k - 1)
+            for last in subset:
+                prev_bits = bits & ~(1 << (last - 1))
+                best[(bits, last)] = min(
+                    (best[(prev_bits, k)][0] + matrix[k][last], k)
+                    for k in subset
+                    if k != last
+                )
+
+    full = (1 << (n - 1)) - 1
+    _, last = min((best[(full, k)][0], k) for k in others)
+    order, bits = [], full
+    while last != 0:
+        order.append(last)
+        _, prev = best[(bits, last)]
+        bits &= ~(1 << (last - 1))
+        last = prev
+    return [0] + order[::-1]
+
+
+def _nearest_neighbor(matrix: list[list[float]]) -> list[int]:
+    order = [0]
+    remaining = set(range(1, len(matrix)))
+    while remaining:
+        last = order[-1]
+        nxt = min(remaining, key=lambda k: (matrix[last][k], k))
+        order.append(nxt)
+        remaining.remove(nxt)
+    return order
+
+
+def _two_opt(matrix: list[list[float]], order: list[int]) -> list[int]:
+    """
+    Reverse segments of the open path while that shortens it; the first
+    node stays in place.
+    """
+    n = len(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                a, b = order[i - 1], order[i]
+                c = order[j]
+                d = order[j + 1] if j + 1 < n else None
+                before = matrix[a][b] + (matrix[c][d] if d is not None else 0)
+                after = matrix[a][c] + (matrix[b][d] if d is not None else 0)
+                if after < before:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    improved = True
+    return order
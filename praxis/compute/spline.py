@@ -0,0 +1,208 @@
+"""
+Catmull-Rom path smoothing, computed in-process.
+
+Matches `/api/v1/simulate/navigation/smooth`: each segment p1 -> p2 of a
+path is the uniform Catmull-Rom cubic through p0, p1, p2, p3 (the end
+points are repeated at either end), sampled at t = 0, 1/density, ...,
+(density - 1)/density, followed by the last point of the path. Results
+agree with the server's to within 1e-9 per coordinate (floating-point
+rounding).
+
+With a `tolerance`, flat segments get fewer samples: each segment gets
+the fewest (at most `density`) that keep the polyline within
+`tolerance` of the curve.
+
+Whole batches of paths are evaluated as array operations with NumPy
+when it is installed, with a pure-Python fallback.
+"""
+import math
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numpy
+    np = None  # type: ignore[assignment]
+
+
+def catmull_rom(path: Any, density: int = 5, tolerance: float | None = None) -> Any:
+    """
+    Smooth one path of points (any dimension). Returns a list of lists,
+    or an (M, D) array when `path` is a NumPy array.
+    """
+    return catmull_rom_batch([path], density, tolerance)[0]
+
+
+def catmull_rom_batch(paths: Any, density: int = 5, tolerance: float | None = None) -> Any:
+    """
+    Smooth many paths at once. `paths` is a sequence of paths or a
+    (B, N, D) array; the result is a list with one smoothed path each,
+    or a (B, M, D) array for array input without `tolerance`.
+    """
+    if isinstance(density, bool) or not isinstance(density, int) or density < 1:
+        raise ValueError("density must be an integer >= 1")
+    if tolerance is not None and not tolerance > 0:
+        raise ValueError("tolerance must be > 0")
+
+    stacked = np is not None and isinstance(paths, np.ndarray)
+    if stacked and paths.ndim != 3:
+        raise ValueError(f"a path array batch must have shape (B, N, D), got {paths.shape}")
+
+    arrays = [np is not None and isinstance(path, np.ndarray) for path in paths]
+    points = [_points(path, f"paths[{i}]") for i, path in enumerate(paths)]
+
+    if np is None:
+        smoothed = [_smooth(path, density, tolerance) for path in points]
+    else:
+        smoothed = _smooth_arrays(points, density, tolerance)
+        if stacked and tolerance is None:
+            if not smoothed:
+                n = paths.shape[1]
+                return np.empty((0, (n - 1) * density + 1 if n else 0, paths.shape[2]))
+            return np.stack(smoothed)
+        smoothed = [
+            out if array else out.tolist() for out, array in zip(smoothed, arrays, strict=True)
+        ]
+    return smoothed
+
+
+def _points(path: Any, where: str) -> Any:
+    if np is not None:
+        try:
+            array = np.asarray(path, dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError(f"{where} must be a sequence of points of numbers of equal dimension") from None
+        if array.size and array.ndim != 2:
+            raise ValueError(f"{where} must have shape (N, D), got {array.shape}")
+        return array
+
+    points = []
+    for index, point in enumerate(path):
+        if not isinstance(point, Sequence) or isinstance(point, str):
+            raise ValueError(f"{where}[{index}] must be a sequence of numbers")
+        try:
+            points.append([float(v) for v in point])
+        except (TypeError, ValueError):
+            raise ValueError(f"{where}[{index}] must contain numbers") from None
+    if any(len(point) != len(points[0]) for point in points):
+        raise ValueError(f"all points of {where} must have the same dimension")
+    return points
+
+
+# Pure Python
+
+
+def _smooth(points: list[list[float]], density: int, tolerance: float | None) -> list[list[float]]:
+    if len(points) < 2:
+        return [list(p) for p in points]
+
+    padded = [points[0]] + points + [points[-1]]
+    out = []
+    for s in range(len(points) - 1):
+        p0, p1, p2, p3 = padded[s:s + 4]
+        k = density if tolerance is None else _samples(_bend(p0, p1, p2, p3), density, tolerance)
+        for j in range(k):
+            w0, w1, w2, w3 = _weights(j / k)
+            out.append([
+                w0 * a + w1 * b + w2 * c + w3 * d
+                for a, b, c, d in zip(p0, p1, p2, p3, strict=True)
+            ])
+    out.append(list(points[-1]))
+    return out
+
+
+def _weights(t: float) -> tuple[float, float, float, float]:
+    t2, t3 = t * t, t * t * t
+    return (
+        0.5 * (-t + 2.0 * t2 - t3),
+        0.5 * (2.0 - 5.0 * t2 + 3.0 * t3),
+        0.5 * (t + 4.0 * t2 - 3.0 * t3),
+        0.5 * (t3 - t2),
+    )
+
+
+def _bend(p0: list[float], p1: list[float], p2: list[float], p3: list[float]) -> float:
+    """
+    Largest second difference of the segment's Bezier control points;
+    the curve's second derivative is at most 6 times this.
+    """
+    b1 = [b + (c - a) / 6.0 for a, b, c in zip(p0, p1, p2, strict=True)]
+    b2 = [c - (d - b) / 6.0 for b, c, d in zip(p1, p2, p3, strict=True)]
+    d1 = math.hypot(*(a - 2.0 * b + c for a, b, c in zip(p1, b1, b2, strict=True)))
+    d2 = math.hypot(*(a - 2.0 * b + c for a, b, c in zip(b1, b2, p2, strict=True)))
+    return max(d1, d2)
+
+
+def _samples(bend: float, density: int, tolerance: float) -> int:
+    # A chord over 1/k of the parameter range strays at most
+    # max|C''| / (8 k^2) <= 3 * bend / (4 k^2) from the curve.
+    return min(density, max(1, math.ceil(math.sqrt(0.75 * bend / tolerance))))
+
+
+# NumPy
+
+
+def _smooth_arrays(paths: list[Any], density: int, tolerance: float | None) -> list[Any]:
+    dim = next((a.shape[1] for a in paths if a.size), 2)
+    if any(a.size and a.shape[1] != dim for a in paths):
+        raise ValueError("all paths must have points of the same dimension")
+    arrays = [a if a.size else np.empty((0, dim)) for a in paths]
+
+    lengths = np.array([len(a) for a in arrays], dtype=int)
+    segments = np.maximum(lengths - 1, 0)
+
+    # Each path padded with its end points repeated; segment s of a path
+    # uses rows s..s+3 of its padded block.
+    padded = np.concatenate(
+        [np.concatenate([a[:1], a, a[-1:]]) for a in arrays if len(a) >= 2] or [np.empty((0, dim))]
+    )
+    blocks = lengths[lengths >= 2] + 2
+    first = np.repeat(np.cumsum(blocks) - blocks, segments[lengths >= 2])
+    first += _ranges(segments[lengths >= 2])
+    control = padded[first[:, None] + np.arange(4)]  # (S, 4, D)
+
+    if tolerance is None:
+        k = np.full(len(control), density, dtype=int)
+    else:
+        p0, p1, p2, p3 = control[:, 0], control[:, 1], control[:, 2], control[:, 3]
+        b1 = p1 + (p2 - p0) / 6.0
+        b2 = p2 - (p3 - p1) / 6.0
+        bend = np.maximum(
+            np.linalg.norm(p1 - 2.0 * b1 + b2, axis=1),
+            np.linalg.norm(b1 - 2.0 * b2 + p2, axis=1),
+        )
+        k = np.clip(np.ceil(np.sqrt(0.75 * bend / tolerance)), 1, density).astype(int)
+
+    # One row per output sample: its segment and parameter t.
+    segment = np.repeat(np.arange(len(control)), k)
+    t = _ranges(k) / np.repeat(k, k)
+    t2, t3 = t * t, t * t * t
+    weights = 0.5 * np.stack(
+        [-t + 2.0 * t2 - t3, 2.0 - 5.0 * t2 + 3.0 * t3, t + 4.0 * t2 - 3.0 * t3, t3 - t2],
+        axis=1,
+    )
+    samples = np.einsum("sk,skd->sd", weights, control[segment])
+
+    # Split the samples by path and close each with its last point.
+    per_path = np.zeros(len(arrays), dtype=int)
+    owner = np.repeat(np.arange(len(arrays)), segments)
+    np.add.at(per_path, owner, k)
+    bounds = np.cumsum(per_path)
+
+    out = []
+    for i, a in enumerate(arrays):
+        if len(a) < 2:
+            out.append(a.copy())
+            continue
+        out.append(np.concatenate([samples[bounds[i] - per_path[i]:bounds[i]], a[-1:]]))
+    return out
+
+
+def _ranges(counts: Any) -> Any:
+    """
+    Concatenated aranges: [0..counts[0]), [0..counts[1]), ...
+    """
+    total = int(counts.sum())
+    if not total:
+        return np.zeros(0, dtype=int)
+    return np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
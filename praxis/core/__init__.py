@@ -1,4 +1,23 @@
-from .config import Config
-from .http import HttpClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_LAZY = {
+    "Config": "praxis.core.config",
+    "HttpClient": "praxis.core.http",
+}
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .http import HttpClient
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module 'praxis.core' has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["Config", "HttpClient"]
@@ -0,0 +1,251 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from praxis.core.cache import ResultCache
+from praxis.core.coalesce import SingleFlight
+from praxis.core.compression import Compression
+from praxis.core.config import Config
+from praxis.core.hooks import Hooks, RequestTimer
+from praxis.core.http import BaseHttpClient
+from praxis.core.ratelimit import RateLimiter
+from praxis.core.resilience import CircuitBreaker, HedgePolicy
+from praxis.core.retries import RetryPolicy
+from praxis.core.upload import ImageSource, MultipartBody, open_image
+from praxis.exceptions import APIError
+from praxis.models.response import Response
+
+if TYPE_CHECKING:
+    from praxis.core.disk_cache import DiskCache
+    from praxis.core.grids import GridTransport
+    from praxis.core.path_cache import PathCache
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    Non-blocking counterpart of `HttpClient`.
+
+    All coroutines share one `httpx.AsyncClient` connection pool,
+    so a single event loop can keep many requests in flight.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        cache: ResultCache | None = None,
+        disk_cache: "DiskCache | None" = None,
+        coalescer: SingleFlight | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedge: HedgePolicy | None = None,
+        compression: Compression | None = None,
+        hooks: Hooks | None = None,
+        rate_limiter: RateLimiter | None = None,
+        grid_transport: "GridTransport | None" = None,
+        path_cache: "PathCache | None" = None,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncClient requires httpx. "
+                "Install it with: pip install 'praxis-sdk[async]'"
+            )
+
+        super().__init__(
+            config,
+            cache=cache,
+            disk_cache=disk_cache,
+            coalescer=coalescer,
+            retry_policy=retry_policy,
+            breaker=breaker,
+            hedge=hedge,
+            compression=compression,
+            hooks=hooks,
+            rate_limiter=rate_limiter,
+            grid_transport=grid_transport,
+            path_cache=path_cache,
+        )
+
+        self._client = httpx.AsyncClient(
+            headers=self._headers(),
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=config.pool_connections * config.pool_maxsize,
+                max_keepalive_connections=config.pool_maxsize,
+                keepalive_expiry=config.idle_timeout,
+            ),
+        )
+
+    async def post(self, path: str, json: dict[str, Any]) -> Response[Any]:
+        key, cached = self._cache_lookup(path, json)
+        if cached is not None:
+            return cached
+
+        body, headers = self._encode_body(path, json)
+
+        async def _post() -> Response[Any]:
+            response, size = await self._request(
+                "POST", path, content=body, headers=headers
+            )
+            self._cache_store(path, key, response, size)
+            return response
+
+        flight_key = self._flight_key(path, json, key)
+        if flight_key is None or self._coalescer is None:
+            return await _post()
+
+        shared: Response[Any] = await self._coalescer.do_async(flight_key, _post)
+        return shared
+
+    async def upload(
+        self, path: str, fields: dict[str, Any], image: ImageSource
+    ) -> Response[Any]:
+        """
+        POST `fields` and the raw bytes of `image` as multipart/form-data.
+        """
+        with open_image(image) as data:
+            body = MultipartBody(fields, "image", data)
+
+            async def _post() -> Response[Any]:
+                response, _ = await self._request(
+                    "POST", path, content=body.stream_async(), headers=body.headers
+                )
+                return response
+
+            flight_key = self._upload_key(path, fields, data)
+            if flight_key is None or self._coalescer is None:
+                return await _post()
+
+            shared: Response[Any] = await self._coalescer.do_async(flight_key, _post)
+            return shared
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Response[Any]:
+        response, _ = await self._request("GET", path, params=params)
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        await self._client.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    async def _request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> tuple[Response[Any], int]:
+        url = self._url(path)
+
+        if self._client.is_closed:
+            raise ValueError("AsyncHttpClient is closed")
+
+        trace = self._trace_start(method, path, kwargs)
+
+        async def _send() -> tuple[Response[Any], int, RequestTimer, int]:
+            if self._limiter is not None:
+                await self._limiter.acquire_async(path)
+
+            timer = RequestTimer()
+            extensions = None
+            if trace is not None:
+                async def on_trace(name: str, info: Any) -> None:
+                    timer.observe(name)
+
+                extensions = {"trace": on_trace}
+
+            try:
+                resp = await self._client.request(
+                    method, url, extensions=extensions, **kwargs
+                )
+            except httpx.HTTPError as exc:
+                raise APIError(f"Network error: {exc}") from exc
+
+            timer.lap()
+            self._record_transfer(path, resp)
+            try:
+                response = self._handle_response(resp, timer)
+            except APIError as exc:
+                self._rate_limited(path, exc)
+                raise
+
+            return response, len(resp.content), timer, resp.status_code
+
+        async def _attempt() -> Any:
+            return await self._guarded(path, lambda: self._hedged(path, _send))
+
+        try:
+            response, size, timer, status = await self._retry.call_async(
+                _attempt, on_retry=self._trace_retry(trace)
+            )
+        except Exception as exc:
+            self._trace_error(trace, exc)
+            raise
+
+        self._trace_end(trace, response, size, timer, status)
+        return response, size
+
+    async def _guarded(self, path: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        breaker = self._breaker_for(path)
+        if breaker is None:
+            return await fn()
+
+        breaker.before(path)
+        try:
+            result = await fn()
+        except Exception as exc:
+            breaker.record(path, exc)
+            raise
+
+        breaker.record(path)
+        return result
+
+    async def _hedged(self, path: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        policy = self._hedge_for(path)
+        if policy is None:
+            return await send()
+
+        start = time.monotonic()
+        delay = policy.delay(path)
+
+        if delay is None:
+            result = await send()
+            policy.observe(path, time.monotonic() - start)
+            return result
+
+        primary = asyncio.ensure_future(send())
+        pending = {primary}
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                result = primary.result()
+                policy.observe(path, time.monotonic() - start)
+                return result
+
+            # Primary is slow: race a duplicate and cancel the loser.
+            hedge = asyncio.ensure_future(send())
+            pending.add(hedge)
+            error: BaseException | None = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        policy.record_hedge(won=task is hedge)
+                        policy.observe(path, time.monotonic() - start)
+                        return task.result()
+                    error = task.exception()
+
+            policy.record_hedge(won=False)
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
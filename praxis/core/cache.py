@@ -0,0 +1,167 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from praxis.core.endpoints import DETERMINISTIC_ENDPOINTS
+from praxis.models.envelope import Envelope
+from praxis.models.response import Response
+
+
+def cache_key(path: str, payload: dict[str, Any] | None) -> str:
+    """
+    Canonical hash of a request.
+
+    Keys are stable across processes and machines: dict ordering and
+    whitespace never change the key.
+    """
+    canonical = json.dumps(
+        [path, payload],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def envelope_to_bytes(envelope: Envelope) -> bytes:
+    return json.dumps(
+        {
+            "success": envelope.success,
+            "data": envelope.data,
+            "error": envelope.error,
+            "message": envelope.message,
+            "cost": envelope.cost,
+            "request_id": envelope.request_id,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def envelope_from_bytes(raw: bytes) -> Envelope:
+    return Envelope(**json.loads(raw))
+
+
+def _detached(envelope: Envelope) -> Envelope:
+    """
+    Copy of `envelope` whose `data` shares no dicts or lists with it, so
+    that callers mutating a response never change a cached entry.
+    """
+    return replace(envelope, data=_copy_json(envelope.data))
+
+
+def _copy_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """
+    Thread-safe in-memory LRU cache of responses for deterministic endpoints.
+
+    Bounded by entry count and by the total size of the cached
+    response bodies. Cached responses keep the `request_id` and `cost`
+    of the call that produced them. Entries are copied on the way in and
+    out, so mutating a response's `data` never affects later hits.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float | None = None,
+        endpoints: Iterable[str] = DETERMINISTIC_ENDPOINTS,
+    ):
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be >= 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.endpoints = frozenset(endpoints)
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Envelope, int, float | None]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def enabled_for(self, path: str) -> bool:
+        return path in self.endpoints
+
+    def get(self, key: str) -> Response[Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                self._drop(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        return Response(_detached(entry[0]), cached=True)
+
+    def put(self, key: str, response: Response[Any], size: int) -> None:
+        if size > self.max_bytes:
+            return
+
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        envelope = _detached(response.envelope)
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = (envelope, size, expires)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _drop(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from praxis.core.endpoints import COALESCIBLE_ENDPOINTS
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+@dataclass(frozen=True)
+class CoalesceStats:
+    calls: int
+    executed: int
+    collapsed: int
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical requests into one.
+
+    The first caller for a key executes the request; callers arriving
+    with the same key while it is in flight wait for it and share its
+    `Response` (or its exception). Nothing is kept once the call
+    completes — see `ResultCache` for reuse over time.
+    """
+
+    def __init__(self, endpoints: Iterable[str] = COALESCIBLE_ENDPOINTS):
+        self.endpoints = frozenset(endpoints)
+
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[tuple[int, str], asyncio.Future[Any]] = {}
+        self._calls = 0
+        self._executed = 0
+
+    def enabled_for(self, path: str) -> bool:
+        return path in self.endpoints
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._executed += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        return flight.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Imported here so sync-only processes never load asyncio.
+        import asyncio
+
+        # Tasks are bound to their event loop, so flights are too.
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        def _land(_: asyncio.Future[Any]) -> None:
+            with self._lock:
+                del self._async_flights[flight_key]
+
+        with self._lock:
+            self._calls += 1
+            task = self._async_flights.get(flight_key)
+            if task is None:
+                # The call runs as its own task and every caller waits on
+                # it through a shield, so a caller being cancelled does
+                # not cancel the call for the others.
+                task = self._async_flights[flight_key] = asyncio.ensure_future(fn())
+                task.add_done_callback(_land)
+                self._executed += 1
+
+        return await asyncio.shield(task)
+
+    @property
+    def stats(self) -> CoalesceStats:
+        with self._lock:
+            return CoalesceStats(
+                calls=self._calls,
+                executed=self._executed,
+                collapsed=self._calls - self._executed,
+            )
@@ -0,0 +1,99 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+class JsonCodec:
+    """
+    Standard library JSON codec. Always available.
+    """
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonCodec:
+    """
+    orjson-backed codec. NumPy arrays are serialized natively and
+    non-string dict keys are stringified like the standard library does.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=self._options)
+
+    def decode(self, raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+
+class MsgspecCodec:
+    """
+    msgspec-backed codec.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        raw: bytes = self._encoder.encode(obj)
+        return raw
+
+    def decode(self, raw: bytes) -> Any:
+        return self._decoder.decode(raw)
+
+
+_CODECS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def get_codec(codec: Any = "auto") -> Any:
+    """
+    Resolve a codec by name, or return a codec object unchanged.
+
+    "auto" picks the fastest installed codec: orjson, then msgspec,
+    then the standard library.
+    """
+    if not isinstance(codec, str):
+        return codec
+
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JsonCodec()
+
+    try:
+        return _CODECS[codec]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown codec {codec!r}. Expected one of: auto, {', '.join(_CODECS)}"
+        ) from None
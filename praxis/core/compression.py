@@ -0,0 +1,143 @@
+import gzip
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    requests: int
+    compressed: int
+    raw_bytes: int
+    sent_bytes: int
+    response_wire_bytes: int
+    response_bytes: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return (self.raw_bytes - self.sent_bytes) + (
+            self.response_bytes - self.response_wire_bytes
+        )
+
+
+class _Counters:
+    __slots__ = (
+        "requests",
+        "compressed",
+        "raw_bytes",
+        "sent_bytes",
+        "response_wire_bytes",
+        "response_bytes",
+    )
+
+    requests: int
+    compressed: int
+    raw_bytes: int
+    sent_bytes: int
+    response_wire_bytes: int
+    response_bytes: int
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def freeze(self) -> CompressionStats:
+        return CompressionStats(**{name: getattr(self, name) for name in self.__slots__})
+
+
+class Compression:
+    """
+    Opt-in request body compression.
+
+    Bodies of at least `threshold` bytes are compressed with `algorithm`
+    ("gzip", or "zstd" when `zstandard` is installed) and sent with a
+    matching `Content-Encoding`. Compressed responses are advertised via
+    `Accept-Encoding`. Per-endpoint stats track bytes saved both ways.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = "gzip",
+        threshold: int = 8 * 1024,
+        level: int | None = None,
+        endpoints: Iterable[str] | None = None,
+    ):
+        if algorithm == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstd compression requires zstandard. "
+                "Install it with: pip install zstandard"
+            )
+        if algorithm not in ("gzip", "zstd"):
+            raise ValueError("algorithm must be 'gzip' or 'zstd'")
+
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+
+        self._lock = threading.Lock()
+        self._stats: dict[str, _Counters] = {}
+        self._local = threading.local()
+
+    @property
+    def accept_encoding(self) -> str:
+        if zstandard is not None:
+            return "zstd, gzip, deflate"
+        return "gzip, deflate"
+
+    def compress(self, path: str, body: bytes) -> tuple[bytes, str | None]:
+        """
+        Returns the body to send and its `Content-Encoding` (None if sent as is).
+        """
+        raw = len(body)
+        encoding = None
+
+        if raw >= self.threshold and (self.endpoints is None or path in self.endpoints):
+            if self.algorithm == "zstd":
+                packed = self._zstd().compress(body)
+            else:
+                packed = gzip.compress(body, compresslevel=self.level or 6, mtime=0)
+
+            # Incompressible payloads (e.g. already-encoded images) go as is.
+            if len(packed) < raw:
+                body, encoding = packed, self.algorithm
+
+        with self._lock:
+            counters = self._counters(path)
+            counters.requests += 1
+            counters.raw_bytes += raw
+            counters.sent_bytes += len(body)
+            if encoding is not None:
+                counters.compressed += 1
+
+        return body, encoding
+
+    def record_response(self, path: str, wire_bytes: int, body_bytes: int) -> None:
+        with self._lock:
+            counters = self._counters(path)
+            counters.response_wire_bytes += wire_bytes
+            counters.response_bytes += body_bytes
+
+    @property
+    def stats(self) -> dict[str, CompressionStats]:
+        with self._lock:
+            return {path: counters.freeze() for path, counters in self._stats.items()}
+
+    def _counters(self, path: str) -> _Counters:
+        counters = self._stats.get(path)
+        if counters is None:
+            counters = self._stats[path] = _Counters()
+        return counters
+
+    def _zstd(self) -> Any:
+        # zstandard compressors are not thread-safe: one per thread.
+        compressor = getattr(self._local, "zstd", None)
+        if compressor is None:
+            compressor = self._local.zstd = zstandard.ZstdCompressor(level=self.level or 3)
+        return compressor
@@ -1,4 +1,21 @@
 import os
+from typing import Any
+
+from praxis.core.codec import get_codec
+
+EXECUTION_MODES = ("remote", "local", "auto")
+
+
+def resolve_execution(http: Any, execution: str | None = None) -> str:
+    """
+    `execution` if given, else the transport's setting; validated.
+    """
+    execution = execution or getattr(http, "execution", "remote")
+    if execution not in EXECUTION_MODES:
+        raise ValueError(
+            f"execution must be one of {', '.join(EXECUTION_MODES)}, got {execution!r}"
+        )
+    return execution
 
 
 class Config:
@@ -7,6 +24,12 @@ class Config:
         api_key: str | None = None,
         base_url: str | None = None,
         timeout: float = 10.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: float | None = 60.0,
+        keep_alive: bool = True,
+        codec: Any = "auto",
+        execution: str = "remote",
     ):
         self.api_key = api_key or os.getenv("PRAXIS_API_KEY")
         if not self.api_key:
@@ -21,3 +44,18 @@ class Config:
         ).rstrip("/")
 
         self.timeout = timeout
+
+        # Connection pooling
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be >= 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.keep_alive = keep_alive
+
+        # JSON codec used for request bodies and responses
+        self.codec = get_codec(codec)
+
+        # Where closed-form endpoints (e.g. physics) are computed
+        self.execution = resolve_execution(None, execution)
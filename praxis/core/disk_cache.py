@@ -0,0 +1,231 @@
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from praxis.core.cache import CacheStats, envelope_from_bytes, envelope_to_bytes
+from praxis.core.endpoints import DETERMINISTIC_ENDPOINTS
+from praxis.models.response import Response
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    envelope BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_created ON entries (created);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('bytes', 0);
+"""
+
+# Access times are only rewritten when older than this, so hot
+# entries do not turn every read into a write.
+_TOUCH_INTERVAL = 60.0
+
+
+class DiskCache:
+    """
+    Persistent result cache shared by every process on a host.
+
+    Entries are content-addressed by the request hash (`cache_key`)
+    and stored in a SQLite database in WAL mode, which allows
+    concurrent readers alongside a single writer across processes.
+    Entries older than `max_age` seconds are dropped, and the least
+    recently used entries are evicted once the stored bodies exceed
+    `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: float | None = None,
+        endpoints: Iterable[str] = DETERMINISTIC_ENDPOINTS,
+        busy_timeout: float = 5.0,
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.endpoints = frozenset(endpoints)
+        self._busy_timeout = busy_timeout
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+
+    def enabled_for(self, path: str) -> bool:
+        return path in self.endpoints
+
+    def get(self, key: str) -> Response[Any] | None:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT envelope, created, accessed FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        now = time.time()
+
+        if row is not None and self.max_age is not None and row[1] < now - self.max_age:
+            with self._transaction(conn):
+                self._delete(conn, [key])
+            row = None
+
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        if row[2] < now - _TOUCH_INTERVAL:
+            conn.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                (now, key),
+            )
+
+        return Response(envelope_from_bytes(row[0]), cached=True)
+
+    def put(self, key: str, response: Response[Any], size: int) -> None:
+        # Size bounds apply to what is stored on disk, so the
+        # transferred body size passed by the caller is not used.
+        blob = envelope_to_bytes(response.envelope)
+        size = len(blob)
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        conn = self._connection()
+
+        with self._transaction(conn):
+            self._delete(conn, [key])
+            conn.execute(
+                "INSERT INTO entries (key, envelope, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, blob, size, now, now),
+            )
+            conn.execute(
+                "UPDATE meta SET value = value + ? WHERE name = 'bytes'",
+                (size,),
+            )
+            evicted = self._evict(conn, now)
+
+        if evicted:
+            with self._lock:
+                self._evictions += evicted
+
+    def clear(self) -> None:
+        conn = self._connection()
+        with self._transaction(conn):
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE meta SET value = 0 WHERE name = 'bytes'")
+
+    @property
+    def stats(self) -> CacheStats:
+        conn = self._connection()
+        entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        stored = conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=entries,
+                bytes=stored,
+            )
+
+    def close(self) -> None:
+        """
+        Close this thread's database connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections must not cross threads or a fork().
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> Iterator[None]:
+        # BEGIN IMMEDIATE serializes writers across processes, so the
+        # byte counter in `meta` always matches the stored entries.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _delete(self, conn: sqlite3.Connection, keys: list[str]) -> None:
+        for key in keys:
+            row = conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.execute(
+                    "UPDATE meta SET value = value - ? WHERE name = 'bytes'",
+                    (row[0],),
+                )
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        evicted = 0
+
+        if self.max_age is not None:
+            expired = conn.execute(
+                "SELECT key FROM entries WHERE created < ?",
+                (now - self.max_age,),
+            ).fetchall()
+            self._delete(conn, [k for (k,) in expired])
+            evicted += len(expired)
+
+        stored = conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+        while stored > self.max_bytes:
+            oldest = conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT 64"
+            ).fetchall()
+            if not oldest:
+                break
+
+            for key, size in oldest:
+                if stored <= self.max_bytes:
+                    break
+                self._delete(conn, [key])
+                stored -= size
+                evicted += 1
+
+        return evicted
@@ -0,0 +1,32 @@
+"""
+Endpoint classification shared by the transport layer.
+"""
+
+# Endpoints documented as "Guarantee: Deterministic":
+# the same payload always produces the same result.
+DETERMINISTIC_ENDPOINTS = frozenset(
+    {
+        "/api/v1/physics/force",
+        "/api/v1/physics/mass",
+        "/api/v1/physics/stability",
+        "/api/v1/physics/stability/composite",
+        "/api/v1/physics/collision",
+        "/api/v1/physics/collision/sphere",
+        "/api/v1/physics/collision/obb",
+        "/api/v1/physics/resistance",
+        "/api/v1/physics/leverage",
+        "/api/v1/physics/grip-requirement",
+        "/api/v1/simulate/navigation",
+        "/api/v1/simulate/navigation/smooth",
+    }
+)
+
+# Endpoints where concurrent identical requests may safely share a
+# single in-flight call: deterministic endpoints plus vision analysis,
+# which is a pure function of the submitted frame.
+COALESCIBLE_ENDPOINTS = DETERMINISTIC_ENDPOINTS | frozenset(
+    {
+        "/api/v1/vision/analyze",
+        "/api/v1/vision/segment",
+    }
+)
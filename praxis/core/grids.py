@@ -0,0 +1,248 @@
+import base64
+import inspect
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Generator
+from dataclasses import dataclass
+from typing import Any
+
+from praxis.exceptions import APIError, PraxisError, ValidationError
+from praxis.models.grid import OccupancyGrid, as_grid
+
+ENCODINGS = ("auto", "rle", "bitpack", "json")
+
+# Statuses with which a server that does not understand a grid form
+# (unknown encoding, unknown or expired reference) rejects the request.
+# Apart from 415, a rejection only counts if its message names one of
+# the grid fields, so unrelated client errors are raised right away.
+_REJECTED_STATUSES = frozenset({400, 404, 409, 415, 422})
+_REJECTED_MESSAGE = re.compile(r"\b(grid(_ref|_patch|_hash)?|encoding|reference)\b", re.IGNORECASE)
+
+# (kind, payload or None for nested lists, encoded size, base reference)
+_Attempt = tuple[str, dict[str, Any] | None, int, str | None]
+
+
+@dataclass(frozen=True)
+class GridTransportStats:
+    requests: int
+    references: int
+    patches: int
+    inline: int
+    plain: int
+    rejected: int
+    cells: int
+    encoded_bytes: int
+
+    @property
+    def bytes_saved(self) -> int:
+        """
+        Estimated savings over nested-list JSON (~2 bytes per cell).
+        """
+        return 2 * self.cells - self.encoded_bytes
+
+
+class GridTransport:
+    """
+    Compact wire format for occupancy grids.
+
+    Grids are sent run-length encoded (`"rle"`) or bit-packed and base64
+    encoded (`"bitpack"`); `"auto"` picks the smaller of the two per
+    grid. With `references=True` each grid is also tagged with its
+    SHA-256, and later requests send only the hash (same grid) or the
+    hash of the previous grid plus the changed cells (up to
+    `max_patch_cells`).
+
+    Every compact form falls back to the next one (reference/patch ->
+    inline encoding -> nested lists) when the server rejects it (status
+    415, or an error naming a grid field), so servers without support
+    keep working; other errors are raised at once. Once the server has
+    rejected an encoding that plain lists then got through, it is not
+    tried again.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "auto",
+        references: bool = True,
+        max_patch_cells: int = 4096,
+        max_refs: int = 32,
+    ):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"encoding must be one of {', '.join(ENCODINGS)}, got {encoding!r}")
+        if max_patch_cells < 0 or max_refs < 1:
+            raise ValueError("max_patch_cells must be >= 0 and max_refs >= 1")
+
+        self.encoding = encoding
+        self.references = references
+        self.max_patch_cells = max_patch_cells
+        self.max_refs = max_refs
+        # None until the server has accepted or rejected a compact grid.
+        self.supported: bool | None = None
+
+        self._lock = threading.Lock()
+        self._known: OrderedDict[str, None] = OrderedDict()
+        self._last: tuple[str, OccupancyGrid] | None = None
+        self._counts = dict.fromkeys(
+            ("requests", "references", "patches", "inline", "plain", "rejected", "cells", "encoded_bytes"),
+            0,
+        )
+
+    @property
+    def stats(self) -> GridTransportStats:
+        with self._lock:
+            return GridTransportStats(**self._counts)
+
+    def forget(self) -> None:
+        """
+        Drop all grid references, e.g. after the server restarted.
+        """
+        with self._lock:
+            self._known.clear()
+            self._last = None
+
+    def post(self, http: Any, path: str, grid: Any, fields: dict[str, Any]) -> Any:
+        """
+        POST `fields` plus `grid` in the most compact form the server
+        accepts. Returns an awaitable for async transports.
+        """
+        exchange = self._exchange(as_grid(grid), fields)
+        payload = next(exchange)
+        while True:
+            try:
+                result = http.post(path, json=payload)
+            except PraxisError as exc:
+                payload = exchange.throw(exc)
+                continue
+
+            if inspect.isawaitable(result):
+                return self._post_async(http, path, exchange, result)
+            try:
+                exchange.send(result)
+            except StopIteration as stop:
+                return stop.value
+
+    async def _post_async(self, http: Any, path: str, exchange: Generator[dict[str, Any], Any, Any], pending: Any) -> Any:
+        while True:
+            try:
+                result = await pending
+            except PraxisError as exc:
+                payload = exchange.throw(exc)
+            else:
+                try:
+                    exchange.send(result)
+                except StopIteration as stop:
+                    return stop.value
+            pending = http.post(path, json=payload)
+
+    # Negotiation
+
+    def _exchange(self, grid: OccupancyGrid, fields: dict[str, Any]) -> Generator[dict[str, Any], Any, Any]:
+        """
+        Yields payloads to try in order; receives the response of the
+        accepted one, or the rejection of the previous one via throw().
+        """
+        sha = grid.sha256() if self.references else None
+        attempts = self._attempts(grid, sha)
+
+        for i, (kind, body, size, base) in enumerate(attempts):
+            if body is None:
+                # Nested lists are only built if every compact form was rejected.
+                body = {"grid": grid.to_rows()}
+            try:
+                response = yield {**body, **fields}
+            except (ValidationError, APIError) as exc:
+                if i == len(attempts) - 1 or not _rejected(exc):
+                    raise
+                self._on_rejected(kind, base)
+                continue
+
+            self._on_accepted(kind, grid, sha, size, attempts[0][0])
+            return response
+
+    def _attempts(self, grid: OccupancyGrid, sha: str | None) -> list[_Attempt]:
+        attempts: list[_Attempt] = []
+        with self._lock:
+            supported = self.supported is not False
+            if sha is not None and supported:
+                if sha in self._known:
+                    self._known.move_to_end(sha)
+                    attempts.append(("reference", {"grid_ref": sha}, len(sha), sha))
+                elif self._last is not None and self._last[1].shape == grid.shape:
+                    base, previous = self._last
+                    cells = previous.diff(grid) if base in self._known else None
+                    if cells is not None and len(cells) <= self.max_patch_cells:
+                        body: dict[str, Any] = {
+                            "grid_ref": base,
+                            "grid_patch": [list(cell) for cell in cells],
+                            "grid_hash": sha,
+                        }
+                        attempts.append(("patch", body, 12 * len(cells) + 2 * len(sha), base))
+
+        if self.encoding != "json" and supported:
+            encoded, size = self._inline(grid)
+            body = {"grid": encoded}
+            if sha is not None:
+                body["grid_hash"] = sha
+            attempts.append(("inline", body, size, None))
+
+        attempts.append(("plain", None, 2 * grid.rows * grid.cols, None))
+        return attempts
+
+    def _inline(self, grid: OccupancyGrid) -> tuple[dict[str, Any], int]:
+        shape = [grid.rows, grid.cols]
+        packed_size = (grid.nbytes + 2) // 3 * 4
+
+        if self.encoding in ("auto", "rle"):
+            first, runs = grid.rle()
+            # Digits plus a separator per run.
+            rle_size = sum(len(str(run)) + 1 for run in runs)
+            if self.encoding == "rle" or rle_size < packed_size:
+                return {"encoding": "rle", "shape": shape, "first": first, "runs": runs}, rle_size
+
+        data = base64.b64encode(grid.data).decode("ascii")
+        return {"encoding": "bitpack", "shape": shape, "data": data}, packed_size
+
+    def _on_rejected(self, kind: str, base: str | None) -> None:
+        with self._lock:
+            self._counts["rejected"] += 1
+            if base is not None:
+                self._known.pop(base, None)
+                if self._last is not None and self._last[0] == base:
+                    self._last = None
+
+    def _on_accepted(self, kind: str, grid: OccupancyGrid, sha: str | None, size: int, first: str) -> None:
+        with self._lock:
+            counts = self._counts
+            counts["requests"] += 1
+            counts[_COUNTERS[kind]] += 1
+            counts["cells"] += grid.rows * grid.cols
+            counts["encoded_bytes"] += size
+
+            if kind == "plain":
+                if first != "plain":
+                    self.supported = False
+                return
+
+            self.supported = True
+            if sha is not None:
+                self._known[sha] = None
+                self._known.move_to_end(sha)
+                while len(self._known) > self.max_refs:
+                    self._known.popitem(last=False)
+                if self._last is None or self._last[0] != sha:
+                    self._last = (sha, grid.copy())
+
+
+_COUNTERS = {"reference": "references", "patch": "patches", "inline": "inline", "plain": "plain"}
+
+
+def _rejected(exc: Exception) -> bool:
+    if isinstance(exc, APIError):
+        if exc.status_code not in _REJECTED_STATUSES:
+            return False
+        if exc.status_code == 415:
+            return True
+    elif not isinstance(exc, ValidationError):
+        return False
+    return _REJECTED_MESSAGE.search(str(exc)) is not None
@@ -0,0 +1,219 @@
+import threading
+import time
+import warnings
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Callable
+
+HOOK_EVENTS = ("before_request", "after_response", "on_retry", "on_error")
+
+
+@dataclass(frozen=True, slots=True)
+class Timings:
+    """
+    Where the time of one request went, in seconds.
+
+    `connect` and `tls` are zero when a pooled connection was reused.
+    `ttfb` runs from sending the request to its response headers, minus
+    connection setup. Phases describe the attempt that produced the
+    result; `total` covers the whole call, retries and backoff included.
+    """
+
+    connect: float = 0.0
+    tls: float = 0.0
+    ttfb: float = 0.0
+    download: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+    total: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RequestEvent:
+    """
+    Payload passed to every hook.
+
+    Fields that are not known yet at the time of the event are None:
+    e.g. `before_request` carries no timings or `request_id`.
+    """
+
+    method: str
+    path: str
+    request_bytes: int
+    response_bytes: int | None = None
+    status_code: int | None = None
+    request_id: str | None = None
+    cost: float | None = None
+    retries: int = 0
+    timings: Timings | None = None
+    error: BaseException | None = None
+    retry_in: float | None = None
+
+
+class RequestTimer:
+    """
+    Collects the phases of a single attempt.
+
+    Phases are measured as laps: each `lap()` returns the time since the
+    previous one.
+    """
+
+    __slots__ = (
+        "start", "connect", "tls", "ttfb", "download", "decode", "validate",
+        "_mark", "_started",
+    )
+
+    def __init__(self) -> None:
+        self.start = self._mark = time.perf_counter()
+        self.connect = 0.0
+        self.tls = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.decode = 0.0
+        self.validate = 0.0
+        self._started: dict[str, float] = {}
+
+    def lap(self) -> float:
+        now = time.perf_counter()
+        elapsed = now - self._mark
+        self._mark = now
+        return elapsed
+
+    def observe(self, name: str) -> None:
+        """
+        Record an httpcore trace event, e.g. "connection.connect_tcp.started".
+        """
+        now = time.perf_counter()
+        phase, _, stage = name.rpartition(".")
+        if stage == "started":
+            self._started[phase] = now
+            return
+        if stage != "complete":
+            return
+
+        elapsed = now - self._started.get(phase, now)
+        if phase == "connection.connect_tcp":
+            self.connect += elapsed
+        elif phase == "connection.start_tls":
+            self.tls += elapsed
+        elif phase.endswith("receive_response_headers"):
+            self.ttfb = now - self.start - self.connect - self.tls
+        elif phase.endswith("receive_response_body"):
+            self.download += elapsed
+
+    def freeze(self, total: float) -> Timings:
+        return Timings(
+            connect=self.connect,
+            tls=self.tls,
+            ttfb=max(0.0, self.ttfb),
+            download=self.download,
+            decode=self.decode,
+            validate=self.validate,
+            total=total,
+        )
+
+
+class CallTrace:
+    """
+    State of one logical call (all of its attempts) while hooks observe it.
+    """
+
+    __slots__ = ("method", "path", "request_bytes", "start", "retries")
+
+    def __init__(self, method: str, path: str, request_bytes: int):
+        self.method = method
+        self.path = path
+        self.request_bytes = request_bytes
+        self.start = time.perf_counter()
+        self.retries = 0
+
+    def event(self, **fields: Any) -> RequestEvent:
+        return RequestEvent(
+            method=self.method,
+            path=self.path,
+            request_bytes=self.request_bytes,
+            retries=self.retries,
+            **fields,
+        )
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+
+class _FunctionHook:
+    def __init__(self, event: str, fn: Callable[[RequestEvent], None]):
+        setattr(self, event, fn)
+
+
+class Hooks:
+    """
+    Listeners notified around every network request.
+
+    A listener is any object defining some of `before_request`,
+    `after_response`, `on_retry` and `on_error`, each called with a
+    `RequestEvent`. Hooks run synchronously on the calling thread (or
+    event loop), so they should be cheap. An exception raised by a hook
+    is turned into a `RuntimeWarning` and never fails the request.
+    """
+
+    def __init__(self, listeners: Iterable[Any] = ()):
+        self._lock = threading.Lock()
+        self._listeners: tuple[Any, ...] = ()
+        for listener in listeners:
+            self.add(listener)
+
+    def add(self, listener: Any) -> Any:
+        if not any(callable(getattr(listener, name, None)) for name in HOOK_EVENTS):
+            raise ValueError(
+                f"Hook listeners must define at least one of: {', '.join(HOOK_EVENTS)}"
+            )
+
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+        return listener
+
+    def on(self, event: str, fn: Callable[[RequestEvent], None]) -> Any:
+        """
+        Register a single function for one event. Returns the listener,
+        which can be passed to `remove`.
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(
+                f"Unknown hook event {event!r}. Expected one of: {', '.join(HOOK_EVENTS)}"
+            )
+
+        return self.add(_FunctionHook(event, fn))
+
+    def remove(self, listener: Any) -> None:
+        with self._lock:
+            self._listeners = tuple(
+                registered for registered in self._listeners if registered is not listener
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self._listeners)
+
+    def __len__(self) -> int:
+        return len(self._listeners)
+
+    def __contains__(self, listener: Any) -> bool:
+        return any(registered is listener for registered in self._listeners)
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        for listener in self._listeners:
+            fn = getattr(listener, name, None)
+            if fn is None:
+                continue
+            try:
+                fn(event)
+            except Exception as exc:
+                warnings.warn(f"praxis {name} hook raised {exc!r}", RuntimeWarning, stacklevel=2)
+
+
+def body_size(body: Any) -> int:
+    if body is None:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return 0
@@ -1,9 +1,27 @@
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from praxis.core.auth import Auth
+from praxis.core.cache import ResultCache, cache_key, envelope_to_bytes
+from praxis.core.coalesce import SingleFlight
+from praxis.core.compression import Compression
 from praxis.core.config import Config
-from praxis.core.retries import retry
+from praxis.core.hooks import CallTrace, Hooks, RequestTimer, body_size
+from praxis.core.ratelimit import RateLimiter
+from praxis.core.resilience import CircuitBreaker, HedgePolicy
+from praxis.core.retries import RetryPolicy, parse_retry_after
 from praxis.core.serializer import Serializer
+from praxis.core.upload import ImageData, ImageSource, MultipartBody, open_image
 
 from praxis.exceptions import (
     APIError,
@@ -11,87 +29,342 @@ from praxis.exceptions import (
     PaymentError,
     ExecutionError,
 )
-from praxis.models.envelope import Envelope
 from praxis.models.response import Response
 
+if TYPE_CHECKING:
+    from praxis.core.disk_cache import DiskCache
+    from praxis.core.grids import GridTransport
+    from praxis.core.path_cache import PathCache
+
+# Timer of the attempt running on this thread, filled in by the
+# connection classes below when a new connection is opened.
+_local = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            timer = getattr(_local, "timer", None)
+            if timer is not None:
+                timer.connect += time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            timer = getattr(_local, "timer", None)
+            if timer is not None:
+                timer.connect += time.perf_counter() - start
+
+    def connect(self) -> None:
+        timer = getattr(_local, "timer", None)
+        start = time.perf_counter()
+        connect_before = timer.connect if timer is not None else 0.0
+        super().connect()
+        if timer is not None:
+            tcp = timer.connect - connect_before
+            timer.tls += time.perf_counter() - start - tcp
 
-class HttpClient:
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class BaseHttpClient:
     """
-    Low-level HTTP client.
-    Handles transport, retries, auth, error mapping,
+    Transport-independent parts of the HTTP clients:
+    URL building, result caching, error mapping
     and response normalization.
+
+    Results of deterministic endpoints are looked up in the in-memory
+    cache first, then in the on-disk cache; disk hits are promoted
+    into memory. On a miss, identical concurrent requests can be
+    collapsed into one by a `SingleFlight`. Every network call is
+    reported to `hooks`.
     """
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        cache: ResultCache | None = None,
+        disk_cache: "DiskCache | None" = None,
+        coalescer: SingleFlight | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedge: HedgePolicy | None = None,
+        compression: Compression | None = None,
+        hooks: Hooks | None = None,
+        rate_limiter: RateLimiter | None = None,
+        grid_transport: "GridTransport | None" = None,
+        path_cache: "PathCache | None" = None,
+    ):
         self._config = config
         self._auth = Auth(config)
+        self._cache = cache
+        self._disk_cache = disk_cache
+        self._coalescer = coalescer
+        self._retry = retry_policy or RetryPolicy()
+        self._breaker = breaker
+        self._hedge = hedge
+        self._compression = compression
+        self._hooks = hooks if hooks is not None else Hooks()
+        self._limiter = rate_limiter
+        self._grid_transport = grid_transport
+        self._path_cache = path_cache
 
-    def post(self, path: str, json: dict) -> Response:
-        if not path.startswith("/"):
-            raise ValueError("API path must start with '/'")
+    @property
+    def cache(self) -> ResultCache | None:
+        return self._cache
 
-        url = f"{self._config.base_url}{path}"
+    @property
+    def disk_cache(self) -> "DiskCache | None":
+        return self._disk_cache
 
-        def _request():
-            try:
-                resp = requests.post(
-                    url,
-                    headers=self._auth.headers(),
-                    json=json,
-                    timeout=self._config.timeout,
-                )
-            except requests.RequestException as exc:
-                raise APIError(f"Network error: {exc}") from exc
+    @property
+    def coalescer(self) -> SingleFlight | None:
+        return self._coalescer
+
+    @property
+    def breaker(self) -> CircuitBreaker | None:
+        return self._breaker
+
+    @property
+    def hedge(self) -> HedgePolicy | None:
+        return self._hedge
+
+    @property
+    def compression(self) -> Compression | None:
+        return self._compression
+
+    @property
+    def grid_transport(self) -> "GridTransport | None":
+        return self._grid_transport
+
+    @property
+    def path_cache(self) -> "PathCache | None":
+        return self._path_cache
+
+    @property
+    def hooks(self) -> Hooks:
+        return self._hooks
+
+    @property
+    def execution(self) -> str:
+        return self._config.execution
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._limiter
+
+    def _rate_limited(self, path: str, exc: APIError) -> None:
+        # A 429 means our quota is spent: hold everyone back, not just
+        # the caller that hit it.
+        if self._limiter is not None and exc.status_code == 429:
+            self._limiter.pause(path, exc.retry_after or 1.0)
 
-            return self._handle_response(resp)
+    # Hooks
 
-        return retry(
-            _request,
-            retries=2,
-            backoff=0.5,
-            retry_on=(APIError,),
+    def _trace_start(
+        self, method: str, path: str, kwargs: dict[str, Any]
+    ) -> CallTrace | None:
+        if not self._hooks:
+            return None
+
+        body = kwargs.get("data", kwargs.get("content"))
+        trace = CallTrace(method, path, body_size(body))
+        self._hooks.emit("before_request", trace.event())
+        return trace
+
+    def _trace_retry(
+        self, trace: CallTrace | None
+    ) -> Callable[[int, BaseException, float], None] | None:
+        if trace is None:
+            return None
+
+        def on_retry(attempt: int, exc: BaseException, wait: float) -> None:
+            trace.retries = attempt
+            self._hooks.emit(
+                "on_retry",
+                trace.event(
+                    status_code=getattr(exc, "status_code", None),
+                    error=exc,
+                    retry_in=wait,
+                ),
+            )
+
+        return on_retry
+
+    def _trace_end(
+        self,
+        trace: CallTrace | None,
+        response: Response[Any],
+        size: int,
+        timer: RequestTimer,
+        status_code: int,
+    ) -> None:
+        if trace is None:
+            return
+
+        self._hooks.emit(
+            "after_response",
+            trace.event(
+                response_bytes=size,
+                status_code=status_code,
+                request_id=response.request_id,
+                cost=response.cost,
+                timings=timer.freeze(trace.elapsed()),
+            ),
+        )
+
+    def _trace_error(self, trace: CallTrace | None, exc: BaseException) -> None:
+        if trace is None:
+            return
+
+        self._hooks.emit(
+            "on_error",
+            trace.event(
+                status_code=getattr(exc, "status_code", None),
+                error=exc,
+            ),
         )
 
-    def get(self, path: str, params: dict = None) -> Response:
+    def _headers(self) -> dict[str, str]:
+        headers = self._auth.headers()
+        headers["Connection"] = "keep-alive" if self._config.keep_alive else "close"
+        if self._compression is not None:
+            headers["Accept-Encoding"] = self._compression.accept_encoding
+        return headers
+
+    def _encode_body(
+        self, path: str, payload: dict[str, Any]
+    ) -> tuple[bytes, dict[str, str] | None]:
+        body = self._config.codec.encode(payload)
+        if self._compression is None:
+            return body, None
+
+        body, encoding = self._compression.compress(path, body)
+        return body, {"Content-Encoding": encoding} if encoding else None
+
+    def _record_transfer(self, path: str, resp: Any) -> None:
+        if self._compression is None:
+            return
+
+        size = len(resp.content)
+        wire = size
+        if resp.headers.get("Content-Encoding") and resp.headers.get("Content-Length"):
+            wire = int(resp.headers["Content-Length"])
+        self._compression.record_response(path, wire, size)
+
+    def _url(self, path: str) -> str:
         if not path.startswith("/"):
             raise ValueError("API path must start with '/'")
 
-        url = f"{self._config.base_url}{path}"
+        return f"{self._config.base_url}{path}"
 
-        def _request():
-            try:
-                resp = requests.get(
-                    url,
-                    headers=self._auth.headers(),
-                    params=params,
-                    timeout=self._config.timeout,
-                )
-            except requests.RequestException as exc:
-                raise APIError(f"Network error: {exc}") from exc
+    def _cache_tiers(self, path: str) -> "list[ResultCache | DiskCache]":
+        return [
+            tier
+            for tier in (self._cache, self._disk_cache)
+            if tier is not None and tier.enabled_for(path)
+        ]
+
+    def _cache_lookup(
+        self, path: str, payload: dict[str, Any]
+    ) -> tuple[str | None, Response[Any] | None]:
+        tiers = self._cache_tiers(path)
+        if not tiers:
+            return None, None
+
+        key = cache_key(path, payload)
+        for i, tier in enumerate(tiers):
+            response = tier.get(key)
+            if response is not None:
+                if i > 0:
+                    size = len(envelope_to_bytes(response.envelope))
+                    for upper in tiers[:i]:
+                        upper.put(key, response, size)
+                return key, response
+
+        return key, None
+
+    def _flight_key(self, path: str, payload: dict[str, Any], key: str | None) -> str | None:
+        if self._coalescer is None or not self._coalescer.enabled_for(path):
+            return None
+
+        return key or cache_key(path, payload)
 
-            return self._handle_response(resp)
+    def _upload_key(self, path: str, fields: dict[str, Any], image: ImageData) -> str | None:
+        if self._coalescer is None or not self._coalescer.enabled_for(path):
+            return None
 
-        return retry(
-            _request,
-            retries=2,
-            backoff=0.5,
-            retry_on=(APIError,),
+        return cache_key(path, {**fields, "image_sha256": image.sha256()})
+
+    def _breaker_for(self, path: str) -> CircuitBreaker | None:
+        if self._breaker is None or not self._breaker.enabled_for(path):
+            return None
+        return self._breaker
+
+    def _hedge_for(self, path: str) -> HedgePolicy | None:
+        if self._hedge is None or not self._hedge.enabled_for(path):
+            return None
+        return self._hedge
+
+    def _cache_store(
+        self, path: str, key: str | None, response: Response[Any], size: int
+    ) -> None:
+        if key is None or not response.success:
+            return
+
+        for tier in self._cache_tiers(path):
+            tier.put(key, response, size)
+
+    def _handle_response(
+        self, resp: Any, timer: RequestTimer | None = None
+    ) -> Response[Any]:
+        status = resp.status_code
+        retry_after = (
+            parse_retry_after(resp.headers.get("Retry-After")) if status >= 400 else None
         )
 
-    def _handle_response(self, resp: requests.Response) -> Response:
         try:
-            payload = resp.json()
+            payload = self._config.codec.decode(resp.content)
         except Exception:
-            raise APIError("Invalid JSON response from server")
+            raise APIError(
+                "Invalid JSON response from server",
+                status_code=status,
+                retry_after=retry_after,
+            )
+
+        if timer is not None:
+            timer.decode = timer.lap()
 
-        if resp.status_code >= 400:
-            self._raise_api_error(payload)
+        if status >= 400:
+            self._raise_api_error(payload, status, retry_after)
 
-        parsed = Serializer.parse_envelope(payload)
-        envelope = Envelope(**parsed)
-        return Response(envelope)
+        response: Response[Any] = Response(Serializer.to_envelope(payload))
+        if timer is not None:
+            timer.validate = timer.lap()
+        return response
+
+    def _raise_api_error(
+        self,
+        payload: Any,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        if not isinstance(payload, dict):
+            payload = {}
 
-    def _raise_api_error(self, payload: dict) -> None:
         error = payload.get("error") or "unknown_error"
         message = payload.get("message") or payload.get("detail") or "Request failed"
 
@@ -104,4 +377,290 @@ class HttpClient:
         if error == "execution_error":
             raise ExecutionError(message)
 
-        raise APIError(message)
+        raise APIError(message, status_code=status_code, retry_after=retry_after)
+
+
+class HttpClient(BaseHttpClient):
+    """
+    Low-level HTTP client.
+    Handles transport, retries, auth, error mapping,
+    and response normalization.
+
+    Connections are kept alive in a thread-safe pool that is shared
+    by every domain API of the owning `Client`. Pools that sit idle
+    for longer than `Config.idle_timeout` are recycled so the server
+    (or a proxy) closing stale sockets never surfaces as an error.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        cache: ResultCache | None = None,
+        disk_cache: "DiskCache | None" = None,
+        coalescer: SingleFlight | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedge: HedgePolicy | None = None,
+        compression: Compression | None = None,
+        hooks: Hooks | None = None,
+        rate_limiter: RateLimiter | None = None,
+        grid_transport: "GridTransport | None" = None,
+        path_cache: "PathCache | None" = None,
+    ):
+        super().__init__(
+            config,
+            cache=cache,
+            disk_cache=disk_cache,
+            coalescer=coalescer,
+            retry_policy=retry_policy,
+            breaker=breaker,
+            hedge=hedge,
+            compression=compression,
+            hooks=hooks,
+            rate_limiter=rate_limiter,
+            grid_transport=grid_transport,
+            path_cache=path_cache,
+        )
+
+        self._lock = threading.Lock()
+        self._session: requests.Session | None = None
+        self._in_flight = 0
+        self._last_used = 0.0
+        self._closed = False
+        self._hedge_pool: ThreadPoolExecutor | None = None
+
+    def post(self, path: str, json: dict[str, Any]) -> Response[Any]:
+        key, cached = self._cache_lookup(path, json)
+        if cached is not None:
+            return cached
+
+        body, headers = self._encode_body(path, json)
+
+        def _post() -> Response[Any]:
+            response, size = self._request("POST", path, data=body, headers=headers)
+            self._cache_store(path, key, response, size)
+            return response
+
+        flight_key = self._flight_key(path, json, key)
+        if flight_key is None or self._coalescer is None:
+            return _post()
+
+        shared: Response[Any] = self._coalescer.do(flight_key, _post)
+        return shared
+
+    def upload(
+        self, path: str, fields: dict[str, Any], image: ImageSource
+    ) -> Response[Any]:
+        """
+        POST `fields` and the raw bytes of `image` as multipart/form-data.
+        """
+        with open_image(image) as data:
+            body = MultipartBody(fields, "image", data)
+
+            def _post() -> Response[Any]:
+                response, _ = self._request("POST", path, data=body, headers=body.headers)
+                return response
+
+            flight_key = self._upload_key(path, fields, data)
+            if flight_key is None or self._coalescer is None:
+                return _post()
+
+            shared: Response[Any] = self._coalescer.do(flight_key, _post)
+            return shared
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Response[Any]:
+        response, _ = self._request("GET", path, params=params)
+        return response
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        The client cannot be used after this call.
+        """
+        with self._lock:
+            self._closed = True
+            session, self._session = self._session, None
+            pool, self._hedge_pool = self._hedge_pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if session is not None:
+            session.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # Transport
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> tuple[Response[Any], int]:
+        url = self._url(path)
+        trace = self._trace_start(method, path, kwargs)
+
+        def _send() -> tuple[Response[Any], int, RequestTimer, int]:
+            if self._limiter is not None:
+                self._limiter.acquire(path)
+
+            timer = _local.timer = RequestTimer()
+            session = self._acquire()
+            try:
+                # Streamed so that headers and body download are timed apart.
+                resp = session.request(
+                    method,
+                    url,
+                    timeout=self._config.timeout,
+                    stream=True,
+                    **kwargs,
+                )
+                timer.ttfb = timer.lap() - timer.connect - timer.tls
+                content = resp.content
+                timer.download = timer.lap()
+            except requests.RequestException as exc:
+                raise APIError(f"Network error: {exc}") from exc
+            finally:
+                _local.timer = None
+                self._release()
+
+            self._record_transfer(path, resp)
+            try:
+                response = self._handle_response(resp, timer)
+            except APIError as exc:
+                self._rate_limited(path, exc)
+                raise
+
+            return response, len(content), timer, resp.status_code
+
+        def _attempt() -> Any:
+            return self._guarded(path, lambda: self._hedged(path, _send))
+
+        try:
+            response, size, timer, status = self._retry.call(
+                _attempt, on_retry=self._trace_retry(trace)
+            )
+        except Exception as exc:
+            self._trace_error(trace, exc)
+            raise
+
+        self._trace_end(trace, response, size, timer, status)
+        return response, size
+
+    def _guarded(self, path: str, fn: Callable[[], Any]) -> Any:
+        breaker = self._breaker_for(path)
+        if breaker is None:
+            return fn()
+
+        breaker.before(path)
+        try:
+            result = fn()
+        except Exception as exc:
+            breaker.record(path, exc)
+            raise
+
+        breaker.record(path)
+        return result
+
+    def _hedged(self, path: str, send: Callable[[], Any]) -> Any:
+        policy = self._hedge_for(path)
+        if policy is None:
+            return send()
+
+        start = time.monotonic()
+        delay = policy.delay(path)
+
+        if delay is None:
+            result = send()
+            policy.observe(path, time.monotonic() - start)
+            return result
+
+        primary = self._hedge_executor().submit(send)
+        try:
+            result = primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        else:
+            policy.observe(path, time.monotonic() - start)
+            return result
+
+        # Primary is slow: race a duplicate against it. requests cannot
+        # abort a call in progress, so the loser finishes in the
+        # background and its result is discarded.
+        hedge = self._hedge_executor().submit(send)
+        pending = {primary, hedge}
+        error: BaseException | None = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    policy.record_hedge(won=future is hedge)
+                    policy.observe(path, time.monotonic() - start)
+                    return future.result()
+                error = future.exception()
+
+        policy.record_hedge(won=False)
+        assert error is not None
+        raise error
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise ValueError("HttpClient is closed")
+
+            if self._hedge_pool is None:
+                # Each hedged call occupies up to two workers.
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=max(32, 2 * self._config.pool_maxsize),
+                    thread_name_prefix="praxis-hedge",
+                )
+            return self._hedge_pool
+
+    def _acquire(self) -> requests.Session:
+        with self._lock:
+            if self._closed:
+                raise ValueError("HttpClient is closed")
+
+            now = time.monotonic()
+            idle_timeout = self._config.idle_timeout
+
+            if (
+                self._session is not None
+                and self._in_flight == 0
+                and idle_timeout is not None
+                and now - self._last_used > idle_timeout
+            ):
+                self._session.close()
+                self._session = None
+
+            if self._session is None:
+                self._session = self._new_session()
+
+            self._in_flight += 1
+            self._last_used = now
+            return self._session
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+
+        # Retries are handled by the RetryPolicy, never by urllib3.
+        adapter = HTTPAdapter(
+            pool_connections=self._config.pool_connections,
+            pool_maxsize=self._config.pool_maxsize,
+            max_retries=0,
+        )
+        adapter.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers.update(self._headers())
+        return session
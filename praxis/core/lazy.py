@@ -0,0 +1,35 @@
+import importlib
+from typing import Any, Callable
+
+
+class LazyAPI:
+    """
+    Class attribute that builds a domain API on first access.
+
+    `target` is "module:ClassName"; the module is only imported when the
+    attribute is first read. The instance is bound to the owner's
+    `_http` transport, optionally passed through `wrap`, and stored in
+    the owner's `__dict__`, so later reads are plain attribute lookups.
+    Two threads racing on the first access may each build an instance;
+    domain APIs are stateless, so either one is fine.
+    """
+
+    def __init__(self, target: str, wrap: Callable[[Any], Any] | None = None):
+        self.target = target
+        self.wrap = wrap
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+
+        module, _, cls = self.target.partition(":")
+        api = getattr(importlib.import_module(module), cls)(obj._http)
+        if self.wrap is not None:
+            api = self.wrap(api)
+
+        obj.__dict__[self.name] = api
+        return api
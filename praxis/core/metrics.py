@@ -0,0 +1,179 @@
+import bisect
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from praxis.core.hooks import RequestEvent
+
+# Latency histogram bucket bounds in seconds (Prometheus client defaults).
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PHASES = ("connect", "tls", "ttfb", "download", "decode", "validate")
+
+
+class _EndpointMetrics:
+    __slots__ = (
+        "buckets", "latency_sum", "success", "errors", "retries",
+        "request_bytes", "response_bytes", "cost", "phases",
+    )
+
+    def __init__(self, size: int):
+        self.buckets = [0] * (size + 1)  # last slot is +Inf
+        self.latency_sum = 0.0
+        self.success = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.cost = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+
+class MetricsAggregator:
+    """
+    Hook listener keeping per-endpoint request metrics.
+
+    Latencies go into a fixed-bucket histogram, so recording a call is a
+    binary search and a few additions under a lock. `prometheus()`
+    renders everything in the Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, prefix: str = "praxis"):
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets:
+            raise ValueError("buckets must not be empty")
+
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, _EndpointMetrics] = {}
+
+    # Hook interface
+
+    def after_response(self, event: RequestEvent) -> None:
+        timings = event.timings
+        if timings is None:  # responses always carry timings
+            return
+        index = bisect.bisect_left(self.buckets, timings.total)
+
+        with self._lock:
+            metrics = self._metrics(event.path)
+            metrics.buckets[index] += 1
+            metrics.latency_sum += timings.total
+            metrics.success += 1
+            metrics.retries += event.retries
+            metrics.request_bytes += event.request_bytes
+            metrics.response_bytes += event.response_bytes or 0
+            metrics.cost += event.cost or 0.0
+            phases = metrics.phases
+            phases["connect"] += timings.connect
+            phases["tls"] += timings.tls
+            phases["ttfb"] += timings.ttfb
+            phases["download"] += timings.download
+            phases["decode"] += timings.decode
+            phases["validate"] += timings.validate
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event.path)
+            metrics.errors += 1
+            metrics.retries += event.retries
+            metrics.request_bytes += event.request_bytes
+
+    # Export
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Plain-dict copy of the metrics, keyed by endpoint path.
+        """
+        with self._lock:
+            return {
+                path: {
+                    "requests": m.success + m.errors,
+                    "errors": m.errors,
+                    "retries": m.retries,
+                    "latency_sum": m.latency_sum,
+                    "buckets": dict(
+                        zip(self.buckets + (float("inf"),), _cumulative(m.buckets), strict=True)
+                    ),
+                    "request_bytes": m.request_bytes,
+                    "response_bytes": m.response_bytes,
+                    "cost": m.cost,
+                    "phases": dict(m.phases),
+                }
+                for path, m in self._endpoints.items()
+            }
+
+    def prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        p = self.prefix
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = [
+                f"# HELP {p}_request_duration_seconds Latency of successful requests, retries included.",
+                f"# TYPE {p}_request_duration_seconds histogram",
+            ]
+            for path, m in endpoints:
+                label = f'endpoint="{_escape(path)}"'
+                # The +Inf bucket (the last count) is written below.
+                for bound, count in zip(self.buckets, _cumulative(m.buckets)[:-1], strict=True):
+                    lines.append(f'{p}_request_duration_seconds_bucket{{{label},le="{bound:g}"}} {count}')
+                lines.append(f'{p}_request_duration_seconds_bucket{{{label},le="+Inf"}} {m.success}')
+                lines.append(f"{p}_request_duration_seconds_sum{{{label}}} {m.latency_sum!r}")
+                lines.append(f"{p}_request_duration_seconds_count{{{label}}} {m.success}")
+
+            lines += [
+                f"# HELP {p}_phase_seconds_total Time spent per request phase.",
+                f"# TYPE {p}_phase_seconds_total counter",
+            ]
+            for path, m in endpoints:
+                label = f'endpoint="{_escape(path)}"'
+                for phase, total in m.phases.items():
+                    lines.append(f'{p}_phase_seconds_total{{{label},phase="{phase}"}} {total!r}')
+
+            lines += [
+                f"# HELP {p}_requests_total Completed requests by outcome.",
+                f"# TYPE {p}_requests_total counter",
+            ]
+            for path, m in endpoints:
+                label = f'endpoint="{_escape(path)}"'
+                lines.append(f'{p}_requests_total{{{label},outcome="success"}} {m.success}')
+                lines.append(f'{p}_requests_total{{{label},outcome="error"}} {m.errors}')
+
+            for name, help_text, attr in (
+                ("retries_total", "Retries performed.", "retries"),
+                ("request_bytes_total", "Request body bytes sent.", "request_bytes"),
+                ("response_bytes_total", "Response body bytes received.", "response_bytes"),
+                ("cost_total", "Cost reported by the API.", "cost"),
+            ):
+                lines.append(f"# HELP {p}_{name} {help_text}")
+                lines.append(f"# TYPE {p}_{name} counter")
+                for path, m in endpoints:
+                    value = getattr(m, attr)
+                    lines.append(f'{p}_{name}{{endpoint="{_escape(path)}"}} {value!r}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def _metrics(self, path: str) -> _EndpointMetrics:
+        metrics = self._endpoints.get(path)
+        if metrics is None:
+            metrics = self._endpoints[path] = _EndpointMetrics(len(self.buckets))
+        return metrics
+
+
+def _cumulative(counts: list[int]) -> list[int]:
+    total = 0
+    out = []
+    for count in counts:
+        total += count
+        out.append(total)
+    return out
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
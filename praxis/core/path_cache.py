@@ -0,0 +1,251 @@
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any
+
+from praxis.compute import local_response
+from praxis.models.grid import OccupancyGrid
+from praxis.models.response import Response
+
+Cell = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class PathCacheStats:
+    hits: int
+    misses: int
+    tree_hits: int
+    carried: int
+    invalidated: int
+    paths: int
+    grids: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _GridPaths:
+    """
+    Paths planned on one grid.
+    """
+
+    __slots__ = ("grid", "paths", "index", "trees", "goals", "unreachable", "wrapped", "next_id")
+
+    def __init__(self, grid: OccupancyGrid):
+        self.grid = grid
+        self.paths: OrderedDict[int, list[Cell]] = OrderedDict()
+        # cell -> {path id: position of the cell on that path}
+        self.index: dict[Cell, dict[int, int]] = {}
+        # goal -> {cell: next cell towards the goal}
+        self.trees: dict[Cell, dict[Cell, Cell | None]] = {}
+        self.goals: dict[Cell, int] = {}
+        self.unreachable: set[tuple[Cell, Cell]] = set()
+        self.wrapped = True  # results come as data["result"]
+        self.next_id = 0
+
+    def add(self, path: list[Cell], max_paths: int) -> None:
+        pid = self.next_id
+        self.next_id += 1
+        self.paths[pid] = path
+        for i, cell in enumerate(path):
+            self.index.setdefault(cell, {})[pid] = i
+
+        goal = path[-1]
+        self.goals[goal] = self.goals.get(goal, 0) + 1
+        tree = self.trees.setdefault(goal, {goal: None})
+        # Any suffix of a shortest path is a shortest path, so the union
+        # of the paths to one goal is a tree of shortest next hops.
+        for cell, nxt in pairwise(path):
+            tree.setdefault(cell, nxt)
+
+        while len(self.paths) > max_paths:
+            self.drop(next(iter(self.paths)))
+
+    def drop(self, pid: int) -> None:
+        path = self.paths.pop(pid)
+        for cell in path:
+            entries = self.index[cell]
+            del entries[pid]
+            if not entries:
+                del self.index[cell]
+
+        goal = path[-1]
+        self.goals[goal] -= 1
+        if not self.goals[goal]:
+            del self.goals[goal]
+            del self.trees[goal]
+
+    def find(self, start: Cell, goal: Cell) -> tuple[list[Cell] | None, bool]:
+        """
+        A cached shortest path from `start` to `goal` and whether it
+        came from a goal tree.
+        """
+        tree = self.trees.get(goal)
+        if tree is not None and start in tree:
+            path: list[Cell] = []
+            cell: Cell | None = start
+            while cell is not None:
+                path.append(cell)
+                cell = tree[cell]
+            return path, True
+
+        on_start = self.index.get(start)
+        on_goal = self.index.get(goal)
+        if not on_start or not on_goal:
+            return None, False
+        if len(on_goal) < len(on_start):
+            on_start, on_goal, reverse = on_goal, on_start, True
+        else:
+            reverse = False
+
+        for pid, i in on_start.items():
+            j = on_goal.get(pid)
+            if j is None:
+                continue
+            path = self.paths[pid]
+            # Moves are symmetric, so a path read backwards is also shortest.
+            if i <= j:
+                found = path[i:j + 1]
+            else:
+                found = path[j:i + 1][::-1]
+            return (found[::-1] if reverse else found), False
+        return None, False
+
+
+class PathCache:
+    """
+    Thread-safe store of navigation paths, keyed by the grid's SHA-256.
+
+    On a fixed grid every sub-path of a shortest path is itself a
+    shortest path, so a `plan` between two cells that lie on a cached
+    path is answered by slicing it. Paths to the same goal are merged
+    into a tree of next hops, which answers any start on any of them.
+    Unreachable start/goal pairs are remembered too.
+
+    A changed grid is a new key. When the change only blocks cells,
+    paths (and goal trees) that avoid the newly blocked cells stay
+    shortest and are carried over; the others are invalidated. Freed
+    cells may open shorter routes, so nothing is carried across them.
+    Hits are returned with zero cost and a `local-` request id.
+    """
+
+    def __init__(self, max_grids: int = 8, max_paths: int = 1024):
+        if max_grids < 1 or max_paths < 1:
+            raise ValueError("max_grids and max_paths must be >= 1")
+
+        self.max_grids = max_grids
+        self.max_paths = max_paths
+
+        self._lock = threading.Lock()
+        self._grids: OrderedDict[str, _GridPaths] = OrderedDict()
+        self._counts = dict.fromkeys(("hits", "misses", "tree_hits", "carried", "invalidated"), 0)
+
+    @property
+    def stats(self) -> PathCacheStats:
+        with self._lock:
+            return PathCacheStats(
+                **self._counts,
+                paths=sum(len(entry.paths) for entry in self._grids.values()),
+                grids=len(self._grids),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._grids.clear()
+
+    def get(self, grid: OccupancyGrid, start: Cell, goal: Cell) -> Response[Any] | None:
+        start, goal = (start[0], start[1]), (goal[0], goal[1])
+        path: list[Cell] | None
+        with self._lock:
+            entry = self._entry(grid)
+            if (start, goal) in entry.unreachable:
+                path, from_tree = [], False
+            else:
+                path, from_tree = entry.find(start, goal)
+
+            if path is None:
+                self._counts["misses"] += 1
+                return None
+            self._counts["hits"] += 1
+            if from_tree:
+                self._counts["tree_hits"] += 1
+            wrapped = entry.wrapped
+
+        return local_response(_result_data(path, wrapped))
+
+    def put(self, grid: OccupancyGrid, start: Cell, goal: Cell, response: Any) -> Any:
+        """
+        Store the path of a `plan` response and return the response.
+        Awaitables are wrapped so the path is stored once they resolve.
+        """
+        if inspect.isawaitable(response):
+            return self._put_async(grid, start, goal, response)
+
+        data = response.data
+        if not isinstance(data, dict):
+            return response
+        result = data.get("result", data)
+        if not isinstance(result, dict):
+            return response
+
+        start, goal = (start[0], start[1]), (goal[0], goal[1])
+        path = [(cell[0], cell[1]) for cell in result.get("path") or []]
+        with self._lock:
+            entry = self._entry(grid)
+            entry.wrapped = "result" in data
+            if not path:
+                if result.get("reachable") is False:
+                    entry.unreachable.add((start, goal))
+            elif path[0] == start and path[-1] == goal:
+                entry.add(path, self.max_paths)
+        return response
+
+    async def _put_async(self, grid: OccupancyGrid, start: Cell, goal: Cell, pending: Any) -> Any:
+        return self.put(grid, start, goal, await pending)
+
+    def _entry(self, grid: OccupancyGrid) -> _GridPaths:
+        key = grid.sha256()
+        entry = self._grids.get(key)
+        if entry is not None:
+            self._grids.move_to_end(key)
+            return entry
+
+        entry = _GridPaths(grid.copy())
+        if self._grids:
+            self._carry_over(next(reversed(self._grids.values())), entry)
+        self._grids[key] = entry
+        while len(self._grids) > self.max_grids:
+            self._grids.popitem(last=False)
+        return entry
+
+    def _carry_over(self, previous: _GridPaths, entry: _GridPaths) -> None:
+        if previous.grid.shape != entry.grid.shape or not previous.paths:
+            return
+
+        changes = previous.grid.diff(entry.grid)
+        if any(value == 0 for _, _, value in changes):
+            self._counts["invalidated"] += len(previous.paths)
+            return
+
+        blocked = {(r, c) for r, c, _ in changes}
+        for path in previous.paths.values():
+            if blocked.isdisjoint(path):
+                entry.add(path, self.max_paths)
+                self._counts["carried"] += 1
+            else:
+                self._counts["invalidated"] += 1
+        entry.unreachable = set(previous.unreachable)
+        entry.wrapped = previous.wrapped
+
+
+def _result_data(path: list[Cell], wrapped: bool) -> dict[str, Any]:
+    result = {
+        "reachable": bool(path),
+        "steps": max(0, len(path) - 1),
+        "path": [list(cell) for cell in path],
+    }
+    return {"result": result} if wrapped else result
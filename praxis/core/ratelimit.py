@@ -0,0 +1,244 @@
+import os
+import re
+import struct
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+_STATE = struct.Struct("dd")  # tokens, timestamp
+
+
+class TokenBucket:
+    """
+    Token bucket shared by all threads of a process.
+
+    Tokens refill at `rate` per second up to `burst`. `reserve` always
+    takes a token, letting the balance go negative, and returns how long
+    the caller must wait for it: concurrent callers queue up one
+    `1 / rate` slot apart instead of all retrying at once.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _take(
+                self._tokens, self._updated, now, self.rate, self.burst, tokens
+            )
+            self._updated = now
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for `seconds` (e.g. after a 429).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+            self._updated = now
+
+
+class FileTokenBucket:
+    """
+    Token bucket shared by every process on a host.
+
+    The bucket state lives in a 16-byte file guarded by an exclusive
+    `flock`, so all processes pointing at the same file draw from one
+    quota. POSIX only.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], rate: float, burst: float | None = None):
+        if fcntl is None:
+            raise ImportError("File-backed rate limiting requires fcntl (POSIX)")
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+
+        self.path = os.fspath(path)
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        # flock() does not exclude threads sharing one descriptor.
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+        self._pid: int | None = None
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._locked() as fd:
+            now = time.time()
+            current, updated = self._read(fd, now)
+            current, wait = _take(current, updated, now, self.rate, self.burst, tokens)
+            self._write(fd, current, now)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._locked() as fd:
+            now = time.time()
+            current, _ = self._read(fd, now)
+            self._write(fd, min(current, -seconds * self.rate), now)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    @contextmanager
+    def _locked(self) -> Iterator[int]:
+        with self._lock:
+            fd = self._descriptor()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield fd
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _descriptor(self) -> int:
+        # Descriptors must not be shared with a fork()ed child: the
+        # lock would be shared too.
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def _read(self, fd: int, now: float) -> tuple[float, float]:
+        raw = os.pread(fd, _STATE.size, 0)
+        if len(raw) < _STATE.size:
+            return self.burst, now
+        return _STATE.unpack(raw)
+
+    def _write(self, fd: int, tokens: float, now: float) -> None:
+        os.pwrite(fd, _STATE.pack(tokens, now), 0)
+
+
+def _take(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    burst: float,
+    amount: float,
+) -> tuple[float, float]:
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate) - amount
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter in front of every request.
+
+    `rate` (requests per second, with bursts of up to `burst`) caps all
+    traffic; `endpoints` maps API paths to their own `rate` or
+    `(rate, burst)` on top of it. Callers over the quota are delayed,
+    not rejected, so throughput settles at the quota instead of
+    alternating between bursts and server-side back-off. A 429 from the
+    server pauses the matching buckets for its `Retry-After`.
+
+    With `shared_dir`, buckets are stored in files under that directory
+    and shared by every process using the same directory.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        endpoints: Mapping[str, float | tuple[float, float]] | None = None,
+        shared_dir: str | os.PathLike[str] | None = None,
+    ):
+        if rate is None and not endpoints:
+            raise ValueError("Set a global rate, per-endpoint rates, or both")
+
+        self.shared_dir = os.fspath(shared_dir) if shared_dir is not None else None
+        self._global = self._bucket("global", rate, burst) if rate is not None else None
+        self._endpoints = {}
+        for path, limit in (endpoints or {}).items():
+            limit_rate, limit_burst = limit if isinstance(limit, tuple) else (limit, None)
+            self._endpoints[path] = self._bucket(path, limit_rate, limit_burst)
+
+        self._lock = threading.Lock()
+        self._waits = 0
+        self._waited = 0.0
+
+    def delay(self, path: str) -> float:
+        """
+        Take a token for a request to `path` and return how long to wait
+        before sending it.
+        """
+        wait = 0.0
+        if self._global is not None:
+            wait = self._global.reserve()
+        bucket = self._endpoints.get(path)
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+
+        if wait > 0:
+            with self._lock:
+                self._waits += 1
+                self._waited += wait
+        return wait
+
+    def acquire(self, path: str) -> float:
+        wait = self.delay(path)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, path: str) -> float:
+        import asyncio
+
+        wait = self.delay(path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, path: str, seconds: float) -> None:
+        """
+        Delay further requests to `path` (and all requests, if a global
+        rate is set) by `seconds`.
+        """
+        if self._global is not None:
+            self._global.pause(seconds)
+        bucket = self._endpoints.get(path)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        Number of delayed requests and total seconds spent waiting.
+        """
+        with self._lock:
+            return {"delayed": self._waits, "waited": self._waited}
+
+    def _bucket(
+        self, name: str, rate: float, burst: float | None
+    ) -> TokenBucket | FileTokenBucket:
+        if self.shared_dir is None:
+            return TokenBucket(rate, burst)
+
+        filename = re.sub(r"[^A-Za-z0-9_.-]", "_", name.strip("/")) or "global"
+        path = os.path.join(self.shared_dir, f"{filename}.bucket")
+        return FileTokenBucket(path, rate, burst)
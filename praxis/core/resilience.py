@@ -0,0 +1,205 @@
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from praxis.core.endpoints import COALESCIBLE_ENDPOINTS
+from praxis.exceptions import APIError, CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_backend_failure(exc: BaseException | None) -> bool:
+    """
+    Failures that say something about backend health: no response at
+    all, or a 5xx. Client errors and rate limiting do not count.
+    """
+    if not isinstance(exc, APIError) or isinstance(exc, CircuitOpenError):
+        return False
+    return exc.status_code is None or exc.status_code >= 500
+
+
+class _Circuit:
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    Each endpoint keeps the outcomes of its last `window` calls. Once at
+    least `min_calls` are recorded and the failure rate reaches
+    `failure_rate`, the circuit opens and calls fail fast with
+    `CircuitOpenError`. After `open_for` seconds the circuit half-opens
+    and lets `half_open_calls` probe requests through: a success closes
+    it, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_for: float = 30.0,
+        half_open_calls: int = 1,
+        endpoints: Iterable[str] | None = None,
+    ):
+        if not 0.0 < failure_rate <= 1.0:
+            raise ValueError("failure_rate must be in (0, 1]")
+
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.open_for = open_for
+        self.half_open_calls = half_open_calls
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def enabled_for(self, path: str) -> bool:
+        return self.endpoints is None or path in self.endpoints
+
+    def state(self, path: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(path)
+            return circuit.state if circuit is not None else CLOSED
+
+    def before(self, path: str) -> None:
+        """
+        Raise `CircuitOpenError` if a call to `path` must not be made now.
+        """
+        with self._lock:
+            circuit = self._circuits.get(path)
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.open_for - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Circuit open for {path}", retry_after=remaining
+                    )
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+
+            if circuit.probes >= self.half_open_calls:
+                raise CircuitOpenError(f"Circuit half-open for {path}, probe in flight")
+            circuit.probes += 1
+
+    def record(self, path: str, exc: BaseException | None = None) -> None:
+        """
+        Record the outcome of a call made after `before(path)`.
+        """
+        failed = is_backend_failure(exc)
+
+        with self._lock:
+            circuit = self._circuits.get(path)
+            if circuit is None:
+                circuit = self._circuits[path] = _Circuit(self.window)
+
+            # Late results of calls started before the circuit opened.
+            if circuit.state == OPEN:
+                return
+
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if failed:
+                    self._open(circuit)
+                else:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+                return
+
+            circuit.outcomes.append(failed)
+            calls = len(circuit.outcomes)
+            if calls >= self.min_calls and sum(circuit.outcomes) / calls >= self.failure_rate:
+                self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+        circuit.probes = 0
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    hedged: int
+    hedge_wins: int
+
+
+class HedgePolicy:
+    """
+    Request hedging for idempotent endpoints.
+
+    If a request has not completed after the `percentile` latency of
+    recent successful calls to the same endpoint, a duplicate is sent
+    and whichever answers first wins. Hedging starts once `min_samples`
+    latencies have been observed; `min_delay` bounds how early a
+    duplicate may be sent.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 200,
+        endpoints: Iterable[str] = COALESCIBLE_ENDPOINTS,
+    ):
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be in (0, 1)")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.endpoints = frozenset(endpoints)
+
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def enabled_for(self, path: str) -> bool:
+        return path in self.endpoints
+
+    def delay(self, path: str) -> float | None:
+        """
+        Seconds to wait before hedging a call to `path`, or None.
+        """
+        with self._lock:
+            samples = self._latencies.get(path)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, path: str, latency: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(path)
+            if samples is None:
+                samples = self._latencies[path] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def record_hedge(self, won: bool) -> None:
+        with self._lock:
+            self._hedged += 1
+            if won:
+                self._hedge_wins += 1
+
+    @property
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(hedged=self._hedged, hedge_wins=self._hedge_wins)
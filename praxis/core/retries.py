@@ -1,15 +1,217 @@
+import email.utils
+import random
+import threading
 import time
-from typing import Callable
+from collections.abc import Iterable
+from typing import Any, Awaitable, Callable
+
+from praxis.exceptions import APIError, CircuitOpenError
+
+# Transient HTTP statuses worth retrying. Any other 4xx means the request
+# itself is wrong and will fail again.
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a `Retry-After` header (delta-seconds or HTTP-date) into seconds.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries, preventing retry storms.
+
+    Every request deposits `ratio` tokens and every retry withdraws one,
+    so retries stay below `ratio` of the request volume. A trickle of
+    `min_per_second` tokens keeps low-traffic clients able to retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_balance: float = 100.0,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+
+        self._lock = threading.Lock()
+        self._balance = max_balance
+        self._updated = time.monotonic()
+        self._rejected = 0
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._balance < 1.0:
+                self._rejected += 1
+                return False
+            self._balance -= 1.0
+            return True
+
+    @property
+    def rejected(self) -> int:
+        """
+        Number of retries refused because the budget was exhausted.
+        """
+        return self._rejected
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._balance = min(
+            self.max_balance,
+            self._balance + elapsed * self.min_per_second,
+        )
+
+
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    - exponential backoff with full jitter, capped at `max_backoff`
+    - `Retry-After` from the server honored (up to `max_retry_after`)
+    - only network errors and transient statuses are retried
+    - retries are drawn from a shared `RetryBudget`
+
+    `call` blocks the calling thread between attempts; `call_async`
+    waits with `asyncio.sleep` and never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        backoff: float = 0.25,
+        max_backoff: float = 5.0,
+        jitter: bool = True,
+        retry_on_status: Iterable[int] = RETRYABLE_STATUS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 30.0,
+        budget: RetryBudget | None = DEFAULT_RETRY_BUDGET,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on_status = frozenset(retry_on_status)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if not isinstance(exc, APIError) or isinstance(exc, CircuitOpenError):
+            return False
+
+        # No status: the request never got a response (connect/read error).
+        return exc.status_code is None or exc.status_code in self.retry_on_status
+
+    def delay(self, attempt: int, exc: BaseException | None = None) -> float:
+        """
+        Seconds to wait before retry number `attempt` (0-based).
+        """
+        retry_after: float | None = getattr(exc, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        delay: float = min(self.max_backoff, self.backoff * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0.0, delay)
+        return delay
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        on_retry: Callable[[int, BaseException, float], None] | None = None,
+    ) -> Any:
+        if self.budget is not None:
+            self.budget.deposit()
+
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as exc:
+                wait = self._next_delay(attempt, exc)
+                if wait is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt + 1, exc, wait)
+                time.sleep(wait)
+                attempt += 1
+
+    async def call_async(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        on_retry: Callable[[int, BaseException, float], None] | None = None,
+    ) -> Any:
+        # Imported here so sync-only processes never load asyncio.
+        import asyncio
+
+        if self.budget is not None:
+            self.budget.deposit()
+
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as exc:
+                wait = self._next_delay(attempt, exc)
+                if wait is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt + 1, exc, wait)
+                await asyncio.sleep(wait)
+                attempt += 1
+
+    def _next_delay(self, attempt: int, exc: BaseException) -> float | None:
+        if attempt >= self.max_retries or not self.is_retryable(exc):
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        return self.delay(attempt, exc)
 
 
 def retry(
-    fn: Callable,
+    fn: Callable[[], Any],
     *,
     retries: int = 2,
     backoff: float = 0.5,
     retry_on: tuple[type[Exception], ...] = (Exception,),
-):
-    last_exc = None
+) -> Any:
+    """
+    Legacy helper: retry `fn` on any of `retry_on` with linear backoff.
+    Prefer `RetryPolicy`, which is what `HttpClient` uses.
+    """
+    last_exc: Exception | None = None
 
     for attempt in range(retries + 1):
         try:
@@ -20,4 +222,5 @@ def retry(
                 break
             time.sleep(backoff * (attempt + 1))
 
+    assert last_exc is not None
     raise last_exc
@@ -1,36 +1,52 @@
+from typing import Any
+
+from praxis.models.envelope import Envelope
 from praxis.models.errors import InvalidEnvelopeError
 
+ENVELOPE_FIELDS = (
+    "success",
+    "data",
+    "error",
+    "message",
+    "cost",
+    "request_id",
+)
+
 
 class Serializer:
     """
     Validates and normalizes backend response envelope.
     """
 
+    @staticmethod
+    def to_envelope(payload: dict[str, Any]) -> Envelope:
+        """
+        Validate a decoded response and build its `Envelope` in one pass,
+        without copying the payload.
+        """
+        try:
+            return Envelope(
+                payload["success"],
+                payload["data"],
+                payload["error"],
+                payload["message"],
+                payload["cost"],
+                payload["request_id"],
+            )
+        except (KeyError, TypeError):
+            # Slow path only to build a precise error message.
+            Serializer.parse_envelope(payload)
+            raise
+
     @staticmethod
     def parse_envelope(payload: dict) -> dict:
         if not isinstance(payload, dict):
             raise InvalidEnvelopeError("Response is not a JSON object")
 
-        required_fields = {
-            "success",
-            "data",
-            "error",
-            "message",
-            "cost",
-            "request_id",
-        }
-
-        missing = required_fields - payload.keys()
+        missing = set(ENVELOPE_FIELDS) - payload.keys()
         if missing:
             raise InvalidEnvelopeError(
                 f"Malformed response. Missing fields: {missing}"
             )
 
-        return {
-            "success": payload["success"],
-            "data": payload["data"],
-            "error": payload["error"],
-            "message": payload["message"],
-            "cost": payload["cost"],
-            "request_id": payload["request_id"],
-        }
+        return {field: payload[field] for field in ENVELOPE_FIELDS}
@@ -0,0 +1,375 @@
+import bisect
+import contextvars
+import functools
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from praxis.core.hooks import RequestEvent
+
+
+class CallRecord(NamedTuple):
+    """
+    One call made through a traced session.
+
+    `start` and `end` are `time.perf_counter()` values. `endpoint` is
+    None when the call never reached the network (cache hit, coalesced
+    follower or local computation).
+    """
+
+    operation: str
+    endpoint: str | None
+    start: float
+    end: float
+    bytes_out: int
+    bytes_in: int
+    retries: int
+    cost: float
+    request_id: str | None
+    cached: bool
+    error: str | None
+    thread: int
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def key(self) -> str:
+        return self.endpoint or self.operation
+
+
+@dataclass(frozen=True)
+class EndpointSummary:
+    calls: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+    total_time: float
+    cost: float
+    bytes_out: int
+    bytes_in: int
+    retries: int
+
+
+@dataclass(frozen=True)
+class SessionSummary:
+    calls: int
+    errors: int
+    total_cost: float
+    wall_time: float
+    endpoints: dict[str, EndpointSummary]
+    critical_path: list[CallRecord]
+
+    @property
+    def critical_path_time(self) -> float:
+        return sum(record.duration for record in self.critical_path)
+
+
+class _CallSlot:
+    """
+    Network activity of the call running in the current context,
+    filled in by `SessionListener` from transport hook events.
+    """
+
+    __slots__ = ("endpoint", "bytes_out", "bytes_in", "retries", "request_id")
+
+    def __init__(self) -> None:
+        self.endpoint: str | None = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.retries = 0
+        self.request_id: str | None = None
+
+    def add(self, event: RequestEvent) -> None:
+        self.endpoint = event.path
+        self.bytes_out += event.request_bytes
+        self.bytes_in += event.response_bytes or 0
+        self.retries += event.retries
+        if event.request_id is not None:
+            self.request_id = event.request_id
+
+
+_active_call: contextvars.ContextVar[_CallSlot | None] = contextvars.ContextVar(
+    "praxis_active_call", default=None
+)
+
+
+class SessionListener:
+    """
+    Hook listener routing transport events to the traced call running
+    in the current context. Does nothing outside traced sessions.
+    """
+
+    def after_response(self, event: RequestEvent) -> None:
+        slot = _active_call.get()
+        if slot is not None:
+            slot.add(event)
+
+    on_error = after_response
+
+
+SESSION_LISTENER = SessionListener()
+
+# Hooks -> number of traced calls/sessions currently using the listener.
+_listener_lock = threading.Lock()
+_listener_users: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+
+
+def attach_listener(hooks: Any) -> None:
+    """
+    Register `SESSION_LISTENER` on `hooks` while traced sessions use it.
+
+    Each call must be paired with `detach_listener`; the listener is
+    removed again when the last user detaches, so a client's requests
+    outside sessions never pay for hook dispatch.
+    """
+    with _listener_lock:
+        users = _listener_users.get(hooks, 0)
+        if not users:
+            hooks.add(SESSION_LISTENER)
+        _listener_users[hooks] = users + 1
+
+
+def detach_listener(hooks: Any) -> None:
+    with _listener_lock:
+        users = _listener_users.get(hooks, 0) - 1
+        if users > 0:
+            _listener_users[hooks] = users
+        else:
+            _listener_users.pop(hooks, None)
+            hooks.remove(SESSION_LISTENER)
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+class SessionTrace:
+    """
+    Ring buffer of the last `capacity` calls made through a session.
+
+    Recording a call appends one small tuple; summaries and exports are
+    computed on demand.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._records: deque[CallRecord] = deque(maxlen=capacity)
+        self._recorded = 0
+        # Anchor perf_counter values to wall-clock time for exports.
+        self._origin = time.perf_counter()
+        self._origin_wall = time.time()
+
+    @property
+    def records(self) -> list[CallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of records overwritten because the buffer was full.
+        """
+        return max(0, self._recorded - self.capacity)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._recorded = 0
+
+    def call(self, operation: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run `fn` and record it as `operation`.
+        """
+        slot = _CallSlot()
+        token = _active_call.set(slot)
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            self._record(operation, slot, start, None, exc)
+            raise
+        finally:
+            _active_call.reset(token)
+
+        self._record(operation, slot, start, result, None)
+        return result
+
+    def _record(
+        self,
+        operation: str,
+        slot: _CallSlot,
+        start: float,
+        result: Any,
+        exc: BaseException | None,
+    ) -> None:
+        record = CallRecord(
+            operation=operation,
+            endpoint=slot.endpoint,
+            start=start,
+            end=time.perf_counter(),
+            bytes_out=slot.bytes_out,
+            bytes_in=slot.bytes_in,
+            retries=slot.retries,
+            cost=getattr(result, "cost", None) or 0.0,
+            request_id=getattr(result, "request_id", None) or slot.request_id,
+            cached=bool(getattr(result, "cached", False)),
+            error=type(exc).__name__ if exc is not None else None,
+            thread=threading.get_ident(),
+        )
+        with self._lock:
+            self._records.append(record)
+            self._recorded += 1
+
+    # Analysis
+
+    def summary(self) -> SessionSummary:
+        records = self.records
+        if not records:
+            return SessionSummary(0, 0, 0.0, 0.0, {}, [])
+
+        grouped: dict[str, list[CallRecord]] = {}
+        for record in records:
+            grouped.setdefault(record.key, []).append(record)
+
+        endpoints = {}
+        for key, calls in grouped.items():
+            durations = sorted(call.duration for call in calls)
+            endpoints[key] = EndpointSummary(
+                calls=len(calls),
+                errors=sum(1 for call in calls if call.error is not None),
+                p50=_percentile(durations, 0.50),
+                p95=_percentile(durations, 0.95),
+                p99=_percentile(durations, 0.99),
+                total_time=sum(durations),
+                cost=sum(call.cost for call in calls),
+                bytes_out=sum(call.bytes_out for call in calls),
+                bytes_in=sum(call.bytes_in for call in calls),
+                retries=sum(call.retries for call in calls),
+            )
+
+        return SessionSummary(
+            calls=len(records),
+            errors=sum(1 for record in records if record.error is not None),
+            total_cost=sum(record.cost for record in records),
+            wall_time=max(r.end for r in records) - min(r.start for r in records),
+            endpoints=endpoints,
+            critical_path=self._critical_path(records),
+        )
+
+    @staticmethod
+    def _critical_path(records: list[CallRecord]) -> list[CallRecord]:
+        # Longest chain of calls where each starts after the previous one
+        # ended: the calls an agent loop waited on one after another.
+        by_end = sorted(records, key=lambda r: r.end)
+        ends = [r.end for r in by_end]
+        best: list[float] = []  # best[i]: longest chain ending at by_end[i]
+        best_upto: list[int] = []  # index of the best chain among by_end[:i + 1]
+        parent: list[int | None] = []
+
+        for i, record in enumerate(by_end):
+            j = bisect.bisect_right(ends, record.start, 0, i) - 1
+            prev = best_upto[j] if j >= 0 else None
+            best.append(record.duration + (best[prev] if prev is not None else 0.0))
+            parent.append(prev)
+            if i == 0 or best[i] > best[best_upto[i - 1]]:
+                best_upto.append(i)
+            else:
+                best_upto.append(best_upto[i - 1])
+
+        path = []
+        node: int | None = best_upto[-1]
+        while node is not None:
+            path.append(by_end[node])
+            node = parent[node]
+        return path[::-1]
+
+    # Export
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Chrome trace-event JSON (load in chrome://tracing or Perfetto).
+        Each call is a complete ("X") event on the thread that made it.
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            events.append({
+                "name": record.operation,
+                "cat": record.endpoint or ("cache" if record.cached else "local"),
+                "ph": "X",
+                "ts": self._timestamp_us(record.start),
+                "dur": record.duration * 1e6,
+                "pid": pid,
+                "tid": record.thread,
+                "args": {
+                    "endpoint": record.endpoint,
+                    "request_id": record.request_id,
+                    "cost": record.cost,
+                    "bytes_out": record.bytes_out,
+                    "bytes_in": record.bytes_in,
+                    "retries": record.retries,
+                    "cached": record.cached,
+                    "error": record.error,
+                },
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def _timestamp_us(self, counter: float) -> float:
+        return (self._origin_wall + (counter - self._origin)) * 1e6
+
+
+class TracedAPI:
+    """
+    Wraps a domain API so that every public method call is recorded
+    in a `SessionTrace`. With `hooks`, the session listener is attached
+    to them for the duration of each call.
+    """
+
+    def __init__(self, api: Any, name: str, trace: SessionTrace, hooks: Any = None):
+        self._api = api
+        self._name = name
+        self._trace = trace
+        self._hooks = hooks
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        operation = f"{self._name}.{name}"
+
+        @functools.wraps(attr)
+        def method(*args: Any, **kwargs: Any) -> Any:
+            if self._hooks is None:
+                return self._trace.call(operation, attr, *args, **kwargs)
+
+            attach_listener(self._hooks)
+            try:
+                return self._trace.call(operation, attr, *args, **kwargs)
+            finally:
+                detach_listener(self._hooks)
+
+        setattr(self, name, method)
+        return method
+
+    def __repr__(self) -> str:
+        return f"<TracedAPI {type(self._api).__name__}>"
@@ -0,0 +1,166 @@
+import hashlib
+import io
+import mimetypes
+import mmap
+import os
+import uuid
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, BinaryIO, Iterator
+
+# Size of the slices handed to the transport. Slices are views into the
+# mapped file, so no chunk is ever copied before hitting the socket.
+CHUNK_SIZE = 1024 * 1024
+
+ImageSource = bytes | bytearray | memoryview | os.PathLike[str] | BinaryIO
+
+
+class ImageData:
+    """
+    Raw image bytes ready for upload, plus a filename and content type.
+    """
+
+    def __init__(self, view: memoryview, filename: str = "image"):
+        self.view = view
+        self.filename = filename
+        self.content_type = (
+            mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
+
+    def sha256(self) -> str:
+        return hashlib.sha256(self.view).hexdigest()
+
+
+@contextmanager
+def open_image(image: ImageSource) -> Iterator[ImageData]:
+    """
+    Expose `image` as a read-only memoryview without copying it.
+
+    Paths and real files are memory-mapped; in-memory buffers are
+    wrapped as is. `str` is not accepted: the domain APIs treat strings
+    as base64 data, so files must be given as `os.PathLike` objects.
+    """
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        yield ImageData(memoryview(image).cast("B"))
+        return
+
+    if isinstance(image, os.PathLike):
+        with open(image, "rb") as f:
+            with _mapped(f) as view:
+                yield ImageData(view, os.path.basename(os.fspath(image)))
+        return
+
+    if hasattr(image, "read"):
+        name = os.path.basename(str(getattr(image, "name", "") or "")) or "image"
+        try:
+            image.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # In-memory file objects: use their buffer when they expose one.
+            if isinstance(image, io.BytesIO):
+                view = image.getbuffer()[image.tell():]
+            else:
+                view = memoryview(image.read())
+            try:
+                yield ImageData(view, name)
+            finally:
+                view.release()
+            return
+
+        with _mapped(image) as view:
+            yield ImageData(view, name)
+        return
+
+    raise TypeError(
+        "image must be a base64 str, bytes, memoryview, os.PathLike "
+        f"or binary file object, got {type(image).__name__}"
+    )
+
+
+@contextmanager
+def _mapped(f: BinaryIO) -> Iterator[memoryview]:
+    offset = f.tell()
+    size = os.fstat(f.fileno()).st_size
+    if size <= offset:
+        yield memoryview(b"")
+        return
+
+    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)[offset:]
+    try:
+        yield view
+    finally:
+        try:
+            view.release()
+            mapped.close()
+        except BufferError:
+            # A hedged duplicate still holds a slice; the mapping is
+            # released once that request finishes.
+            pass
+
+
+class MultipartBody:
+    """
+    Streaming `multipart/form-data` body: form fields followed by one
+    file part whose content is sent straight from `image.view`.
+
+    The body has a known length and can be iterated any number of
+    times, so retried and hedged requests resend it without buffering.
+    """
+
+    def __init__(self, fields: dict[str, Any], name: str, image: ImageData):
+        self.boundary = uuid.uuid4().hex
+        self._view = image.view
+
+        head = []
+        for key, value in fields.items():
+            if value is None:
+                continue
+            head.append(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{key}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        head.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"; '
+            f'filename="{image.filename}"\r\n'
+            f"Content-Type: {image.content_type}\r\n\r\n"
+        )
+
+        self._head = "".join(head).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Content-Type": self.content_type, "Content-Length": str(len(self))}
+
+    def __len__(self) -> int:
+        return len(self._head) + self._view.nbytes + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        yield self._head
+        for start in range(0, self._view.nbytes, CHUNK_SIZE):
+            yield self._view[start:start + CHUNK_SIZE]
+        yield self._tail
+
+    def stream_async(self) -> "AsyncMultipartStream":
+        return AsyncMultipartStream(self)
+
+
+class AsyncMultipartStream:
+    """
+    Async iteration over a `MultipartBody`, for httpx's `AsyncClient`.
+    """
+
+    def __init__(self, body: MultipartBody):
+        self._body = body
+
+    def __len__(self) -> int:
+        return len(self._body)
+
+    async def __aiter__(self) -> AsyncIterator[bytes | memoryview]:
+        for chunk in self._body:
+            yield chunk
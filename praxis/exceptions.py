@@ -9,6 +9,25 @@ class PraxisError(Exception):
 class APIError(PraxisError):
     """
     Network / protocol / unexpected API failure.
+
+    `status_code` is None for network-level failures (no response).
+    `retry_after` is the server's `Retry-After` hint in seconds, if any.
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(APIError):
+    """
+    Request rejected locally because the endpoint's circuit breaker is open.
     """
     pass
 
@@ -0,0 +1,258 @@
+import base64
+import hashlib
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# 0 -> "0", anything else -> "1"
+_TO_BITS = bytes([0x30] + [0x31] * 255)
+# "0" -> 0, "1" -> 1
+_FROM_BITS = bytes(range(256)).replace(b"0", b"\x00").replace(b"1", b"\x01")
+_RUN = re.compile(rb"0+|1+")
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+class OccupancyGrid:
+    """
+    Bit-packed occupancy grid: one bit per cell, row-major, most
+    significant bit first. A 2000 x 2000 map takes 500 KB instead of the
+    ~100 MB of a nested list of ints.
+
+    Cells are 0 (free) or 1 (blocked); any non-zero input value counts
+    as blocked.
+    """
+
+    __slots__ = ("rows", "cols", "_data")
+
+    def __init__(self, rows: int, cols: int, data: bytes | bytearray | None = None):
+        if rows < 0 or cols < 0:
+            raise ValueError("rows and cols must be >= 0")
+
+        size = (rows * cols + 7) // 8
+        if data is None:
+            data = bytearray(size)
+        elif len(data) != size:
+            raise ValueError(f"expected {size} packed bytes for {rows}x{cols}, got {len(data)}")
+
+        self.rows = rows
+        self.cols = cols
+        self._data = bytearray(data)
+
+    # Construction
+
+    @classmethod
+    def from_rows(cls, grid: Iterable[Iterable[int]]) -> "OccupancyGrid":
+        rows = [_row_bytes(row) for row in grid]
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise ValueError("all grid rows must have the same length")
+        return cls._from_cells(b"".join(rows), len(rows), cols)
+
+    @classmethod
+    def frombytes(cls, cells: bytes | bytearray | memoryview, rows: int, cols: int) -> "OccupancyGrid":
+        """
+        From one byte per cell, row-major (e.g. a costmap buffer).
+        """
+        cells = bytes(cells)
+        if len(cells) != rows * cols:
+            raise ValueError(f"expected {rows * cols} bytes for {rows}x{cols}, got {len(cells)}")
+        return cls._from_cells(cells, rows, cols)
+
+    @classmethod
+    def from_numpy(cls, array: Any) -> "OccupancyGrid":
+        np = _numpy("from_numpy")
+        array = np.asarray(array, dtype=bool)
+        if array.ndim != 2:
+            raise ValueError(f"grid array must be 2-D, got shape {array.shape}")
+        rows, cols = array.shape
+        return cls(rows, cols, np.packbits(array, axis=None).tobytes())
+
+    @classmethod
+    def from_bitpack(cls, shape: Iterable[int], data: str) -> "OccupancyGrid":
+        rows, cols = shape
+        return cls(rows, cols, base64.b64decode(data))
+
+    @classmethod
+    def from_rle(cls, shape: Iterable[int], first: int, runs: Iterable[int]) -> "OccupancyGrid":
+        rows, cols = shape
+        parts, value = [], 1 if first else 0
+        for run in runs:
+            parts.append(b"\x01" * run if value else b"\x00" * run)
+            value ^= 1
+        return cls._from_cells(b"".join(parts), rows, cols)
+
+    @classmethod
+    def _from_cells(cls, cells: bytes, rows: int, cols: int) -> "OccupancyGrid":
+        n = rows * cols
+        if len(cells) != n:
+            raise ValueError(f"expected {n} cells, got {len(cells)}")
+        if not n:
+            return cls(rows, cols)
+        bits = cells.translate(_TO_BITS) + b"0" * (-n % 8)
+        return cls(rows, cols, int(bits, 2).to_bytes(len(bits) // 8, "big"))
+
+    # Access
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    @property
+    def data(self) -> bytes:
+        """
+        Packed bits.
+        """
+        return bytes(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def _bit(self, cell: tuple[int, int]) -> int:
+        r, c = cell
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError(f"cell {(r, c)} is outside the {self.rows}x{self.cols} grid")
+        return r * self.cols + c
+
+    def __getitem__(self, cell: tuple[int, int]) -> int:
+        i = self._bit(cell)
+        return (self._data[i >> 3] >> (7 - (i & 7))) & 1
+
+    def __setitem__(self, cell: tuple[int, int], value: int) -> None:
+        i = self._bit(cell)
+        mask = 1 << (7 - (i & 7))
+        if value:
+            self._data[i >> 3] |= mask
+        else:
+            self._data[i >> 3] &= ~mask & 0xFF
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __iter__(self) -> Iterator[list[int]]:
+        return iter(self.to_rows())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OccupancyGrid):
+            return NotImplemented
+        return self.shape == other.shape and self._data == other._data
+
+    def __repr__(self) -> str:
+        return f"<OccupancyGrid {self.rows}x{self.cols}>"
+
+    def copy(self) -> "OccupancyGrid":
+        return OccupancyGrid(self.rows, self.cols, self._data)
+
+    # Conversion
+
+    def cells(self) -> bytes:
+        """
+        One byte (0 or 1) per cell, row-major.
+        """
+        n = self.rows * self.cols
+        if not n:
+            return b""
+        bits = format(int.from_bytes(self._data, "big"), f"0{len(self._data) * 8}b")
+        return bits[:n].encode("ascii").translate(_FROM_BITS)
+
+    def row(self, r: int, start: int = 0, stop: int | None = None) -> bytes:
+        """
+        Cells `start:stop` of row `r`, one byte (0 or 1) per cell.
+        """
+        stop = self.cols if stop is None else stop
+        if not (0 <= r < self.rows and 0 <= start <= stop <= self.cols):
+            raise IndexError(f"row slice {r}, {start}:{stop} is outside the {self.rows}x{self.cols} grid")
+        if start == stop:
+            return b""
+
+        first = r * self.cols + start
+        last = r * self.cols + stop
+        chunk = self._data[first >> 3:(last + 7) >> 3]
+        bits = format(int.from_bytes(chunk, "big"), f"0{len(chunk) * 8}b")
+        offset = first & 7
+        return bits[offset:offset + stop - start].encode("ascii").translate(_FROM_BITS)
+
+    def to_rows(self) -> list[list[int]]:
+        cells, cols = self.cells(), self.cols
+        return [list(cells[i:i + cols]) for i in range(0, len(cells), cols)]
+
+    def to_numpy(self) -> Any:
+        np = _numpy("to_numpy")
+        flat = np.unpackbits(np.frombuffer(bytes(self._data), dtype=np.uint8), count=self.rows * self.cols)
+        return flat.reshape(self.rows, self.cols)
+
+    def sha256(self) -> str:
+        digest = hashlib.sha256(f"{self.rows}x{self.cols}:".encode("ascii"))
+        digest.update(self._data)
+        return digest.hexdigest()
+
+    def rle(self) -> tuple[int, list[int]]:
+        """
+        Row-major run lengths: (value of the first run, [run lengths]).
+        """
+        bits = self.cells().translate(_TO_BITS)
+        if not bits:
+            return 0, []
+        return bits[0] - 0x30, [m.end() - m.start() for m in _RUN.finditer(bits)]
+
+    def diff(self, other: "OccupancyGrid") -> list[tuple[int, int, int]]:
+        """
+        Cells where `other` differs from this grid, as (row, col, value
+        in `other`).
+        """
+        if other.shape != self.shape:
+            raise ValueError("grids must have the same shape")
+
+        changed = int.from_bytes(self._data, "big") ^ int.from_bytes(other._data, "big")
+        if not changed:
+            return []
+
+        xor = changed.to_bytes(len(self._data), "big")
+        out = []
+        for match in _NONZERO.finditer(xor):
+            byte_index = match.start()
+            bits = xor[byte_index]
+            for k in range(8):
+                if bits & (0x80 >> k):
+                    r, c = divmod(byte_index * 8 + k, self.cols)
+                    out.append((r, c, other[r, c]))
+        return out
+
+
+def as_grid(grid: Any) -> OccupancyGrid:
+    """
+    Coerce nested lists, NumPy arrays and `OccupancyGrid` to an
+    `OccupancyGrid`.
+    """
+    if isinstance(grid, OccupancyGrid):
+        return grid
+    if type(grid).__module__ == "numpy":
+        return OccupancyGrid.from_numpy(grid)
+    if isinstance(grid, (bytes, bytearray, memoryview)):
+        raise TypeError(
+            "raw grid bytes have no shape; wrap them with "
+            "OccupancyGrid.frombytes(data, rows, cols)"
+        )
+    return OccupancyGrid.from_rows(grid)
+
+
+def _numpy(method: str) -> Any:
+    # Imported on use so that importing the SDK never loads NumPy.
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"OccupancyGrid.{method}() requires numpy. "
+            "Install it with: pip install 'praxis-sdk[numpy]'"
+        ) from None
+    return numpy
+
+
+def _row_bytes(row: Iterable[int]) -> bytes:
+    if isinstance(row, (bytes, bytearray)):
+        return bytes(row)
+    row = list(row)
+    try:
+        return bytes(row)
+    except (TypeError, ValueError):
+        return bytes(1 if v else 0 for v in row)
@@ -9,8 +9,13 @@ class Response(Generic[T]):
     High-level SDK response object.
     """
 
-    def __init__(self, envelope: Envelope):
+    def __init__(self, envelope: Envelope, cached: bool = False):
         self._envelope = envelope
+        self._cached = cached
+
+    @property
+    def envelope(self) -> Envelope:
+        return self._envelope
 
     @property
     def data(self) -> T:
@@ -28,8 +33,17 @@ class Response(Generic[T]):
     def success(self) -> bool:
         return self._envelope.success
 
+    @property
+    def cached(self) -> bool:
+        """
+        True when served from a client-side cache instead of the network.
+        `request_id` and `cost` are those of the original call.
+        """
+        return self._cached
+
     def __repr__(self) -> str:
         return (
             f"<Response success={self.success} "
-            f"cost={self.cost} request_id={self.request_id}>"
+            f"cost={self.cost} request_id={self.request_id}"
+            f"{' cached' if self._cached else ''}>"
         )
@@ -1,4 +1,89 @@
-from typing import Any
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Literal
+
+from praxis.core.tracing import (
+    SessionTrace,
+    TracedAPI,
+    attach_listener,
+    detach_listener,
+)
+
+
+class DeferredCall(Future[Any]):
+    """
+    Handle to a call queued by a batching `Session`.
+
+    Behaves like `concurrent.futures.Future`; the result (or the
+    exception raised by the call) becomes available once the session
+    is flushed.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._queued = True
+
+    def result(self, timeout: float | None = None) -> Any:
+        if self._queued:
+            raise ValueError(
+                "Call has not been executed yet. Call Session.flush() first."
+            )
+        return super().result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        if self._queued:
+            raise ValueError(
+                "Call has not been executed yet. Call Session.flush() first."
+            )
+        return super().exception(timeout)
+
+    def _run(self) -> None:
+        if not self.set_running_or_notify_cancel():
+            return
+
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except BaseException as exc:
+            self.set_exception(exc)
+        else:
+            self.set_result(result)
+
+
+class DeferredAPI:
+    """
+    Wraps a domain API so that every public method call is queued
+    on the session and returns a `DeferredCall` instead of executing.
+    """
+
+    def __init__(self, api: Any, session: "Session"):
+        self._api = api
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def method(*args: Any, **kwargs: Any) -> DeferredCall:
+            return self._session._enqueue(attr, args, kwargs)
+
+        setattr(self, name, method)
+        return method
+
+    def __repr__(self) -> str:
+        return f"<DeferredAPI {type(self._api).__name__}>"
 
 
 class Session:
@@ -9,35 +94,181 @@ class Session:
     Useful for:
     - agent loops
     - multi-step workflows
-    - future optimizations (batching, tracing)
+    - batching independent calls
+
+    With `batch=True`, API calls made through the session are queued
+    and return `DeferredCall` handles. Queued calls run concurrently
+    (at most `max_concurrency` at a time) on `flush()` or when the
+    `with` block exits, so N independent calls cost roughly one round
+    trip of wall-clock latency instead of N. Errors are captured per
+    call on its handle and never abort the rest of the batch.
+
+    With `trace=True` (the default), every call made through the
+    session is recorded in `session.trace`, a ring buffer of the last
+    `trace_capacity` calls with latency, bytes, retries and cost. The
+    hook that collects network details is only registered on the client
+    while a traced call or `with` block is running.
     """
 
-    def __init__(self, client: Any):
+    def __init__(
+        self,
+        client: Any,
+        batch: bool = False,
+        max_concurrency: int | None = None,
+        trace: bool = True,
+        trace_capacity: int = 1024,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
         self._client = client
         self._active = False
+        self._batch = batch
+        # Default to the connection pool size so a flush never opens
+        # more sockets than the pool keeps alive.
+        self._max_concurrency = max_concurrency or client.config.pool_maxsize
 
-    def __enter__(self):
+        self._lock = threading.Lock()
+        self._pending: list[DeferredCall] = []
+        self._apis: dict[str, Any] = {}
+
+        self._trace = SessionTrace(trace_capacity) if trace else None
+
+    def __enter__(self) -> "Session":
+        # Keep the trace listener attached for the whole block rather
+        # than per call; it is detached again on exit.
+        if self._trace is not None:
+            attach_listener(self._client.hooks)
         self._active = True
         return self
 
-    def __exit__(self, exc_type, exc, tb):
-        self._active = False
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                self.cancel()
+        finally:
+            self._active = False
+            if self._trace is not None:
+                detach_listener(self._client.hooks)
         return False  # propagate exceptions
 
+    @property
+    def trace(self) -> SessionTrace | None:
+        """
+        Calls recorded by this session, if tracing is enabled.
+        """
+        return self._trace
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of queued calls not yet flushed.
+        """
+        return len(self._pending)
+
+    def flush(self) -> list[DeferredCall]:
+        """
+        Execute all queued calls concurrently and wait for them.
+
+        Returns:
+            The flushed handles, in the order they were queued.
+        """
+        with self._lock:
+            calls, self._pending = self._pending, []
+
+        for call in calls:
+            call._queued = False
+
+        if not calls:
+            return calls
+
+        workers = min(self._max_concurrency, len(calls))
+        if workers == 1:
+            for call in calls:
+                call._run()
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for call in calls:
+                    pool.submit(call._run)
+
+        return calls
+
+    def cancel(self) -> int:
+        """
+        Drop all queued calls without executing them.
+
+        Returns:
+            Number of cancelled calls.
+        """
+        with self._lock:
+            calls, self._pending = self._pending, []
+
+        for call in calls:
+            call._queued = False
+            call.cancel()
+
+        return len(calls)
+
+    def _enqueue(
+        self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> DeferredCall:
+        call = DeferredCall(fn, args, kwargs)
+        with self._lock:
+            self._pending.append(call)
+        return call
+
+    def _api(self, name: str) -> Any:
+        api = self._apis.get(name)
+        if api is None:
+            api = getattr(self._client, name)
+            if self._trace is not None:
+                api = TracedAPI(api, name, self._trace, self._client.hooks)
+            if self._batch:
+                api = DeferredAPI(api, self)
+            self._apis[name] = api
+        return api
+
     # Pass-through access to APIs
 
     @property
-    def physics(self):
-        return self._client.physics
+    def physics(self) -> Any:
+        return self._api("physics")
+
+    @property
+    def navigation(self) -> Any:
+        return self._api("navigation")
+
+    @property
+    def simulation(self) -> Any:
+        return self._api("simulation")
+
+    @property
+    def vision(self) -> Any:
+        return self._api("vision")
+
+    @property
+    def manipulation(self) -> Any:
+        return self._api("manipulation")
+
+    @property
+    def sorting(self) -> Any:
+        return self._api("sorting")
 
     @property
-    def navigation(self):
-        return self._client.navigation
+    def analytics(self) -> Any:
+        return self._api("analytics")
 
     @property
-    def simulation(self):
-        return self._client.simulation
+    def assembly(self) -> Any:
+        return self._api("assembly")
 
     @property
-    def vision(self):
-        return self._client.vision
+    def multi_agent(self) -> Any:
+        return self._api("multi_agent")
@@ -0,0 +1,131 @@
+# tests/conftest.py
+import base64
+import email.parser
+import email.policy
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubBackend:
+    """
+    Minimal local PRAXIS backend speaking the response envelope.
+
+    Every request is recorded. Per-path handlers may be registered as
+    `handlers[path] = fn(body) -> (status, payload)`; by default the
+    request body is echoed back as `data`. Gzip request bodies are
+    decoded, and multipart bodies become a dict of fields with file
+    parts base64-encoded. Responses are gzipped when `gzip_responses`
+    is set and the client accepts it.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.peers = set()
+        self.handlers = {}
+        self.gzip_responses = False
+        self._lock = threading.Lock()
+        self._counter = 0
+
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                backend._dispatch(self, None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                backend._dispatch(self, self.rfile.read(length))
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def envelope(self, data, cost=0.001):
+        with self._lock:
+            self._counter += 1
+            request_id = f"req-{self._counter}"
+
+        return {
+            "success": True,
+            "data": data,
+            "error": None,
+            "message": None,
+            "cost": cost,
+            "request_id": request_id,
+        }
+
+    def _dispatch(self, handler, raw):
+        path = handler.path.split("?")[0]
+        data = raw
+        if raw and handler.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(raw)
+        content_type = handler.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/form-data"):
+            body = _parse_multipart(content_type, data)
+        else:
+            body = json.loads(data) if data else None
+
+        with self._lock:
+            self.requests.append((handler.command, path, dict(handler.headers), raw))
+            self.peers.add(handler.client_address)
+
+        fn = self.handlers.get(path)
+        if fn is None:
+            status, payload = 200, self.envelope(body)
+        else:
+            status, payload = fn(body)
+
+        out = json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        if self.gzip_responses and "gzip" in handler.headers.get("Accept-Encoding", ""):
+            out = gzip.compress(out)
+            handler.send_header("Content-Encoding", "gzip")
+        handler.send_header("Content-Length", str(len(out)))
+        handler.end_headers()
+        handler.wfile.write(out)
+
+
+def _parse_multipart(content_type, raw):
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+    )
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        value = part.get_payload(decode=True)
+        if part.get_filename() is not None:
+            fields[name] = base64.b64encode(value).decode("ascii")
+            fields[f"{name}_filename"] = part.get_filename()
+        else:
+            fields[name] = value.decode("utf-8")
+    return fields
+
+
+@pytest.fixture
+def backend():
+    server = StubBackend()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,32 @@
+# tests/test_async_client.py
+import asyncio
+import inspect
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from praxis import AsyncClient
+
+
+def test_async_methods_are_coroutines():
+    client = AsyncClient(api_key="praxis-demo-key", base_url="https://api.prraas.tech")
+
+    assert inspect.iscoroutinefunction(client.physics.force)
+    assert inspect.iscoroutinefunction(client.navigation.plan)
+    assert inspect.iscoroutinefunction(client.multi_agent.check_conflicts)
+
+
+def test_async_requests_share_pool(backend):
+    async def main():
+        async with AsyncClient(api_key="praxis-demo-key", base_url=backend.url) as client:
+            return await asyncio.gather(
+                *(client.physics.force(mass=i, acceleration=2) for i in range(50))
+            )
+
+    results = asyncio.run(main())
+
+    assert all(r.success for r in results)
+    assert [r.data["mass"] for r in results] == list(range(50))
+    assert len(backend.requests) == 50
+
@@ -0,0 +1,118 @@
+# tests/test_broadphase.py
+import random
+
+import pytest
+
+from praxis.compute import collision
+from praxis.compute.broadphase import SweepAndPrune
+
+
+def _scene(n=60, seed=11):
+    rng = random.Random(seed)
+    return {
+        f"obj-{i}": {
+            "x": rng.uniform(0, 30), "y": rng.uniform(0, 10), "z": 0.0,
+            "w": 1.5, "h": 1.0, "d": 1.0,
+            "rotation": {"z": rng.uniform(0, 90)},
+        }
+        for i in range(n)
+    }
+
+
+def _unordered(pairs):
+    return sorted(tuple(sorted(pair)) for pair in pairs)
+
+
+def _brute_force(scene):
+    keys = list(scene)
+    result = collision.obb_collisions([scene[k] for k in keys])
+    return _unordered((keys[c["a"]], keys[c["b"]]) for c in result["collisions"])
+
+
+def test_collisions_match_brute_force():
+    scene = _scene()
+    sap = SweepAndPrune()
+    for key, box in scene.items():
+        sap.insert(key, box)
+
+    found = sap.collisions()
+
+    assert _unordered((c["a"], c["b"]) for c in found) == _brute_force(scene)
+    assert len(sap.candidate_pairs()) < len(scene) * (len(scene) - 1) // 2
+    assert sap.axis == "x"  # the scene is spread out along x
+
+
+def test_updates_and_removals_stay_exact():
+    scene = _scene()
+    sap = SweepAndPrune(margin=0.5)
+    for key, box in scene.items():
+        sap.insert(key, box)
+
+    rng = random.Random(3)
+    for _ in range(5):
+        for key, box in scene.items():
+            box["x"] += rng.uniform(-1, 1)
+            box["y"] += rng.uniform(-1, 1)
+            sap.update(key, box)
+        assert _unordered((c["a"], c["b"]) for c in sap.collisions()) == _brute_force(scene)
+
+    for key in list(scene)[::2]:
+        sap.remove(key)
+        del scene[key]
+    assert len(sap) == len(scene)
+    assert _unordered((c["a"], c["b"]) for c in sap.collisions()) == _brute_force(scene)
+
+
+def test_small_moves_inside_margin_keep_bounds():
+    sap = SweepAndPrune(margin=0.5)
+    sap.insert("a", [0, 0, 0, 1, 1, 1])
+
+    assert sap.update("a", [0.2, 0, 0, 1, 1, 1]) is False
+    assert sap.update("a", [1.0, 0, 0, 1, 1, 1]) is True
+
+
+def test_aabb_narrowphase_ignores_rotation():
+    sap = SweepAndPrune()
+    sap.insert("a", {"x": 0, "y": 0, "z": 0, "w": 2, "h": 2, "d": 2})
+    sap.insert("b", {"x": 1.5, "y": 0, "z": 0, "w": 2, "h": 2, "d": 2})
+
+    (hit,) = sap.collisions(kind="aabb")
+
+    assert {hit["a"], hit["b"]} == {"a", "b"}
+    assert hit["min_translation_vector"] == {"axis": "x", "depth": 0.5}
+
+
+@pytest.mark.parametrize("kind", ["aabb", "obb"])
+def test_collisions_match_batch_checks_with_rotation(kind):
+    scene = _scene(seed=5)
+    scene["long"] = {"x": 0, "y": 0, "z": 0, "w": 10, "h": 0.1, "d": 0.1, "rotation": {"z": 45}}
+    scene["tip"] = {"x": 4.5, "y": 0, "z": 0, "w": 0.5, "h": 0.5, "d": 0.5}
+    sap = SweepAndPrune()
+    for key, box in scene.items():
+        sap.insert(key, box)
+
+    keys = list(scene)
+    batch = collision.aabb_collisions if kind == "aabb" else collision.obb_collisions
+    expected = batch([scene[k] for k in keys])["collisions"]
+    found = sap.collisions(kind=kind)
+
+    assert _unordered((c["a"], c["b"]) for c in found) == _unordered(
+        (keys[c["a"]], keys[c["b"]]) for c in expected
+    )
+    assert (("long", "tip") in _unordered((c["a"], c["b"]) for c in found)) is (kind == "aabb")
+
+
+def test_invalid_usage():
+    sap = SweepAndPrune()
+    sap.insert("a", [0, 0, 0, 1, 1, 1])
+
+    with pytest.raises(ValueError, match="already"):
+        sap.insert("a", [0, 0, 0, 1, 1, 1])
+    with pytest.raises(KeyError):
+        sap.update("missing", [0, 0, 0, 1, 1, 1])
+    with pytest.raises(ValueError, match="margin"):
+        SweepAndPrune(margin=-1)
+    with pytest.raises(ValueError, match="unknown key"):
+        sap.insert("b", {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "dpeth": 1})
+    with pytest.raises(ValueError, match="rotation has unknown key"):
+        sap.update("a", {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1, "rotation": {"yaw": 9}})
@@ -0,0 +1,109 @@
+# tests/test_cache.py
+from praxis import Client
+from praxis.core.cache import ResultCache, cache_key
+from praxis.core.disk_cache import DiskCache
+from praxis.models.envelope import Envelope
+from praxis.models.response import Response
+
+
+def test_cache_key_is_canonical():
+    a = cache_key("/api/v1/physics/force", {"mass": 1, "acceleration": 2})
+    b = cache_key("/api/v1/physics/force", {"acceleration": 2, "mass": 1})
+    c = cache_key("/api/v1/physics/mass", {"mass": 1, "acceleration": 2})
+
+    assert a == b
+    assert a != c
+
+
+def test_deterministic_calls_are_served_from_cache(backend):
+    with Client(api_key="praxis-demo-key", base_url=backend.url, cache=True) as client:
+        first = client.physics.force(mass=2, acceleration=3)
+        second = client.physics.force(mass=2, acceleration=3)
+
+        assert len(backend.requests) == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.request_id == first.request_id
+        assert second.cost == first.cost
+        assert client.cache.stats.hits == 1
+        assert client.cache.stats.misses == 1
+
+
+def test_non_enabled_endpoints_bypass_cache(backend):
+    cache = ResultCache(endpoints={"/api/v1/physics/force"})
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, cache=cache) as client:
+        client.physics.mass(volume=1, density=2)
+        client.physics.mass(volume=1, density=2)
+
+    assert len(backend.requests) == 2
+    assert cache.stats.entries == 0
+
+
+def test_cache_bounds_and_ttl():
+    cache = ResultCache(max_entries=2, ttl=0.0)
+    res = Response(Envelope(True, {}, None, None, 0.001, "req-1"))
+    cache.put("a", res, 10)
+
+    # ttl=0 expires immediately
+    assert cache.get("a") is None
+
+    cache = ResultCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, res, 10)
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_cached_data_is_isolated_from_callers():
+    cache = ResultCache()
+    original = Response(Envelope(True, {"result": {"path": [[0, 0]]}}, None, None, 0.001, "req-1"))
+    cache.put("a", original, 10)
+
+    original.data["result"]["path"].append([0, 1])
+    first = cache.get("a")
+    first.data["result"]["path"].append([9, 9])
+    first.data["extra"] = True
+
+    assert cache.get("a").data == {"result": {"path": [[0, 0]]}}
+
+
+def test_disk_cache_is_shared_across_clients(backend, tmp_path):
+    path = tmp_path / "praxis-cache.sqlite"
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, disk_cache=path) as warm:
+        first = warm.physics.force(mass=2, acceleration=3)
+
+    # A fresh client (as a new worker process would) starts warm.
+    with Client(
+        api_key="praxis-demo-key",
+        base_url=backend.url,
+        cache=True,
+        disk_cache=path,
+    ) as cold:
+        second = cold.physics.force(mass=2, acceleration=3)
+        third = cold.physics.force(mass=2, acceleration=3)
+
+        assert cold.disk_cache.stats.hits == 1
+        assert cold.cache.stats.hits == 1
+
+    assert len(backend.requests) == 1
+    assert second.cached is True
+    assert second.request_id == first.request_id
+    assert third.data == first.data
+
+
+def test_disk_cache_evicts_by_size(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", max_bytes=400)
+    res = Response(Envelope(True, {"v": "x" * 50}, None, None, 0.001, "req-1"))
+
+    for i in range(10):
+        cache.put(f"key-{i}", res, 0)
+
+    stats = cache.stats
+    assert stats.bytes <= 400
+    assert stats.evictions > 0
+    assert cache.get("key-9") is not None
+    assert cache.get("key-0") is None
@@ -0,0 +1,95 @@
+# tests/test_coalesce.py
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from praxis import Client
+from praxis.core.coalesce import SingleFlight
+
+
+def _slow_echo(backend, delay=0.2):
+    def handler(body):
+        time.sleep(delay)
+        return 200, backend.envelope(body)
+
+    return handler
+
+
+def test_identical_concurrent_calls_are_collapsed(backend):
+    backend.handlers["/api/v1/simulate/navigation"] = _slow_echo(backend)
+    grid = [[0] * 5 for _ in range(5)]
+    barrier = threading.Barrier(8)
+
+    def plan(_):
+        barrier.wait()
+        return client.navigation.plan(grid=grid, start=(0, 0), goal=(4, 4))
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, coalesce=True) as client:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(plan, range(8)))
+
+        stats = client.coalescer.stats
+
+    assert len(backend.requests) == 1
+    assert len({r.request_id for r in results}) == 1
+    assert stats.calls == 8
+    assert stats.collapsed == 7
+
+
+def test_different_payloads_are_not_collapsed(backend):
+    backend.handlers["/api/v1/physics/force"] = _slow_echo(backend, 0.05)
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, coalesce=True) as client:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: client.physics.force(mass=i, acceleration=1), range(4)))
+
+        assert client.coalescer.stats.collapsed == 0
+
+    assert len(backend.requests) == 4
+
+
+def test_async_calls_are_collapsed(backend):
+    pytest.importorskip("httpx")
+    from praxis import AsyncClient
+
+    backend.handlers["/api/v1/vision/segment"] = _slow_echo(backend)
+
+    async def main():
+        async with AsyncClient(
+            api_key="praxis-demo-key", base_url=backend.url, coalesce=True
+        ) as client:
+            await asyncio.gather(*(client.vision.segment(image="frame") for _ in range(10)))
+            return client.coalescer.stats
+
+    stats = asyncio.run(main())
+
+    assert len(backend.requests) == 1
+    assert stats.collapsed == 9
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight()
+    executed = []
+
+    async def fetch():
+        executed.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "result"
+    assert executed == [1]
+    assert flight.stats.collapsed == 1
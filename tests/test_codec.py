@@ -0,0 +1,56 @@
+# tests/test_codec.py
+import pytest
+
+from praxis import Client
+from praxis.core.codec import JsonCodec, get_codec
+from praxis.core.serializer import Serializer
+from praxis.models.errors import InvalidEnvelopeError
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_round_trip(name):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} not installed")
+
+    payload = {"grid": [[0, 1], [1, 0]], "start": (0, 0), "cost": 0.5, "label": "é"}
+    decoded = codec.decode(codec.encode(payload))
+
+    assert decoded == {"grid": [[0, 1], [1, 0]], "start": [0, 0], "cost": 0.5, "label": "é"}
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        get_codec("pickle")
+
+
+def test_envelope_is_validated_in_one_pass():
+    payload = {
+        "success": True,
+        "data": {"force": 6.0},
+        "error": None,
+        "message": None,
+        "cost": 0.001,
+        "request_id": "req-1",
+    }
+    envelope = Serializer.to_envelope(payload)
+
+    assert envelope.data is payload["data"]
+    assert envelope.request_id == "req-1"
+
+    del payload["cost"]
+    with pytest.raises(InvalidEnvelopeError, match="cost"):
+        Serializer.to_envelope(payload)
+
+    with pytest.raises(InvalidEnvelopeError):
+        Serializer.to_envelope([1, 2, 3])
+
+
+def test_client_uses_configured_codec(backend):
+    with Client(api_key="praxis-demo-key", base_url=backend.url, codec="json") as client:
+        assert isinstance(client.config.codec, JsonCodec)
+        res = client.physics.force(mass=2, acceleration=3)
+
+    assert res.data == {"mass": 2, "acceleration": 3}
+    assert backend.requests[0][3] == b'{"mass":2,"acceleration":3}'
@@ -0,0 +1,112 @@
+# tests/test_collision.py
+import random
+
+import pytest
+
+from praxis import Client
+from praxis.compute import collision, physics
+
+
+@pytest.fixture(params=["numpy", "python"])
+def impl(request, monkeypatch):
+    if request.param == "numpy":
+        if collision.np is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(collision, "np", None)
+    return request.param
+
+
+def _scene(n=40, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "x": rng.uniform(0, 10), "y": rng.uniform(0, 10), "z": 0.0,
+            "w": 1.5, "h": 1.0, "d": 1.0,
+            "rotation": {"z": rng.uniform(0, 90)},
+        }
+        for _ in range(n)
+    ]
+
+
+def _pairs(result):
+    return [(c["a"], c["b"]) for c in result["collisions"]]
+
+
+def test_aabb_batch_matches_pairwise(impl):
+    boxes = [{k: v for k, v in box.items() if k != "rotation"} for box in _scene()]
+
+    result = collision.aabb_collisions(boxes)
+
+    expected = [
+        (i, j)
+        for i in range(len(boxes))
+        for j in range(i + 1, len(boxes))
+        if physics.collision(boxes[i], boxes[j])["colliding"]
+    ]
+    assert sorted(_pairs(result)) == expected
+    assert result["checked"] == len(boxes) * (len(boxes) - 1) // 2
+    for entry in result["collisions"]:
+        single = physics.collision(boxes[entry["a"]], boxes[entry["b"]])
+        assert entry["penetration"] == pytest.approx(single["penetration"])
+        assert entry["min_translation_vector"] == single["min_translation_vector"]
+
+
+def test_obb_batch_matches_pairwise(impl):
+    boxes = _scene()
+
+    result = collision.obb_collisions(boxes)
+
+    expected = [
+        (i, j)
+        for i in range(len(boxes))
+        for j in range(i + 1, len(boxes))
+        if physics.collision_obb(boxes[i], boxes[j])["colliding"]
+    ]
+    assert sorted(_pairs(result)) == expected
+    for entry in result["collisions"]:
+        single = physics.collision_obb(boxes[entry["a"]], boxes[entry["b"]])
+        mtv = entry["min_translation_vector"]
+        assert mtv["depth"] == pytest.approx(single["min_translation_vector"]["depth"])
+        assert mtv["axis"] == pytest.approx(single["min_translation_vector"]["axis"])
+
+
+def test_sphere_batch_across_two_sets(impl):
+    a = [{"x": 0, "y": 0, "z": 0, "radius": 1}, [5, 0, 0, 1]]
+    b = [{"x": 1.5, "y": 0, "z": 0, "radius": 1}, {"x": 20, "y": 0, "z": 0, "radius": 1}]
+
+    result = collision.sphere_collisions(a, b)
+
+    assert _pairs(result) == [(0, 0)]
+    assert result["checked"] == 4
+    assert result["collisions"][0]["penetration_depth"] == pytest.approx(0.5)
+
+
+def test_numpy_arrays_are_accepted():
+    np = pytest.importorskip("numpy")
+    rows = np.array([[0, 0, 0, 2, 2, 2], [1, 0, 0, 2, 2, 2], [9, 9, 9, 1, 1, 1]])
+
+    assert _pairs(collision.aabb_collisions(rows)) == [(0, 1)]
+    assert _pairs(collision.obb_collisions(rows)) == [(0, 1)]
+
+
+def test_invalid_rows_raise():
+    with pytest.raises(ValueError, match=r"boxes_a\[1\] is missing key 'w'"):
+        collision.aabb_collisions([{"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1}, {"x": 0, "y": 0, "z": 0}])
+    with pytest.raises(ValueError, match="sequence of 4 numbers"):
+        collision.sphere_collisions([[0, 0, 0]])
+    with pytest.raises(ValueError, match=r"spheres_a\[0\] has unknown key\(s\) 'r'"):
+        collision.sphere_collisions([{"x": 0, "y": 0, "z": 0, "r": 1}])
+    with pytest.raises(ValueError, match=r"boxes_b\[0\]\.rotation has unknown key\(s\) 'yaw'"):
+        collision.obb_collisions([], [{"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1, "rotation": {"yaw": 9}}])
+
+
+def test_batch_methods_run_locally(backend):
+    client = Client(api_key="k", base_url=backend.url)
+
+    res = client.physics.collision_batch(_scene(10))
+
+    assert res.request_id.startswith("local-")
+    assert res.cost == 0.0
+    assert res.data["checked"] == 45
+    assert backend.requests == []
@@ -0,0 +1,73 @@
+# tests/test_compression.py
+import gzip
+import json
+
+import pytest
+
+from praxis import Client
+from praxis.core.compression import Compression
+
+
+def test_small_bodies_are_sent_as_is():
+    compression = Compression(threshold=1024)
+    body = b'{"mass": 2}'
+
+    assert compression.compress("/p", body) == (body, None)
+    assert compression.stats["/p"].compressed == 0
+
+
+def test_large_bodies_are_gzipped():
+    compression = Compression(threshold=64)
+    body = json.dumps({"grid": [[0] * 100] * 100}).encode()
+
+    packed, encoding = compression.compress("/p", body)
+
+    assert encoding == "gzip"
+    assert gzip.decompress(packed) == body
+    stats = compression.stats["/p"]
+    assert stats.compressed == 1
+    assert stats.bytes_saved == len(body) - len(packed)
+
+
+def test_incompressible_bodies_are_sent_as_is():
+    compression = Compression(threshold=16)
+    body = bytes(range(256))
+
+    assert compression.compress("/p", body) == (body, None)
+
+
+def test_unknown_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        Compression(algorithm="brotli")
+
+
+def test_client_compresses_large_requests(backend):
+    client = Client(api_key="k", base_url=backend.url, compression=Compression(threshold=256))
+    grid = [[0] * 50 for _ in range(50)]
+
+    result = client.navigation.plan(grid, (0, 0), (49, 49))
+
+    _, _, headers, raw = backend.requests[-1]
+    assert headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(raw))["grid"] == grid
+    assert result.data["grid"] == grid
+
+    client.physics.force(mass=2, acceleration=3)
+    _, _, headers, _ = backend.requests[-1]
+    assert "Content-Encoding" not in headers
+
+
+def test_compressed_responses_are_counted(backend):
+    backend.gzip_responses = True
+    client = Client(api_key="k", base_url=backend.url, compression=True)
+    grid = [[0] * 50 for _ in range(50)]
+
+    result = client.navigation.plan(grid, (0, 0), (49, 49))
+
+    assert result.data["grid"] == grid
+    _, _, headers, _ = backend.requests[-1]
+    assert "gzip" in headers["Accept-Encoding"]
+
+    stats = client.compression.stats["/api/v1/simulate/navigation"]
+    assert stats.response_wire_bytes < stats.response_bytes
+    assert stats.bytes_saved > 0
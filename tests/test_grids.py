@@ -0,0 +1,233 @@
+# tests/test_grids.py
+import asyncio
+import json
+import random
+
+import pytest
+
+from praxis import AsyncClient, Client, OccupancyGrid
+from praxis.core.grids import GridTransport
+
+
+def _random_grid(rows=23, cols=17, density=0.3, seed=3):
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def _decode(body, store):
+    """
+    Server side of the grid transport: returns the grid as nested lists.
+    """
+    if "grid_ref" in body:
+        if body["grid_ref"] not in store:
+            return None
+        grid = store[body["grid_ref"]].copy()
+        for r, c, v in body.get("grid_patch", []):
+            grid[r, c] = v
+    elif isinstance(body["grid"], dict):
+        spec = body["grid"]
+        if spec["encoding"] == "rle":
+            grid = OccupancyGrid.from_rle(spec["shape"], spec["first"], spec["runs"])
+        else:
+            grid = OccupancyGrid.from_bitpack(spec["shape"], spec["data"])
+    else:
+        grid = OccupancyGrid.from_rows(body["grid"])
+
+    if "grid_hash" in body:
+        assert grid.sha256() == body["grid_hash"]
+        store[body["grid_hash"]] = grid
+    return grid.to_rows()
+
+
+@pytest.fixture
+def grid_backend(backend):
+    backend.store = {}
+    backend.grids = []
+
+    def plan(body):
+        grid = _decode(body, backend.store)
+        if grid is None:
+            return 404, {"error": "not_found", "message": "unknown grid_ref"}
+        backend.grids.append(grid)
+        return 200, backend.envelope({"result": {"rows": len(grid)}})
+
+    backend.handlers["/api/v1/simulate/navigation"] = plan
+    return backend
+
+
+def _sent(backend):
+    return [json.loads(raw) for _, _, _, raw in backend.requests]
+
+
+def test_occupancy_grid_round_trips():
+    rows = _random_grid()
+    grid = OccupancyGrid.from_rows(rows)
+
+    assert grid.shape == (23, 17)
+    assert grid.nbytes == (23 * 17 + 7) // 8
+    assert grid.to_rows() == rows
+    assert grid[0, 0] == rows[0][0]
+    assert OccupancyGrid.from_rle(grid.shape, *grid.rle()) == grid
+    assert OccupancyGrid.frombytes(bytes(sum(rows, [])), 23, 17) == grid
+
+
+def test_occupancy_grid_numpy_round_trip():
+    np = pytest.importorskip("numpy")
+    rows = _random_grid()
+
+    grid = OccupancyGrid.from_numpy(np.array(rows, dtype=np.uint8))
+
+    assert grid.to_rows() == rows
+    assert grid.to_numpy().tolist() == rows
+
+
+def test_occupancy_grid_diff():
+    grid = OccupancyGrid.from_rows(_random_grid())
+    other = grid.copy()
+    other[4, 5] = 1 - grid[4, 5]
+    other[22, 16] = 1 - grid[22, 16]
+
+    assert grid.diff(other) == [(4, 5, other[4, 5]), (22, 16, other[22, 16])]
+    assert grid.diff(grid.copy()) == []
+    assert grid.sha256() != other.sha256()
+    with pytest.raises(IndexError):
+        grid[23, 0]
+
+
+def test_inline_encoding_then_reference_then_patch(grid_backend):
+    rows = _random_grid()
+    client = Client(api_key="k", base_url=grid_backend.url, grid_transport=True)
+
+    client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+    client.navigation.plan(grid=OccupancyGrid.from_rows(rows), start=(2, 2), goal=(1, 1))
+    rows[3][3] = 1 - rows[3][3]
+    client.simulation.navigate(grid=rows, start=(0, 0), goal=(1, 1))
+
+    first, second, third = _sent(grid_backend)
+    assert first["grid"]["encoding"] in ("rle", "bitpack")
+    assert second.keys() == {"grid_ref", "start", "goal"}
+    assert third["grid_patch"] == [[3, 3, rows[3][3]]]
+    assert grid_backend.grids[-1] == rows
+    stats = client.grid_transport.stats
+    assert (stats.inline, stats.references, stats.patches, stats.rejected) == (1, 1, 1, 0)
+    assert client.grid_transport.supported is True
+
+
+def test_unknown_reference_falls_back_to_inline(grid_backend):
+    rows = _random_grid()
+    client = Client(api_key="k", base_url=grid_backend.url, grid_transport=True)
+
+    client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+    grid_backend.store.clear()  # server restart
+    res = client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+
+    assert res.data["result"]["rows"] == 23
+    assert [set(body) & {"grid", "grid_ref"} for body in _sent(grid_backend)[1:]] == [
+        {"grid_ref"},
+        {"grid"},
+    ]
+    assert client.grid_transport.stats.rejected == 1
+
+
+def test_server_without_support_gets_nested_lists(backend):
+    rows = _random_grid()
+
+    def plan(body):
+        if not isinstance(body.get("grid"), list):
+            return 422, {"error": "validation_error", "message": "grid must be a list"}
+        return 200, backend.envelope({"grid": body["grid"]})
+
+    backend.handlers["/api/v1/simulate/navigation"] = plan
+    client = Client(api_key="k", base_url=backend.url, grid_transport=True)
+
+    first = client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+    second = client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+
+    assert first.data["grid"] == second.data["grid"] == rows
+    assert len(backend.requests) == 3  # inline rejected once, then lists only
+    assert client.grid_transport.supported is False
+
+
+def test_real_errors_are_not_retried(backend):
+    backend.handlers["/api/v1/simulate/navigation"] = lambda body: (
+        500,
+        {"error": "server_error", "message": "boom"},
+    )
+    client = Client(api_key="k", base_url=backend.url, grid_transport=True)
+
+    with pytest.raises(Exception, match="boom"):
+        client.navigation.plan(grid=_random_grid(), start=(0, 0), goal=(1, 1))
+    assert client.grid_transport.supported is None
+
+
+@pytest.mark.parametrize("status,error,message", [
+    (422, "validation_error", "start must be a pair of integers"),
+    (404, "not_found", "no route to goal"),
+    (400, "bad_request", "goal is blocked"),
+])
+def test_errors_unrelated_to_the_grid_are_not_retried(backend, status, error, message):
+    backend.handlers["/api/v1/simulate/navigation"] = lambda body: (
+        status,
+        {"error": error, "message": message},
+    )
+    client = Client(api_key="k", base_url=backend.url, grid_transport=True)
+
+    with pytest.raises(Exception, match=message):
+        client.navigation.plan(grid=_random_grid(), start=(0, 0), goal=(1, 1))
+    assert len(backend.requests) == 1
+    assert client.grid_transport.supported is None
+    assert client.grid_transport.stats.rejected == 0
+
+
+def test_unsupported_media_type_falls_back(backend):
+    def plan(body):
+        if not isinstance(body.get("grid"), list):
+            return 415, {"error": "unsupported_media_type", "message": "unsupported"}
+        return 200, backend.envelope({"grid": body["grid"]})
+
+    backend.handlers["/api/v1/simulate/navigation"] = plan
+    client = Client(api_key="k", base_url=backend.url, grid_transport=True)
+
+    res = client.navigation.plan(grid=_random_grid(), start=(0, 0), goal=(1, 1))
+
+    assert res.data["grid"] == _random_grid()
+    assert client.grid_transport.supported is False
+
+
+def test_grids_without_transport_are_sent_as_lists(backend):
+    np = pytest.importorskip("numpy")
+    rows = _random_grid()
+    client = Client(api_key="k", base_url=backend.url)
+
+    res = client.navigation.plan(grid=np.array(rows), start=(0, 0), goal=(1, 1))
+
+    assert res.data["grid"] == rows
+    with pytest.raises(TypeError, match="frombytes"):
+        client.navigation.plan(grid=b"\x00\x01", start=(0, 0), goal=(1, 1))
+
+
+def test_async_client_uses_transport(grid_backend):
+    pytest.importorskip("httpx")
+    rows = _random_grid()
+
+    async def main():
+        async with AsyncClient(api_key="k", base_url=grid_backend.url, grid_transport=True) as client:
+            await client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+            grid_backend.store.clear()
+            await client.navigation.plan(grid=rows, start=(0, 0), goal=(1, 1))
+            return client.grid_transport.stats
+
+    stats = asyncio.run(main())
+
+    assert (stats.inline, stats.rejected) == (2, 1)
+    assert grid_backend.grids == [rows, rows]
+
+
+def test_encoding_choice():
+    sparse = [[0] * 200 for _ in range(200)]
+    noisy = _random_grid(64, 64, density=0.5)
+
+    assert GridTransport()._inline(OccupancyGrid.from_rows(sparse))[0]["encoding"] == "rle"
+    assert GridTransport()._inline(OccupancyGrid.from_rows(noisy))[0]["encoding"] == "bitpack"
+    with pytest.raises(ValueError):
+        GridTransport(encoding="zip")
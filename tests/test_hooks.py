@@ -0,0 +1,157 @@
+# tests/test_hooks.py
+import asyncio
+
+import pytest
+
+from praxis import AsyncClient, Client
+from praxis.core.hooks import Hooks
+from praxis.core.metrics import MetricsAggregator
+from praxis.core.retries import RetryPolicy
+from praxis.exceptions import APIError
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, event):
+        self.events.append(("before_request", event))
+
+    def after_response(self, event):
+        self.events.append(("after_response", event))
+
+    def on_retry(self, event):
+        self.events.append(("on_retry", event))
+
+    def on_error(self, event):
+        self.events.append(("on_error", event))
+
+    def names(self):
+        return [name for name, _ in self.events]
+
+
+def _flaky(backend, failures):
+    calls = {"n": 0}
+
+    def handler(body):
+        calls["n"] += 1
+        if calls["n"] <= failures:
+            return 503, {"error": "unavailable"}
+        return 200, backend.envelope(body, cost=0.002)
+
+    return handler
+
+
+def test_hooks_receive_timing_breakdown(backend):
+    recorder = Recorder()
+    client = Client(api_key="k", base_url=backend.url, hooks=[recorder])
+
+    res = client.physics.force(mass=2, acceleration=3)
+
+    assert recorder.names() == ["before_request", "after_response"]
+    before = recorder.events[0][1]
+    after = recorder.events[1][1]
+
+    assert before.path == "/api/v1/physics/force"
+    assert before.request_bytes > 0
+    assert before.timings is None
+
+    assert after.request_id == res.request_id
+    assert after.cost == res.cost
+    assert after.status_code == 200
+    assert after.response_bytes > 0
+
+    timings = after.timings
+    assert timings.connect > 0  # first call opens a connection
+    assert timings.tls == 0
+    phases = timings.connect + timings.ttfb + timings.download + timings.decode + timings.validate
+    assert 0 < phases <= timings.total
+
+    client.physics.force(mass=2, acceleration=4)
+    assert recorder.events[-1][1].timings.connect == 0  # pooled connection reused
+
+
+def test_retries_and_errors_are_reported(backend):
+    backend.handlers["/api/v1/physics/force"] = _flaky(backend, failures=1)
+    recorder = Recorder()
+    retry = RetryPolicy(max_retries=1, backoff=0.0, budget=None)
+    client = Client(api_key="k", base_url=backend.url, retry=retry, hooks=[recorder])
+
+    client.physics.force(mass=1, acceleration=1)
+
+    assert recorder.names() == ["before_request", "on_retry", "after_response"]
+    retry_event = recorder.events[1][1]
+    assert retry_event.status_code == 503
+    assert isinstance(retry_event.error, APIError)
+    assert recorder.events[-1][1].retries == 1
+
+    backend.handlers["/api/v1/physics/force"] = _flaky(backend, failures=5)
+    with pytest.raises(APIError):
+        client.physics.force(mass=1, acceleration=1)
+
+    assert recorder.names()[-1] == "on_error"
+    assert recorder.events[-1][1].retries == 1
+
+
+def test_single_function_hooks_and_removal(backend):
+    client = Client(api_key="k", base_url=backend.url)
+    seen = []
+
+    listener = client.hooks.on("after_response", seen.append)
+    client.physics.mass(1, 2)
+    client.hooks.remove(listener)
+    client.physics.mass(1, 2)
+
+    assert len(seen) == 1
+    with pytest.raises(ValueError):
+        client.hooks.on("on_success", seen.append)
+
+
+def test_failing_hook_does_not_fail_request(backend):
+    hooks = Hooks()
+    hooks.on("after_response", lambda event: 1 / 0)
+    client = Client(api_key="k", base_url=backend.url, hooks=hooks)
+
+    with pytest.warns(RuntimeWarning):
+        res = client.physics.force(mass=1, acceleration=1)
+
+    assert res.success is True
+
+
+def test_metrics_aggregator_exports_prometheus(backend):
+    backend.handlers["/api/v1/physics/force"] = _flaky(backend, failures=1)
+    metrics = MetricsAggregator(buckets=(0.001, 10.0))
+    retry = RetryPolicy(max_retries=1, backoff=0.0, budget=None)
+    client = Client(api_key="k", base_url=backend.url, retry=retry, hooks=[metrics])
+
+    client.physics.force(mass=1, acceleration=1)
+    client.physics.force(mass=1, acceleration=2)
+
+    snapshot = metrics.snapshot()["/api/v1/physics/force"]
+    assert snapshot["requests"] == 2
+    assert snapshot["retries"] == 1
+    assert snapshot["cost"] == pytest.approx(0.004)
+    assert snapshot["buckets"][10.0] == 2
+
+    text = metrics.prometheus()
+    assert "# TYPE praxis_request_duration_seconds histogram" in text
+    assert 'praxis_request_duration_seconds_bucket{endpoint="/api/v1/physics/force",le="+Inf"} 2' in text
+    assert 'praxis_requests_total{endpoint="/api/v1/physics/force",outcome="success"} 2' in text
+    assert 'praxis_retries_total{endpoint="/api/v1/physics/force"} 1' in text
+
+
+def test_async_client_reports_timings(backend):
+    pytest.importorskip("httpx")
+    recorder = Recorder()
+
+    async def main():
+        async with AsyncClient(api_key="k", base_url=backend.url, hooks=[recorder]) as client:
+            return await client.physics.force(mass=2, acceleration=3)
+
+    res = asyncio.run(main())
+
+    assert recorder.names() == ["before_request", "after_response"]
+    after = recorder.events[-1][1]
+    assert after.request_id == res.request_id
+    assert after.timings.connect > 0
+    assert after.timings.ttfb > 0
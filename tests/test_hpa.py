@@ -0,0 +1,148 @@
+# tests/test_hpa.py
+import random
+from collections import deque
+from itertools import pairwise
+
+import pytest
+
+from praxis import Client, OccupancyGrid
+from praxis.compute.hpa import HierarchicalPlanner
+
+
+def _bfs(grid, start, goal):
+    rows, cols = len(grid), len(grid[0])
+    if grid[start[0]][start[1]] or grid[goal[0]][goal[1]]:
+        return []
+    parent = {tuple(start): None}
+    queue = deque([tuple(start)])
+    while queue:
+        cell = queue.popleft()
+        if cell == tuple(goal):
+            path = []
+            while cell is not None:
+                path.append(list(cell))
+                cell = parent[cell]
+            return path[::-1]
+        r, c = cell
+        for n in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= n[0] < rows and 0 <= n[1] < cols and not grid[n[0]][n[1]] and n not in parent:
+                parent[n] = cell
+                queue.append(n)
+    return []
+
+
+def _valid(grid, path, start, goal):
+    return (
+        path[0] == tuple(start)
+        and path[-1] == tuple(goal)
+        and all(
+            abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and not grid[b[0]][b[1]]
+            for a, b in pairwise(path)
+        )
+    )
+
+
+def _random_grid(rng, rows, cols, density=0.3):
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def test_paths_are_valid_and_near_optimal():
+    rng = random.Random(1)
+    ratios = []
+    for _ in range(30):
+        rows, cols = rng.randint(5, 50), rng.randint(5, 50)
+        grid = _random_grid(rng, rows, cols)
+        planner = HierarchicalPlanner(grid, cluster_size=rng.randint(2, 10))
+        for _ in range(15):
+            start = (rng.randrange(rows), rng.randrange(cols))
+            goal = (rng.randrange(rows), rng.randrange(cols))
+
+            path = planner.plan(start, goal)
+            shortest = _bfs(grid, start, goal)
+
+            if not shortest:
+                assert path == []
+                continue
+            assert _valid(grid, path, start, goal)
+            if len(shortest) > 1:
+                ratios.append((len(path) - 1) / (len(shortest) - 1))
+
+    assert sum(ratios) / len(ratios) < 1.1
+
+
+def test_set_cells_updates_affected_clusters():
+    rng = random.Random(4)
+    grid = _random_grid(rng, 40, 40, density=0.2)
+    grid[0][0] = grid[39][39] = 0
+    planner = HierarchicalPlanner(grid, cluster_size=8)
+    planner.plan((0, 0), (39, 39))
+
+    for _ in range(5):
+        changes = {(rng.randrange(40), rng.randrange(40)): rng.randint(0, 1) for _ in range(40)}
+        changes[(0, 0)] = changes[(39, 39)] = 0
+        planner.set_cells(changes)
+        for (r, c), value in changes.items():
+            grid[r][c] = value
+
+        path = planner.plan((0, 0), (39, 39))
+        assert bool(path) == bool(_bfs(grid, (0, 0), (39, 39)))
+        if path:
+            assert _valid(grid, path, (0, 0), (39, 39))
+
+
+def test_large_grid_only_touches_corridor_clusters():
+    grid = OccupancyGrid(2000, 2000)
+    for r in range(0, 1990):
+        grid[r, 1000] = 1
+
+    planner = HierarchicalPlanner(grid, cluster_size=32)
+    path = planner.plan((0, 0), (0, 1999))
+
+    assert len(path) - 1 == 2 * 1990 + 1999
+    assert planner.stats["clusters"] < (2000 // 32 + 1) ** 2
+
+
+def test_legs_are_refined_lazily():
+    grid = [[0] * 64 for _ in range(64)]
+    planner = HierarchicalPlanner(grid, cluster_size=8)
+
+    legs = planner.legs((0, 0), (63, 63))
+    first = next(legs)
+
+    assert first[0] == (0, 0)
+    assert planner.stats["local_legs"] == 1
+    rest = list(legs)
+    assert rest[-1][-1] == (63, 63)
+    assert all(a[-1] == b[0] for a, b in pairwise([first] + rest))
+
+
+def test_trivial_and_blocked_queries():
+    planner = HierarchicalPlanner([[0, 1], [0, 0]], cluster_size=2)
+
+    assert planner.plan((0, 0), (0, 0)) == [(0, 0)]
+    assert planner.plan((0, 0), (0, 1)) == []
+    with pytest.raises(ValueError, match="outside"):
+        planner.plan((0, 0), (5, 5))
+    with pytest.raises(ValueError):
+        HierarchicalPlanner([[0]], cluster_size=1)
+
+
+def test_remote_refinement_sends_cluster_sub_grids(backend):
+    def plan(body):
+        assert len(body["grid"]) <= 16 and len(body["grid"][0]) <= 16
+        path = _bfs(body["grid"], body["start"], body["goal"])
+        result = {"reachable": bool(path), "steps": max(0, len(path) - 1), "path": path}
+        return 200, backend.envelope({"result": result}, cost=0.01)
+
+    backend.handlers["/api/v1/simulate/navigation"] = plan
+    client = Client(api_key="k", base_url=backend.url)
+    grid = [[0] * 48 for _ in range(48)]
+    for r in range(40):
+        grid[r][20] = 1
+
+    planner = client.navigation.hierarchical_planner(grid, cluster_size=16, remote_refine=True)
+    path = planner.plan((0, 0), (47, 47))
+
+    assert _valid(grid, path, (0, 0), (47, 47))
+    assert planner.stats["remote_legs"] == len(backend.requests) > 0
+    assert planner.cost == pytest.approx(0.01 * len(backend.requests))
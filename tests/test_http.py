@@ -0,0 +1,43 @@
+# tests/test_http.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from praxis import Client
+
+
+def test_connections_are_reused(backend):
+    with Client(api_key="praxis-demo-key", base_url=backend.url) as client:
+        for i in range(5):
+            res = client.physics.force(mass=i, acceleration=1)
+            assert res.success is True
+            assert res.data == {"mass": i, "acceleration": 1}
+
+    assert len(backend.requests) == 5
+    assert len(backend.peers) == 1
+
+
+def test_pool_is_thread_safe(backend):
+    with Client(api_key="praxis-demo-key", base_url=backend.url, pool_maxsize=4) as client:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda i: client.physics.mass(i, 2.0), range(40)))
+
+    assert all(r.success for r in results)
+    assert len({r.request_id for r in results}) == 40
+    assert len(backend.peers) <= 4
+
+
+def test_keep_alive_disabled_opens_new_connections(backend):
+    with Client(api_key="praxis-demo-key", base_url=backend.url, keep_alive=False) as client:
+        client.physics.force(mass=1, acceleration=1)
+        client.physics.force(mass=2, acceleration=1)
+
+    assert len(backend.peers) == 2
+
+
+def test_closed_client_rejects_calls(backend):
+    client = Client(api_key="praxis-demo-key", base_url=backend.url)
+    client.close()
+
+    with pytest.raises(ValueError):
+        client.physics.force(mass=1, acceleration=1)
@@ -0,0 +1,69 @@
+# tests/test_imports.py
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_after(code: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(out.stdout.split())
+
+
+def test_import_praxis_loads_nothing_heavy():
+    loaded = _loaded_after("import praxis")
+
+    assert "requests" not in loaded
+    assert "praxis.client" not in loaded
+    assert not any(name.startswith("praxis.api.") for name in loaded)
+
+
+def test_client_builds_domain_apis_on_first_access():
+    loaded = _loaded_after(
+        "from praxis import Client\nClient(api_key='k').physics"
+    )
+
+    assert "praxis.api.physics" in loaded
+    assert "praxis.api.vision" not in loaded
+    assert "asyncio" not in loaded
+
+
+@pytest.mark.parametrize("client", ["Client", "AsyncClient"])
+def test_client_construction_skips_optional_features(client):
+    if client == "AsyncClient":
+        pytest.importorskip("httpx")
+    loaded = _loaded_after(f"from praxis import {client}\n{client}(api_key='k')")
+
+    assert "sqlite3" not in loaded
+    assert "praxis.core.grids" not in loaded
+    assert not any(name.startswith("praxis.compute") for name in loaded)
+
+
+@pytest.mark.parametrize("name", ["Client", "AsyncClient", "PhysicsAPI", "spatial_utils"])
+def test_lazy_exports_resolve(name):
+    import praxis
+
+    assert getattr(praxis, name) is not None
+    assert name in dir(praxis)
+
+
+def test_unknown_attribute_raises():
+    import praxis
+
+    missing = "DoesNotExist"
+    with pytest.raises(AttributeError):
+        getattr(praxis, missing)
+
+
+def test_domain_api_is_built_once(backend):
+    from praxis import Client
+
+    client = Client(api_key="k", base_url=backend.url)
+
+    assert "physics" not in vars(client)
+    assert client.physics is client.physics
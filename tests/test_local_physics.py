@@ -0,0 +1,176 @@
+# tests/test_local_physics.py
+import pytest
+
+from praxis import Client
+from praxis.compute import physics
+
+# Server responses recorded from the live API (see docs/api-reference.md).
+# Only the recorded keys are compared, so partial recordings are fine.
+RECORDED = [
+    ("force", {"mass": 2, "acceleration": 3}, {"force": 6.0}),
+    (
+        "collision",
+        {
+            "box_a": {"x": 0, "y": 0, "z": 0, "w": 2, "h": 2, "d": 2},
+            "box_b": {"x": 1, "y": 1, "z": 1, "w": 2, "h": 2, "d": 2},
+        },
+        {
+            "colliding": True,
+            "penetration": {"x": 1.0, "y": 1.0, "z": 1.0},
+            "min_translation_vector": {"axis": "x", "depth": 1.0},
+            "warnings": ["Objects are overlapping — collision detected"],
+        },
+    ),
+    (
+        "collision",
+        {
+            "box_a": {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1},
+            "box_b": {"x": 10, "y": 10, "z": 10, "w": 1, "h": 1, "d": 1},
+        },
+        {"colliding": False, "penetration": {"x": 0.0}},
+    ),
+    (
+        "resistance",
+        {"velocity": 10.0, "drag_coefficient": 0.47, "cross_sectional_area": 1.0},
+        {
+            "drag_force": 28.7875,
+            "velocity": 10.0,
+            "drag_coefficient": 0.47,
+            "cross_sectional_area": 1.0,
+            "fluid_density": 1.225,
+            "warnings": None,
+        },
+    ),
+    (
+        "resistance",
+        {"velocity": 0.0, "drag_coefficient": 0.47, "cross_sectional_area": 1.0},
+        {"drag_force": 0.0},
+    ),
+]
+
+
+def _assert_matches(actual, recorded, where="data"):
+    if isinstance(recorded, dict):
+        for key, value in recorded.items():
+            assert key in actual, f"{where}.{key} missing"
+            _assert_matches(actual[key], value, f"{where}.{key}")
+    elif isinstance(recorded, float):
+        assert actual == pytest.approx(recorded, rel=1e-9, abs=1e-12), where
+    else:
+        assert actual == recorded, where
+
+
+@pytest.mark.parametrize("execution", ["local", "auto"])
+@pytest.mark.parametrize("method,kwargs,recorded", RECORDED)
+def test_local_results_match_recorded_server_responses(backend, execution, method, kwargs, recorded):
+    client = Client(api_key="k", base_url=backend.url, execution=execution)
+
+    res = getattr(client.physics, method)(**kwargs)
+
+    _assert_matches(res.data, recorded)
+    assert res.success is True
+    assert res.cost == 0.0
+    assert res.request_id.startswith("local-")
+    assert backend.requests == []
+
+
+def test_remote_is_the_default(backend):
+    client = Client(api_key="k", base_url=backend.url)
+
+    res = client.physics.force(mass=2, acceleration=3)
+
+    assert client.physics.execution == "remote"
+    assert res.request_id.startswith("req-")
+    assert len(backend.requests) == 1
+
+
+def test_invalid_input_raises_locally_and_falls_back_in_auto(backend):
+    local = Client(api_key="k", base_url=backend.url, execution="local")
+    auto = Client(api_key="k", base_url=backend.url, execution="auto")
+
+    with pytest.raises(ValueError, match="box_a is missing key 'x'"):
+        local.physics.collision(box_a={}, box_b={})
+    assert backend.requests == []
+
+    res = auto.physics.collision(box_a={}, box_b={})
+    assert res.request_id.startswith("req-")
+    assert backend.requests[0][1] == "/api/v1/physics/collision"
+
+
+def test_endpoints_without_recorded_parity_stay_remote(backend):
+    client = Client(api_key="k", base_url=backend.url, execution="local")
+    sphere = {"x": 0, "y": 0, "z": 0, "radius": 1}
+    box = {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1}
+
+    client.physics.mass(volume=2, density=3)
+    client.physics.stability(base_width=1, center_of_mass_height=1)
+    client.physics.collision_sphere(sphere_a=sphere, sphere_b=sphere)
+    client.physics.collision_obb(box_a=box, box_b=box)
+    client.physics.leverage(arm_length=1, angle_degrees=30, load_mass=1, pivot_torque_limit=10)
+    client.physics.grip_requirement(load_mass=1)
+    client.physics.stability_composite(shapes=[])
+
+    assert [request[1] for request in backend.requests] == [
+        "/api/v1/physics/mass",
+        "/api/v1/physics/stability",
+        "/api/v1/physics/collision/sphere",
+        "/api/v1/physics/collision/obb",
+        "/api/v1/physics/leverage",
+        "/api/v1/physics/grip-requirement",
+        "/api/v1/physics/stability/composite",
+    ]
+
+
+def test_unknown_fields_are_rejected():
+    sphere = {"x": 0, "y": 0, "z": 0, "radius": 1}
+    box = {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1}
+
+    with pytest.raises(ValueError, match="box_b has unknown key"):
+        physics.collision(box, dict(box, rotation={"z": 45}))
+    with pytest.raises(ValueError, match="sphere_a has unknown key"):
+        physics.collision_sphere({"x": 0, "y": 0, "z": 0, "r": 1}, sphere)
+    with pytest.raises(ValueError, match="box_b has unknown key"):
+        physics.collision_obb(box, dict(box, rotaton={"z": 45}))
+    with pytest.raises(ValueError, match="rotation has unknown key"):
+        physics.collision_obb(dict(box, rotation={"yaw": 45}), box)
+
+
+def test_invalid_execution_mode():
+    with pytest.raises(ValueError, match="execution"):
+        Client(api_key="k", execution="edge")
+
+
+def test_obb_matches_aabb_without_rotation():
+    a = {"x": 0, "y": 0, "z": 0, "w": 2, "h": 2, "d": 2}
+    b = {"x": 1.5, "y": 0.5, "z": 0, "w": 2, "h": 2, "d": 2}
+
+    obb = physics.collision_obb(a, b)
+    aabb = physics.collision(a, b)
+
+    assert obb["colliding"] is aabb["colliding"] is True
+    assert obb["min_translation_vector"]["depth"] == pytest.approx(0.5)
+    assert obb["min_translation_vector"]["axis"] == pytest.approx({"x": 1.0, "y": 0.0, "z": 0.0})
+
+
+def test_obb_rotation_separates_corner_gap():
+    # Rotated 45° about z, the second cube's bounding box overlaps the
+    # first cube, but its face along the diagonal leaves a gap.
+    a = {"x": 0, "y": 0, "z": 0, "w": 1, "h": 1, "d": 1}
+    b = {"x": 1.1, "y": 1.1, "z": 0, "w": 1, "h": 1, "d": 1, "rotation": {"z": 45}}
+
+    assert physics.collision_obb(a, b)["colliding"] is False
+
+    b["x"] = b["y"] = 0.6
+    assert physics.collision_obb(a, b)["colliding"] is True
+
+
+def test_sphere_collision():
+    res = physics.collision_sphere(
+        {"x": 0, "y": 0, "z": 0, "radius": 1},
+        {"x": 1.5, "y": 0, "z": 0, "radius": 1},
+    )
+
+    assert res["colliding"] is True
+    assert res["penetration_depth"] == pytest.approx(0.5)
+    assert res["contact_normal"] == {"x": 1.0, "y": 0.0, "z": 0.0}
+
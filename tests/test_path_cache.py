@@ -0,0 +1,182 @@
+# tests/test_path_cache.py
+import asyncio
+import random
+from collections import deque
+from itertools import pairwise
+
+import pytest
+
+from praxis import AsyncClient, Client, OccupancyGrid
+from praxis.core.path_cache import PathCache
+
+GRID = [
+    [0, 0, 0, 1, 0, 0, 0, 0],
+    [0, 1, 0, 1, 0, 1, 1, 0],
+    [0, 1, 0, 0, 0, 0, 0, 0],
+    [0, 1, 1, 1, 1, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0, 1, 0],
+    [1, 1, 1, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 1, 0, 1, 0],
+    [0, 1, 1, 0, 0, 0, 0, 0],
+]
+
+
+def _bfs(grid, start, goal):
+    rows, cols = len(grid), len(grid[0])
+    if grid[start[0]][start[1]] or grid[goal[0]][goal[1]]:
+        return []
+    parent = {tuple(start): None}
+    queue = deque([tuple(start)])
+    while queue:
+        cell = queue.popleft()
+        if cell == tuple(goal):
+            path = []
+            while cell is not None:
+                path.append(list(cell))
+                cell = parent[cell]
+            return path[::-1]
+        r, c = cell
+        for n in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= n[0] < rows and 0 <= n[1] < cols and not grid[n[0]][n[1]] and n not in parent:
+                parent[n] = cell
+                queue.append(n)
+    return []
+
+
+def _valid(grid, path, start, goal):
+    return (
+        tuple(path[0]) == tuple(start)
+        and tuple(path[-1]) == tuple(goal)
+        and all(
+            abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and not grid[b[0]][b[1]]
+            for a, b in pairwise(path)
+        )
+    )
+
+
+@pytest.fixture
+def client(backend):
+    def plan(body):
+        path = _bfs(body["grid"], body["start"], body["goal"])
+        result = {"reachable": bool(path), "steps": max(0, len(path) - 1), "path": path}
+        return 200, backend.envelope({"result": result})
+
+    backend.handlers["/api/v1/simulate/navigation"] = plan
+    return Client(api_key="k", base_url=backend.url, path_cache=True)
+
+
+def test_sub_paths_are_sliced_from_cached_path(client, backend):
+    full = client.navigation.plan(grid=GRID, start=(0, 0), goal=(7, 7))
+    path = full.data["result"]["path"]
+    a, b = path[3], path[9]
+
+    to_goal = client.navigation.plan(grid=GRID, start=a, goal=(7, 7))
+    middle = client.navigation.plan(grid=GRID, start=a, goal=b)
+    backwards = client.navigation.plan(grid=GRID, start=b, goal=a)
+
+    assert len(backend.requests) == 1
+    assert to_goal.data["result"]["path"] == path[3:]
+    assert middle.data["result"]["path"] == path[3:10]
+    assert backwards.data["result"]["path"] == path[3:10][::-1]
+    assert middle.data["result"]["steps"] == 6
+    assert middle.cost == 0.0 and middle.request_id.startswith("local-")
+    stats = client.path_cache.stats
+    assert (stats.hits, stats.misses, stats.tree_hits) == (3, 1, 1)
+    assert stats.hit_rate == pytest.approx(0.75)
+
+
+def test_goal_tree_serves_starts_on_any_path_to_the_goal(client, backend):
+    first = client.navigation.plan(grid=GRID, start=(0, 0), goal=(7, 7)).data["result"]["path"]
+    second = client.navigation.plan(grid=GRID, start=(7, 0), goal=(7, 7)).data["result"]["path"]
+
+    for start in first + second:
+        res = client.navigation.plan(grid=GRID, start=start, goal=(7, 7))
+        path = res.data["result"]["path"]
+        assert _valid(GRID, path, start, (7, 7))
+        assert len(path) == len(_bfs(GRID, start, (7, 7)))
+
+    assert len(backend.requests) == 2
+
+
+def test_random_queries_match_fresh_plans(client, backend):
+    rng = random.Random(5)
+    free = [(r, c) for r in range(8) for c in range(8) if not GRID[r][c]]
+
+    for _ in range(150):
+        start, goal = rng.choice(free), rng.choice(free)
+        path = client.navigation.plan(grid=GRID, start=start, goal=goal).data["result"]["path"]
+        assert _valid(GRID, path, start, goal)
+        assert len(path) == len(_bfs(GRID, start, goal))
+
+    assert len(backend.requests) < 150
+    assert client.path_cache.stats.hits + len(backend.requests) == 150
+
+
+def test_unreachable_pairs_are_remembered(client, backend):
+    grid = [row[:] for row in GRID]
+    grid[6][7] = grid[7][6] = 1
+
+    for _ in range(2):
+        res = client.simulation.navigate(grid=grid, start=(0, 0), goal=(7, 7))
+        assert res.data["result"]["reachable"] is False
+
+    assert len(backend.requests) == 1
+
+
+def test_blocking_cells_keeps_paths_that_avoid_them(client, backend):
+    path = client.navigation.plan(grid=GRID, start=(0, 0), goal=(7, 7)).data["result"]["path"]
+    off_path = next(
+        (r, c) for r in range(8) for c in range(8)
+        if not GRID[r][c] and [r, c] not in path
+    )
+
+    blocked = [row[:] for row in GRID]
+    blocked[off_path[0]][off_path[1]] = 1
+    client.navigation.plan(grid=blocked, start=path[2], goal=(7, 7))
+    assert len(backend.requests) == 1
+    assert client.path_cache.stats.carried == 1
+
+    on_path = [row[:] for row in blocked]
+    on_path[path[5][0]][path[5][1]] = 1
+    client.navigation.plan(grid=on_path, start=path[2], goal=(7, 7))
+    assert len(backend.requests) == 2
+    assert client.path_cache.stats.invalidated == 1
+
+    freed = [row[:] for row in GRID]
+    freed[1][1] = 0
+    client.navigation.plan(grid=freed, start=(0, 0), goal=(7, 7))
+    client.navigation.plan(grid=freed, start=path[2], goal=(7, 7))
+    assert len(backend.requests) == 3  # nothing carried over to `freed`, then sliced
+
+
+def test_cache_bounds():
+    cache = PathCache(max_grids=2, max_paths=1)
+    grids = [OccupancyGrid(4, 4) for _ in range(3)]
+    for i, grid in enumerate(grids):
+        grid[3, i] = 1
+
+    for grid in grids:
+        cache._entry(grid)
+
+    assert cache.stats.grids == 2
+    with pytest.raises(ValueError):
+        PathCache(max_paths=0)
+
+
+def test_async_client_stores_awaited_paths(backend):
+    pytest.importorskip("httpx")
+
+    backend.handlers["/api/v1/simulate/navigation"] = lambda body: (
+        200,
+        backend.envelope({"result": {"reachable": True, "steps": 2, "path": [[0, 0], [0, 1], [0, 2]]}}),
+    )
+
+    async def main():
+        async with AsyncClient(api_key="k", base_url=backend.url, path_cache=True) as client:
+            await client.navigation.plan(grid=GRID, start=(0, 0), goal=(0, 2))
+            return await client.navigation.plan(grid=GRID, start=(0, 1), goal=(0, 2))
+
+    res = asyncio.run(main())
+
+    assert res.data["result"]["path"] == [[0, 1], [0, 2]]
+    assert len(backend.requests) == 1
@@ -0,0 +1,79 @@
+# tests/test_ratelimit.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from praxis import Client
+from praxis.core.ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+from praxis.core.retries import RetryPolicy
+from praxis.exceptions import APIError
+
+
+def test_token_bucket_spaces_out_callers():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+def test_burst_must_allow_one_request():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0.5)
+    with pytest.raises(ValueError):
+        RateLimiter()
+
+
+def test_file_buckets_share_one_quota(tmp_path):
+    path = tmp_path / "quota.bucket"
+    # Separate instances open separate descriptors, like separate processes.
+    a = FileTokenBucket(path, rate=10, burst=2)
+    b = FileTokenBucket(path, rate=10, burst=2)
+
+    waits = [a.reserve(), b.reserve(), a.reserve(), b.reserve()]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.1, 0.2], abs=0.01)
+
+
+def test_client_throughput_is_smoothed_to_the_quota(backend):
+    limiter = RateLimiter(rate=50, burst=1)
+    client = Client(api_key="k", base_url=backend.url, rate_limit=limiter)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: client.physics.force(mass=i, acceleration=1), range(11)))
+    elapsed = time.monotonic() - start
+
+    # 1 immediate + 10 paced at 20 ms.
+    assert elapsed >= 0.19
+    assert limiter.stats["delayed"] == 10
+
+
+def test_endpoint_limits_only_apply_to_their_path(backend):
+    limiter = RateLimiter(endpoints={"/api/v1/physics/mass": (5, 1)})
+    client = Client(api_key="k", base_url=backend.url, rate_limit=limiter)
+
+    for i in range(5):
+        client.physics.force(mass=i, acceleration=1)
+    assert limiter.stats["delayed"] == 0
+
+    client.physics.mass(1, 2)
+    assert 0.0 < limiter.delay("/api/v1/physics/mass") <= 0.2
+
+
+def test_429_pauses_the_limiter(backend):
+    backend.handlers["/api/v1/physics/force"] = lambda body: (
+        429,
+        {"error": "rate_limited"},
+    )
+    limiter = RateLimiter(rate=100)
+    retry = RetryPolicy(max_retries=0, budget=None)
+    client = Client(api_key="k", base_url=backend.url, rate_limit=limiter, retry=retry)
+
+    with pytest.raises(APIError):
+        client.physics.force(mass=1, acceleration=1)
+
+    assert 0.9 < limiter.delay("/api/v1/physics/force") <= 1.01
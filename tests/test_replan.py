@@ -0,0 +1,152 @@
+# tests/test_replan.py
+import random
+from collections import deque
+from itertools import pairwise
+
+import pytest
+
+from praxis import Client
+from praxis.compute.dstar import DStarLite
+
+GRID = [
+    [0, 0, 0, 1, 0, 0, 0, 0],
+    [0, 1, 0, 1, 0, 1, 1, 0],
+    [0, 1, 0, 0, 0, 0, 0, 0],
+    [0, 1, 1, 1, 1, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0, 1, 0],
+    [1, 1, 1, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 1, 0, 1, 0],
+    [0, 1, 1, 0, 0, 0, 0, 0],
+]
+
+
+def _bfs(grid, start, goal):
+    rows, cols = len(grid), len(grid[0])
+    if grid[start[0]][start[1]] or grid[goal[0]][goal[1]]:
+        return []
+    parent = {tuple(start): None}
+    queue = deque([tuple(start)])
+    while queue:
+        cell = queue.popleft()
+        if cell == tuple(goal):
+            path = []
+            while cell is not None:
+                path.append(list(cell))
+                cell = parent[cell]
+            return path[::-1]
+        r, c = cell
+        for n in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= n[0] < rows and 0 <= n[1] < cols and not grid[n[0]][n[1]] and n not in parent:
+                parent[n] = cell
+                queue.append(n)
+    return []
+
+
+@pytest.fixture
+def nav_backend(backend):
+    def plan(body):
+        path = _bfs(body["grid"], body["start"], body["goal"])
+        result = {"reachable": bool(path), "steps": max(0, len(path) - 1), "path": path}
+        return 200, backend.envelope({"result": result})
+
+    backend.handlers["/api/v1/simulate/navigation"] = plan
+    return backend
+
+
+def _valid(grid, path):
+    return all(
+        abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and not grid[b[0]][b[1]]
+        for a, b in pairwise(path)
+    )
+
+
+def test_path_is_reused_while_grid_is_unchanged(nav_backend):
+    client = Client(api_key="k", base_url=nav_backend.url)
+    planner = client.navigation.planner(GRID, goal=(7, 7))
+
+    position = (0, 0)
+    while position != (7, 7):
+        position = planner.next_step(position)
+
+    assert len(nav_backend.requests) == 1
+    assert planner.stats["remote"] == 1
+    assert planner.stats["reused"] == len(_bfs(GRID, (0, 0), (7, 7))) - 2
+
+
+def test_grid_changes_are_repaired_locally(nav_backend):
+    client = Client(api_key="k", base_url=nav_backend.url)
+    planner = client.navigation.planner(GRID, goal=(7, 7))
+    path = planner.plan((0, 0))
+
+    blocked = path[len(path) // 2]
+    planner.update({blocked: 1})
+    repaired = planner.plan((0, 0))
+
+    grid = [row[:] for row in GRID]
+    grid[blocked[0]][blocked[1]] = 1
+    assert blocked not in repaired
+    assert _valid(grid, repaired)
+    assert len(repaired) == len(_bfs(grid, (0, 0), (7, 7)))
+    assert planner.stats["local"] == 1
+    assert len(nav_backend.requests) == 1
+
+
+def test_blocking_cells_off_the_path_keeps_it(nav_backend):
+    client = Client(api_key="k", base_url=nav_backend.url)
+    planner = client.navigation.planner(GRID, goal=(7, 7))
+    path = planner.plan((0, 0))
+
+    off_path = next(
+        (r, c) for r in range(8) for c in range(8)
+        if not GRID[r][c] and (r, c) not in path
+    )
+    planner.update({off_path: 1})
+
+    assert planner.plan((0, 0)) == path
+    assert planner.stats == {"reused": 1, "local": 0, "remote": 1, "fallbacks": 0}
+
+
+def test_budget_overrun_falls_back_to_remote(nav_backend):
+    client = Client(api_key="k", base_url=nav_backend.url)
+    planner = client.navigation.planner(GRID, goal=(7, 7), max_expansions=3)
+    planner.plan((0, 0))
+
+    planner.update({(2, 2): 0, (0, 3): 0})
+    path = planner.plan((0, 0))
+
+    assert planner.stats["fallbacks"] == 1
+    assert planner.stats["remote"] == 2
+    assert len(path) == len(_bfs(planner.grid, (0, 0), (7, 7)))
+
+
+def test_local_execution_never_calls_the_server(nav_backend):
+    client = Client(api_key="k", base_url=nav_backend.url, execution="local")
+    planner = client.navigation.planner(GRID, goal=(7, 7))
+
+    assert len(planner.plan((0, 0))) == len(_bfs(GRID, (0, 0), (7, 7)))
+    planner.set_grid([[0] * 8] + GRID[1:])
+    path = planner.plan((0, 0))
+    assert len(path) == len(_bfs(planner.grid, (0, 0), (7, 7)))
+    assert planner.stats["local"] == 2
+    assert nav_backend.requests == []
+
+
+def test_dstar_matches_bfs_under_random_changes():
+    rng = random.Random(0)
+    for _ in range(50):
+        rows, cols = rng.randint(2, 12), rng.randint(2, 12)
+        grid = [[int(rng.random() < 0.25) for _ in range(cols)] for _ in range(rows)]
+        goal = (rng.randrange(rows), rng.randrange(cols))
+        start = (rng.randrange(rows), rng.randrange(cols))
+        search = DStarLite(grid, goal)
+
+        for _ in range(6):
+            path = search.path(start)
+            assert len(path) == len(_bfs(search.grid, start, goal))
+            assert _valid(search.grid, path)
+            if path:
+                start = path[min(len(path) - 1, rng.randint(0, 3))]
+            search.set_cells({
+                (rng.randrange(rows), rng.randrange(cols)): int(rng.random() < 0.5)
+                for _ in range(rng.randint(0, 4))
+            })
@@ -0,0 +1,123 @@
+# tests/test_resilience.py
+import asyncio
+import threading
+import time
+
+import pytest
+
+from praxis import Client
+from praxis.core.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, HedgePolicy
+from praxis.core.retries import RetryPolicy
+from praxis.exceptions import APIError, CircuitOpenError, ValidationError
+
+NO_RETRY = RetryPolicy(max_retries=0, budget=None)
+
+
+def test_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, open_for=0.05)
+    path = "/api/v1/vision/analyze"
+
+    for _ in range(4):
+        breaker.before(path)
+        breaker.record(path, APIError("boom", status_code=503))
+
+    assert breaker.state(path) == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before(path)
+
+    time.sleep(0.06)
+    breaker.before(path)
+    assert breaker.state(path) == HALF_OPEN
+
+    # Only one probe at a time while half-open.
+    with pytest.raises(CircuitOpenError):
+        breaker.before(path)
+
+    breaker.record(path)
+    assert breaker.state(path) == CLOSED
+
+
+def test_client_errors_do_not_trip_breaker():
+    breaker = CircuitBreaker(window=4, min_calls=4)
+    path = "/api/v1/physics/force"
+
+    for _ in range(10):
+        breaker.before(path)
+        breaker.record(path, ValidationError("bad input"))
+        breaker.record(path, APIError("bad request", status_code=400))
+
+    assert breaker.state(path) == CLOSED
+
+
+def test_open_circuit_fails_fast(backend):
+    backend.handlers["/api/v1/physics/collision/obb"] = lambda body: (
+        503,
+        {"error": "unavailable", "message": "down"},
+    )
+    breaker = CircuitBreaker(window=3, min_calls=3, open_for=60)
+
+    with Client(
+        api_key="praxis-demo-key",
+        base_url=backend.url,
+        retry=NO_RETRY,
+        circuit_breaker=breaker,
+    ) as client:
+        for _ in range(3):
+            with pytest.raises(APIError):
+                client.physics.collision_obb(box_a={}, box_b={})
+
+        with pytest.raises(CircuitOpenError):
+            client.physics.collision_obb(box_a={}, box_b={})
+
+    assert len(backend.requests) == 3
+
+
+def _first_call_slow(backend, delay):
+    lock = threading.Lock()
+    calls = {"n": 0}
+
+    def handler(body):
+        with lock:
+            calls["n"] += 1
+            n = calls["n"]
+        if n == 1:
+            time.sleep(delay)
+        return 200, backend.envelope({"call": n})
+
+    return handler
+
+
+def test_hedged_request_wins_over_slow_replica(backend):
+    backend.handlers["/api/v1/vision/analyze"] = _first_call_slow(backend, 1.0)
+    hedge = HedgePolicy(min_samples=1, min_delay=0.05)
+    hedge.observe("/api/v1/vision/analyze", 0.01)
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, hedging=hedge) as client:
+        start = time.monotonic()
+        res = client.vision.analyze(image="frame")
+        elapsed = time.monotonic() - start
+
+    assert res.data == {"call": 2}
+    assert elapsed < 0.9
+    assert hedge.stats.hedged == 1
+    assert hedge.stats.hedge_wins == 1
+
+
+def test_async_hedged_request_cancels_loser(backend):
+    pytest.importorskip("httpx")
+    from praxis import AsyncClient
+
+    backend.handlers["/api/v1/vision/analyze"] = _first_call_slow(backend, 1.0)
+    hedge = HedgePolicy(min_samples=1, min_delay=0.05)
+    hedge.observe("/api/v1/vision/analyze", 0.01)
+
+    async def main():
+        async with AsyncClient(
+            api_key="praxis-demo-key", base_url=backend.url, hedging=hedge
+        ) as client:
+            return await client.vision.analyze(image="frame")
+
+    res = asyncio.run(main())
+
+    assert res.data == {"call": 2}
+    assert hedge.stats.hedge_wins == 1
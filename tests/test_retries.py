@@ -0,0 +1,101 @@
+# tests/test_retries.py
+import asyncio
+
+import pytest
+
+from praxis import Client
+from praxis.core.retries import RetryBudget, RetryPolicy, parse_retry_after
+from praxis.exceptions import APIError
+
+
+def _flaky(backend, failures, status=503):
+    calls = {"n": 0}
+
+    def handler(body):
+        calls["n"] += 1
+        if calls["n"] <= failures:
+            return status, {"error": "unavailable", "message": "try later"}
+        return 200, backend.envelope(body)
+
+    return handler
+
+
+def test_transient_errors_are_retried(backend):
+    backend.handlers["/api/v1/physics/force"] = _flaky(backend, failures=2)
+    policy = RetryPolicy(max_retries=2, backoff=0.01, budget=None)
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, retry=policy) as client:
+        res = client.physics.force(mass=1, acceleration=1)
+
+    assert res.success is True
+    assert len(backend.requests) == 3
+
+
+def test_client_errors_are_not_retried(backend):
+    backend.handlers["/api/v1/physics/force"] = _flaky(backend, failures=5, status=400)
+    policy = RetryPolicy(max_retries=3, backoff=0.01, budget=None)
+
+    with Client(api_key="praxis-demo-key", base_url=backend.url, retry=policy) as client:
+        with pytest.raises(APIError) as info:
+            client.physics.force(mass=1, acceleration=1)
+
+    assert info.value.status_code == 400
+    assert len(backend.requests) == 1
+
+
+def test_retry_after_is_honored():
+    policy = RetryPolicy(backoff=10.0, max_retry_after=2.0)
+
+    assert policy.delay(0, APIError("slow down", status_code=429, retry_after=1.5)) == 1.5
+    assert policy.delay(0, APIError("slow down", status_code=429, retry_after=60)) == 2.0
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff=0.5, max_backoff=3.0, jitter=False)
+
+    assert [policy.delay(i) for i in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_balance=1.0)
+    policy = RetryPolicy(max_retries=5, backoff=0.0, budget=budget)
+    attempts = []
+
+    def fail():
+        attempts.append(1)
+        raise APIError("down", status_code=503)
+
+    with pytest.raises(APIError):
+        policy.call(fail)
+
+    # One token: the first call and a single retry.
+    assert len(attempts) == 2
+    assert budget.rejected == 1
+
+
+def test_async_retry_does_not_block_loop():
+    policy = RetryPolicy(max_retries=1, backoff=0.05, jitter=False, budget=None)
+    ticks = []
+    calls = []
+
+    async def fail_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise APIError("down")
+        return "ok"
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        return await asyncio.gather(policy.call_async(fail_once), ticker())
+
+    result, _ = asyncio.run(main())
+
+    assert result == "ok"
+    assert len(ticks) == 3
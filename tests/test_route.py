@@ -0,0 +1,158 @@
+# tests/test_route.py
+import asyncio
+import itertools
+import math
+import random
+from collections import deque
+
+import pytest
+
+from praxis import AsyncClient, Client
+from praxis.compute import route
+from praxis.compute.route import RoutePlanner
+
+
+def _steps(grid, start, goal):
+    rows, cols = len(grid), len(grid[0])
+    if grid[start[0]][start[1]] or grid[goal[0]][goal[1]]:
+        return math.inf
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        if cell == goal:
+            return dist[cell]
+        r, c = cell
+        for n in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= n[0] < rows and 0 <= n[1] < cols and not grid[n[0]][n[1]] and n not in dist:
+                dist[n] = dist[cell] + 1
+                queue.append(n)
+    return math.inf
+
+
+def _check_route(grid, waypoints, result):
+    path = result["path"]
+    assert path[0] == list(waypoints[0])
+    assert all(
+        abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and not grid[b[0]][b[1]]
+        for a, b in itertools.pairwise(path)
+    )
+    assert result["steps"] == sum(result["legs"]) == len(path) - 1
+
+    position = 0
+    for k, steps in zip(result["order"][1:], result["legs"], strict=True):
+        position += steps
+        assert path[position] == list(waypoints[k])
+
+
+@pytest.mark.parametrize("bitset_cells", [route._BITSET_CELLS, 0])
+def test_distances_and_routes_match_bfs(monkeypatch, bitset_cells):
+    monkeypatch.setattr(route, "_BITSET_CELLS", bitset_cells)
+    rng = random.Random(2)
+    planner = RoutePlanner()
+
+    for _ in range(20):
+        rows, cols = rng.randint(1, 40), rng.randint(1, 90)
+        grid = [[1 if rng.random() < 0.25 else 0 for _ in range(cols)] for _ in range(rows)]
+        waypoints = [(rng.randrange(rows), rng.randrange(cols)) for _ in range(rng.randint(1, 6))]
+
+        matrix = planner.distances(grid, waypoints)
+        assert matrix == [[_steps(grid, a, b) for b in waypoints] for a in waypoints]
+
+        for order in route.ORDERS:
+            result = planner.plan(grid, waypoints, order=order)
+            if result["reachable"]:
+                _check_route(grid, waypoints, result)
+
+
+def test_optimize_finds_the_shortest_visiting_order():
+    rng = random.Random(5)
+    grid = [[1 if rng.random() < 0.2 else 0 for _ in range(30)] for _ in range(30)]
+    free = [(r, c) for r in range(30) for c in range(30) if not grid[r][c]]
+    waypoints = rng.sample(free, 7)
+    planner = RoutePlanner()
+
+    result = planner.plan(grid, waypoints, order="optimize")
+
+    matrix = planner.distances(grid, waypoints)
+    best = min(
+        sum(matrix[a][b] for a, b in itertools.pairwise((0,) + rest))
+        for rest in itertools.permutations(range(1, 7))
+    )
+    if result["reachable"]:
+        _check_route(grid, waypoints, result)
+        assert result["steps"] == best
+        assert result["order"][0] == 0
+
+
+def test_heuristic_order_for_many_waypoints():
+    grid = [[0] * 40 for _ in range(40)]
+    rng = random.Random(8)
+    waypoints = [(0, 0)] + [(rng.randrange(40), rng.randrange(40)) for _ in range(20)]
+
+    given = RoutePlanner().plan(grid, waypoints)
+    optimized = RoutePlanner().plan(grid, waypoints, order="optimize")
+
+    _check_route(grid, waypoints, optimized)
+    assert sorted(optimized["order"]) == list(range(21))
+    assert optimized["steps"] <= given["steps"]
+
+
+def test_distance_matrix_is_cached_per_grid():
+    grid = [[0] * 20 for _ in range(20)]
+    planner = RoutePlanner()
+
+    planner.plan(grid, [(0, 0), (5, 5), (19, 19)], order="optimize")
+    assert planner.searches == 2  # the last waypoint is known to both others
+
+    planner.plan(grid, [(19, 19), (5, 5), (0, 0)])
+    assert planner.searches == 2
+
+    planner.plan(grid, [(0, 0), (10, 3)])
+    assert planner.searches == 3
+
+    grid[0][1] = 1
+    planner.plan(grid, [(0, 0), (10, 3)])
+    assert planner.searches == 4
+
+
+def test_unreachable_and_invalid_waypoints():
+    grid = [[0, 1, 0], [0, 1, 0], [0, 1, 0]]
+    planner = RoutePlanner()
+
+    result = planner.plan(grid, [(0, 0), (2, 0), (0, 2)])
+    assert result["reachable"] is False
+    assert result["path"] == []
+    assert planner.plan(grid, [(1, 0)])["path"] == [[1, 0]]
+
+    with pytest.raises(ValueError, match="outside"):
+        planner.plan(grid, [(0, 0), (3, 0)])
+    with pytest.raises(ValueError, match="order"):
+        planner.plan(grid, [(0, 0)], order="fastest")
+    with pytest.raises(ValueError):
+        planner.plan(grid, [])
+
+
+def test_plan_route_is_local(backend):
+    grid = [[0] * 8 for _ in range(8)]
+    client = Client(api_key="k", base_url=backend.url)
+
+    res = client.navigation.plan_route(grid, [(0, 0), (7, 7), (0, 7)], order="optimize")
+
+    assert res.cost == 0
+    assert res.request_id.startswith("local-")
+    assert res.data["result"]["order"] == [0, 2, 1]
+    assert res.data["result"]["steps"] == 14
+    assert backend.requests == []
+
+
+def test_plan_route_async(backend):
+    pytest.importorskip("httpx")
+
+    async def main():
+        async with AsyncClient(api_key="k", base_url=backend.url) as client:
+            return await client.navigation.plan_route([[0, 0], [0, 0]], [(0, 0), (1, 1)])
+
+    res = asyncio.run(main())
+
+    assert res.data["result"]["steps"] == 2
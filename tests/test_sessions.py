@@ -1,5 +1,8 @@
 # tests/test_sessions.py
+import pytest
+
 from praxis import Client
+from praxis.exceptions import ValidationError
 
 
 def test_session_context():
@@ -13,3 +16,37 @@ def test_session_context():
         assert r2.success is True
         assert r1.cost > 0
         assert r2.cost > 0
+
+
+def test_batch_session_defers_calls(backend):
+    client = Client(api_key="praxis-demo-key", base_url=backend.url)
+
+    with client.session(batch=True, max_concurrency=4) as session:
+        handles = [session.physics.force(mass=i, acceleration=2) for i in range(20)]
+        assert session.pending == 20
+        assert backend.requests == []
+
+    assert session.pending == 0
+    assert [h.result().data["mass"] for h in handles] == list(range(20))
+    client.close()
+
+
+def test_batch_session_captures_errors_per_call(backend):
+    client = Client(api_key="praxis-demo-key", base_url=backend.url)
+    backend.handlers["/api/v1/physics/mass"] = lambda body: (
+        422,
+        {"error": "validation_error", "message": "bad volume"},
+    )
+
+    session = client.session(batch=True)
+    ok = session.physics.force(mass=1, acceleration=1)
+    bad = session.physics.mass(volume=-1, density=1)
+
+    with pytest.raises(ValueError):
+        ok.result()
+
+    session.flush()
+
+    assert ok.result().success is True
+    assert isinstance(bad.exception(), ValidationError)
+    client.close()
@@ -0,0 +1,156 @@
+# tests/test_spline.py
+import math
+import random
+from itertools import pairwise
+
+import pytest
+
+from praxis import Client
+from praxis.compute import spline
+
+
+@pytest.fixture(params=["numpy", "python"])
+def impl(request, monkeypatch):
+    if request.param == "numpy":
+        if spline.np is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(spline, "np", None)
+    return request.param
+
+
+def _reference(path, density):
+    # Straightforward per-point Catmull-Rom, as the server computes it.
+    pts = [path[0]] + list(path) + [path[-1]]
+    out = []
+    for i in range(1, len(pts) - 2):
+        p0, p1, p2, p3 = pts[i - 1], pts[i], pts[i + 1], pts[i + 2]
+        for j in range(density):
+            t = j / density
+            out.append([
+                0.5 * (
+                    2 * p1[k]
+                    + (-p0[k] + p2[k]) * t
+                    + (2 * p0[k] - 5 * p1[k] + 4 * p2[k] - p3[k]) * t * t
+                    + (-p0[k] + 3 * p1[k] - 3 * p2[k] + p3[k]) * t ** 3
+                )
+                for k in range(2)
+            ])
+    out.append(list(path[-1]))
+    return out
+
+
+def _close(a, b, tol=1e-9):
+    return len(a) == len(b) and all(
+        len(p) == len(q) and all(abs(x - y) <= tol for x, y in zip(p, q, strict=True))
+        for p, q in zip(a, b, strict=True)
+    )
+
+
+def _random_path(rng, n):
+    return [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(n)]
+
+
+def test_matches_reference_within_tolerance(impl):
+    rng = random.Random(3)
+    for _ in range(20):
+        path = _random_path(rng, rng.randint(2, 15))
+        density = rng.randint(1, 8)
+
+        smoothed = spline.catmull_rom(path, density)
+        expected = _reference(path, density)
+
+        assert len(smoothed) == (len(path) - 1) * density + 1
+        assert _close(smoothed, expected)
+
+
+def test_batch_matches_single_paths(impl):
+    rng = random.Random(4)
+    paths = [_random_path(rng, n) for n in (0, 1, 2, 7, 12)]
+
+    batch = spline.catmull_rom_batch(paths, 4)
+
+    assert batch[0] == [] and batch[1] == [list(paths[1][0])]
+    for path, smoothed in zip(paths[2:], batch[2:], strict=True):
+        assert _close(smoothed, spline.catmull_rom(path, 4))
+
+
+def test_adaptive_density_stays_within_tolerance(impl):
+    rng = random.Random(5)
+    path = [(x, 0.0) for x in range(10)] + _random_path(rng, 10)
+    tolerance = 0.05
+
+    adaptive = spline.catmull_rom(path, 32, tolerance)
+    dense = spline.catmull_rom(path, 256)
+
+    assert len(adaptive) < len(spline.catmull_rom(path, 32)) / 2
+    # Every point of the finely sampled curve is near the adaptive polyline.
+    for p in dense[::7]:
+        nearest = min(_segment_distance(p, a, b) for a, b in pairwise(adaptive))
+        assert nearest <= tolerance + 1e-9
+
+
+def _segment_distance(p, a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length = dx * dx + dy * dy
+    t = 0.0 if not length else max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length))
+    return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
+
+
+def test_arrays_in_arrays_out():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    batch = rng.uniform(0, 10, size=(6, 9, 2))
+
+    out = spline.catmull_rom_batch(batch, 5)
+    single = spline.catmull_rom(batch[2], 5)
+
+    assert out.shape == (6, 8 * 5 + 1, 2)
+    assert isinstance(single, np.ndarray)
+    assert np.allclose(out[2], single)
+    assert isinstance(spline.catmull_rom_batch(batch, 5, tolerance=0.1), list)
+
+
+def test_invalid_input(impl):
+    with pytest.raises(ValueError, match="density"):
+        spline.catmull_rom([(0, 0), (1, 1)], 0)
+    with pytest.raises(ValueError, match="tolerance"):
+        spline.catmull_rom([(0, 0), (1, 1)], 5, tolerance=0)
+    with pytest.raises(ValueError):
+        spline.catmull_rom([(0, 0), (1, 1, 2)], 5)
+    with pytest.raises(ValueError):
+        spline.catmull_rom([(0, "a"), (1, 1)], 5)
+
+
+def test_smooth_path_runs_locally_when_requested(backend):
+    remote = Client(api_key="k", base_url=backend.url)
+    local = Client(api_key="k", base_url=backend.url, execution="local")
+    backend.handlers["/api/v1/simulate/navigation/smooth"] = lambda body: (
+        200,
+        backend.envelope(_reference(body["path"], body["density"])),
+    )
+    path = [(0, 0), (1, 1), (2, 0), (3, 1)]
+
+    res = local.navigation.smooth_path(path, density=3)
+    assert res.request_id.startswith("local-") and res.cost == 0
+    assert backend.requests == []
+
+    server = remote.navigation.smooth_path(path, density=3)
+    assert len(backend.requests) == 1
+    assert _close(res.data, server.data)
+
+    adaptive = remote.navigation.smooth_path(path, density=3, tolerance=0.5)
+    assert adaptive.request_id.startswith("local-")
+    assert len(backend.requests) == 1
+
+
+def test_smooth_paths_batch(backend):
+    client = Client(api_key="k", base_url=backend.url)
+
+    res = client.navigation.smooth_paths([[(0, 0), (1, 0)], [(0, 0), (0, 2), (2, 2)]], density=2)
+
+    assert res.data == [
+        [[0.0, 0.0], [0.5, 0.0], [1.0, 0.0]],
+        spline.catmull_rom([(0, 0), (0, 2), (2, 2)], 2),
+    ]
+    assert backend.requests == []
@@ -0,0 +1,147 @@
+# tests/test_tracing.py
+import json
+import time
+
+from praxis import Client
+from praxis.core.cache import ResultCache
+from praxis.core.tracing import SESSION_LISTENER, CallRecord, SessionTrace
+
+
+def _record(operation, start, end, cost=0.0):
+    return CallRecord(operation, "/p", start, end, 0, 0, 0, cost, None, False, None, 1)
+
+
+def test_session_records_calls(backend):
+    client = Client(api_key="k", base_url=backend.url)
+
+    with client.session() as session:
+        res = session.physics.force(mass=2, acceleration=3)
+        session.navigation.plan([[0, 0], [0, 0]], (0, 0), (1, 1))
+
+    records = session.trace.records
+    assert [r.operation for r in records] == ["physics.force", "navigation.plan"]
+
+    first = records[0]
+    assert first.endpoint == "/api/v1/physics/force"
+    assert first.request_id == res.request_id
+    assert first.cost == res.cost
+    assert first.bytes_out > 0 and first.bytes_in > 0
+    assert first.end > first.start
+
+    # Calls made on the client directly are not part of the session.
+    client.physics.force(mass=1, acceleration=1)
+    assert len(session.trace.records) == 2
+
+
+def test_cached_calls_and_errors_are_recorded(backend):
+    backend.handlers["/api/v1/physics/mass"] = lambda body: (
+        422,
+        {"error": "validation_error", "message": "bad volume"},
+    )
+    client = Client(api_key="k", base_url=backend.url, cache=ResultCache())
+    session = client.session()
+
+    session.physics.force(mass=2, acceleration=3)
+    session.physics.force(mass=2, acceleration=3)
+    try:
+        session.physics.mass(volume=-1, density=1)
+    except Exception:
+        pass
+
+    network, cached, failed = session.trace.records
+    assert network.cached is False and cached.cached is True
+    assert cached.endpoint is None and cached.key == "physics.force"
+    assert failed.error == "ValidationError"
+    assert session.trace.summary().errors == 1
+
+
+def test_batch_flush_calls_are_recorded_concurrently(backend):
+    client = Client(api_key="k", base_url=backend.url)
+
+    with client.session(batch=True, max_concurrency=4) as session:
+        for i in range(8):
+            session.physics.force(mass=i, acceleration=1)
+
+    records = session.trace.records
+    assert len(records) == 8
+    assert all(r.endpoint == "/api/v1/physics/force" for r in records)
+    assert len({r.thread for r in records}) > 1
+
+
+def test_ring_buffer_keeps_latest_calls(backend):
+    client = Client(api_key="k", base_url=backend.url)
+    session = client.session(trace_capacity=3)
+
+    for i in range(5):
+        session.physics.force(mass=i, acceleration=1)
+
+    assert len(session.trace.records) == 3
+    assert session.trace.dropped == 2
+
+
+def test_summary_percentiles_and_critical_path():
+    trace = SessionTrace()
+    # a -> (b || c) -> d : the critical path goes through the longer of b, c.
+    for record in [
+        _record("a", 0.0, 1.0, cost=0.1),
+        _record("b", 1.0, 2.0, cost=0.1),
+        _record("c", 1.0, 4.0, cost=0.1),
+        _record("d", 4.5, 5.0, cost=0.1),
+    ]:
+        trace._records.append(record)
+
+    summary = trace.summary()
+
+    assert summary.calls == 4
+    assert summary.total_cost == 0.4
+    assert summary.wall_time == 5.0
+    assert [r.operation for r in summary.critical_path] == ["a", "c", "d"]
+    assert summary.critical_path_time == 4.5
+
+    endpoint = summary.endpoints["/p"]
+    assert endpoint.calls == 4
+    assert endpoint.p50 == 1.0
+    assert endpoint.p99 == 3.0
+
+
+def test_chrome_trace_export(backend, tmp_path):
+    client = Client(api_key="k", base_url=backend.url)
+    session = client.session()
+    before = time.time() * 1e6
+
+    session.physics.force(mass=2, acceleration=3)
+    session.trace.export_chrome_trace(tmp_path / "trace.json")
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    (event,) = trace["traceEvents"]
+    assert event["ph"] == "X"
+    assert event["name"] == "physics.force"
+    assert event["cat"] == "/api/v1/physics/force"
+    assert event["ts"] >= before
+    assert event["dur"] > 0
+    assert event["args"]["request_id"] == session.trace.records[0].request_id
+
+
+def test_tracing_can_be_disabled(backend):
+    client = Client(api_key="k", base_url=backend.url)
+    session = client.session(trace=False)
+
+    assert session.trace is None
+    assert session.physics is client.physics
+
+
+def test_trace_listener_is_only_attached_while_tracing(backend):
+    client = Client(api_key="k", base_url=backend.url)
+
+    session = client.session()
+    assert SESSION_LISTENER not in client.hooks
+    session.physics.force(mass=2, acceleration=3)
+    assert SESSION_LISTENER not in client.hooks
+    assert session.trace.records[0].endpoint == "/api/v1/physics/force"
+
+    with client.session() as outer, client.session() as inner:
+        assert SESSION_LISTENER in client.hooks
+        inner.physics.force(mass=1, acceleration=1)
+    assert SESSION_LISTENER not in client.hooks
+    assert not client.hooks
+    assert outer.trace.records == []
@@ -0,0 +1,102 @@
+# tests/test_upload.py
+import asyncio
+import base64
+import io
+
+import pytest
+
+from praxis import AsyncClient, Client
+from praxis.core.upload import MultipartBody, open_image
+
+IMAGE = bytes(range(256)) * 4096  # 1 MiB, spans several chunks
+
+
+def _uploaded(backend):
+    _, path, headers, raw = backend.requests[-1]
+    return path, headers, raw
+
+
+def test_multipart_body_is_reiterable_with_known_length(tmp_path):
+    with open_image(IMAGE) as data:
+        body = MultipartBody({"model": "auto"}, "image", data)
+
+        first = b"".join(bytes(chunk) for chunk in body)
+        second = b"".join(bytes(chunk) for chunk in body)
+
+    assert first == second
+    assert len(first) == len(body)
+    assert body.boundary.encode() in first
+
+
+def test_analyze_uploads_raw_bytes(backend):
+    with Client(api_key="k", base_url=backend.url) as client:
+        res = client.vision.analyze(image=IMAGE, min_confidence=0.7)
+
+    path, headers, raw = _uploaded(backend)
+    assert path == "/api/v1/vision/analyze"
+    assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert "Transfer-Encoding" not in headers
+    assert int(headers["Content-Length"]) == len(raw)
+    # No base64 on the wire: the body is barely larger than the image.
+    assert len(raw) < len(IMAGE) + 1024
+
+    assert base64.b64decode(res.data["image"]) == IMAGE
+    assert res.data["min_confidence"] == "0.7"
+
+
+def test_segment_uploads_memory_mapped_file(backend, tmp_path):
+    image = tmp_path / "frame.png"
+    image.write_bytes(IMAGE)
+
+    with Client(api_key="k", base_url=backend.url) as client:
+        from_path = client.vision.segment(image=image)
+        with open(image, "rb") as f:
+            from_file = client.vision.segment(image=f)
+
+    for res in (from_path, from_file):
+        assert base64.b64decode(res.data["image"]) == IMAGE
+        assert res.data["model_tier"] == "nano"
+
+    assert from_path.data["image_filename"] == "frame.png"
+    _, headers, raw = _uploaded(backend)
+    assert b"Content-Type: image/png" in raw
+
+
+def test_detect_accepts_in_memory_files_and_memoryviews(backend):
+    with Client(api_key="k", base_url=backend.url) as client:
+        from_buffer = client.manipulation.detect(image=io.BytesIO(IMAGE))
+        from_view = client.manipulation.detect(image=memoryview(IMAGE)[:100])
+
+    assert base64.b64decode(from_buffer.data["image"]) == IMAGE
+    assert base64.b64decode(from_view.data["image"]) == IMAGE[:100]
+
+
+def test_base64_strings_are_still_sent_as_json(backend):
+    encoded = base64.b64encode(IMAGE[:64]).decode()
+
+    with Client(api_key="k", base_url=backend.url) as client:
+        res = client.vision.analyze(image=encoded)
+
+    _, headers, _ = _uploaded(backend)
+    assert headers["Content-Type"] == "application/json"
+    assert res.data["image"] == encoded
+
+
+def test_unsupported_image_type_is_rejected(backend):
+    with Client(api_key="k", base_url=backend.url) as client:
+        with pytest.raises(TypeError):
+            client.vision.analyze(image=12)
+
+
+def test_async_client_streams_uploads(backend):
+    pytest.importorskip("httpx")
+
+    async def main():
+        async with AsyncClient(api_key="k", base_url=backend.url) as client:
+            return await client.vision.analyze(image=IMAGE)
+
+    res = asyncio.run(main())
+
+    _, headers, _ = _uploaded(backend)
+    assert "Transfer-Encoding" not in headers
+    assert base64.b64decode(res.data["image"]) == IMAGE